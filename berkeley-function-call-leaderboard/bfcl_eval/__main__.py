@@ -1,12 +1,13 @@
 import csv
 from datetime import datetime
+from enum import Enum
 import os
 from types import SimpleNamespace
 from typing import List, Optional
 
 import typer
 from importlib.metadata import version as _version
-from bfcl_eval._llm_response_generation import main as generation_main
+from bfcl_eval._result_store import DURABILITY_POLICIES
 from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING
 from bfcl_eval.constants.eval_config import (
     DOTENV_PATH,
@@ -15,10 +16,13 @@ from bfcl_eval.constants.eval_config import (
     SCORE_PATH,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+from bfcl_eval.utils import get_category_entry_count
 from dotenv import load_dotenv
 from tabulate import tabulate
 
+# Choices of `generate --result-durability`, as an Enum so that typer validates them
+ResultDurability = Enum("ResultDurability", {policy: policy for policy in DURABILITY_POLICIES}, type=str)
+
 
 class ExecutionOrderGroup(typer.core.TyperGroup):
     def list_commands(self, ctx):
@@ -67,14 +71,18 @@ def version():
 @cli.command()
 def test_categories():
     """
-    List available test categories.
+    List available test categories, with the number of entries in each test.
     """
     table = tabulate(
         [
-            (category, "\n".join(test for test in tests))
+            (
+                category,
+                "\n".join(test for test in tests),
+                "\n".join(str(get_category_entry_count(test)) for test in tests),
+            )
             for category, tests in TEST_COLLECTION_MAPPING.items()
         ],
-        headers=["Test category", "Test names"],
+        headers=["Test category", "Test names", "Entries"],
         tablefmt="grid",
     )
     print(table)
@@ -127,6 +135,11 @@ def generate(
         "--skip-server-setup",
         help="Skip vLLM/SGLang server setup and use existing endpoint specified by the LOCAL_SERVER_ENDPOINT and LOCAL_SERVER_PORT environment variables.",
     ),
+    num_replicas: int = typer.Option(
+        1,
+        "--num-replicas",
+        help="Number of local server replicas to launch (each with `--num-gpus` GPUs, on consecutive ports). Requests are routed to the replica with the fewest requests in flight.",
+    ),
     local_model_path: Optional[str] = typer.Option(
         None,
         "--local-model-path",
@@ -148,6 +161,51 @@ def generate(
         "--run-ids",
         help="If true, also run the test entry mentioned in the test_case_ids_to_generate.json file, in addition to the --test_category argument.",
     ),
+    async_inference: bool = typer.Option(
+        False,
+        "--async-inference",
+        help="Use the asyncio inference engine instead of the thread pool. `--num-threads` then caps the number of in-flight requests.",
+    ),
+    response_cache: Optional[str] = typer.Option(
+        None,
+        "--response-cache",
+        help="Cache the raw model responses on disk: always query and store them (record), only serve them from the cache (replay), or serve them when available and query otherwise (replay-or-record).",
+    ),
+    response_cache_path: Optional[str] = typer.Option(
+        None,
+        "--response-cache-path",
+        help="Path to the response cache database, relative to the project root. Defaults to `response_cache/responses.sqlite`.",
+    ),
+    regenerate_failed: bool = typer.Option(
+        False,
+        "--regenerate-failed",
+        help="Also regenerate the existing entries that failed during inference (recorded with an error), replacing them in the result files.",
+    ),
+    result_durability: ResultDurability = typer.Option(
+        ResultDurability.flush,
+        "--result-durability",
+        help="How hard to push each batch of results to disk: leave it in the file buffer until the end (none), flush it to the OS (flush), or also fsync it (fsync).",
+    ),
+    prefix_aware_scheduling: bool = typer.Option(
+        False,
+        "--prefix-aware-scheduling",
+        help="For locally hosted models, dispatch the test cases that share the same function docs and system prompt back to back, so the server's prefix cache stays hot.",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        False,
+        "--adaptive-concurrency",
+        help="Adjust the number of in-flight requests at runtime (AIMD), starting from `--num-threads` and backing off on rate limits, errors or latency growth.",
+    ),
+    max_concurrency: Optional[int] = typer.Option(
+        None,
+        "--max-concurrency",
+        help="Upper bound for `--adaptive-concurrency`. Defaults to 100, or 100 per server replica for locally hosted models.",
+    ),
+    store_decoded_result: bool = typer.Option(
+        False,
+        "--store-decoded-result",
+        help="Also store the decoded model responses in the result files, so that the evaluator does not need to decode them again.",
+    ),
 ):
     """
     Generate the LLM response for one or more models on a test-category (same as openfunctions_evaluation.py).
@@ -162,14 +220,27 @@ def generate(
         num_gpus=num_gpus,
         num_threads=num_threads,
         gpu_memory_utilization=gpu_memory_utilization,
+        num_replicas=num_replicas,
         backend=backend,
         skip_server_setup=skip_server_setup,
         local_model_path=local_model_path,
         result_dir=result_dir,
         allow_overwrite=allow_overwrite,
         run_ids=run_ids,
+        async_inference=async_inference,
+        response_cache=response_cache,
+        response_cache_path=response_cache_path,
+        regenerate_failed=regenerate_failed,
+        result_durability=result_durability.value,
+        prefix_aware_scheduling=prefix_aware_scheduling,
+        adaptive_concurrency=adaptive_concurrency,
+        max_concurrency=max_concurrency,
+        store_decoded_result=store_decoded_result,
     )
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
+    # Imported here so that the other commands (and `--help`) start without loading the whole generation pipeline
+    from bfcl_eval._llm_response_generation import main as generation_main
+
     generation_main(args)
 
 
@@ -256,13 +327,33 @@ def evaluate(
         "--partial-eval",
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        help="Number of worker processes used for the evaluation; 1 evaluates everything in the current process.",
+    ),
+    no_ground_truth_cache: bool = typer.Option(
+        False,
+        "--no-ground-truth-cache",
+        help="Execute the multi-turn ground truth for every entry instead of reusing the cached execution traces.",
+    ),
 ):
     """
     Evaluate results from run of one or more models on a test-category (same as eval_runner.py).
     """
 
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
-    evaluation_main(model, test_category, result_dir, score_dir, partial_eval)
+    from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+
+    evaluation_main(
+        model,
+        test_category,
+        result_dir,
+        score_dir,
+        partial_eval,
+        workers,
+        use_ground_truth_cache=not no_ground_truth_cache,
+    )
 
 
 @cli.command()
@@ -0,0 +1,217 @@
+import math
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+# Matches the error message recorded by the scheduler when an inference call fails because of rate limiting
+# (e.g. the retries in `retry_with_backoff` were exhausted, or the handler does not retry at all).
+RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"rate.?limit|429|too many requests|resource_exhausted|throttl", re.IGNORECASE
+)
+
+# Controllers that should be told about backoff events raised deep inside the handlers.
+# Generation runs one model at a time, so there is at most one active controller in practice.
+_active_controllers: set["AdaptiveConcurrencyController"] = set()
+_active_controllers_lock = threading.Lock()
+
+
+def notify_backoff() -> None:
+    """
+    Report that a request is being retried after a rate-limit style error.
+    Called by `retry_with_backoff` right before it sleeps; safe to call from any thread.
+    """
+    with _active_controllers_lock:
+        controllers = list(_active_controllers)
+    for controller in controllers:
+        controller.on_backoff()
+
+
+def notify_request(latency: float, is_error: bool, is_rate_limited: bool = False) -> None:
+    """Report the outcome of one request to the model; safe to call from any thread."""
+    with _active_controllers_lock:
+        controllers = list(_active_controllers)
+    for controller in controllers:
+        controller.record(latency, is_error, is_rate_limited)
+
+
+@contextmanager
+def observe_request():
+    """
+    Time the request made in the `with` block and report it with `notify_request`.
+    Used around every attempt in `retry_with_backoff` and every request of the locally hosted models,
+    so that the controller sees per-request latencies, whatever the number of requests a test case makes.
+    """
+    start_time = time.time()
+    try:
+        yield
+    except Exception as e:
+        notify_request(
+            time.time() - start_time,
+            is_error=True,
+            is_rate_limited=getattr(e, "status_code", None) == 429
+            or bool(RATE_LIMIT_ERROR_PATTERN.search(f"{type(e).__name__}: {e}")),
+        )
+        raise
+    notify_request(time.time() - start_time, is_error=False)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD (additive increase, multiplicative decrease) controller for the number of in-flight test cases.
+
+    Completed requests (reported by `observe_request`, one per request rather than one per test case,
+    since a multi-turn test case makes many) are grouped into observation windows. At the end of each window:
+        - if a rate-limit backoff was observed, the error rate is above `max_error_rate`,
+          or the window's p95 latency grew beyond `latency_tolerance` times the best p95 seen so far
+          (and by more than `min_latency_increase` seconds),
+          the limit is multiplied by `decrease_factor`;
+        - otherwise the limit is increased by `increase_step`.
+    A backoff event also shrinks the limit immediately (at most once per window), so that a 429 storm
+    does not have to wait for a full window before the scheduler stops submitting new work.
+
+    Every change of the limit is recorded in `history`, which is saved in the run metadata.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_latency_increase: float = 0.5,
+        max_error_rate: float = 0.1,
+        min_window_size: int = 5,
+    ) -> None:
+        if max_limit < min_limit:
+            raise ValueError(
+                f"max_limit ({max_limit}) must not be smaller than min_limit ({min_limit})."
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        # Ignore p95 growth smaller than this many seconds, otherwise jitter on very fast requests would trigger a backoff
+        self.min_latency_increase = min_latency_increase
+        self.max_error_rate = max_error_rate
+        self.min_window_size = min_window_size
+
+        self._lock = threading.Lock()
+        self._limit = self._clamp(initial_limit)
+        self._start_time = time.time()
+        self._window_latencies: list[float] = []
+        self._window_errors = 0
+        self._window_backoffs = 0
+        self._decreased_in_window = False
+        self._baseline_p95: Optional[float] = None
+        # Keep the recent p95 values to report them in the metadata
+        self._recent_p95 = deque(maxlen=50)
+        self.history: list[dict] = []
+        self._record_change("initial")
+
+    def __enter__(self):
+        with _active_controllers_lock:
+            _active_controllers.add(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with _active_controllers_lock:
+            _active_controllers.discard(self)
+        return False
+
+    @property
+    def limit(self) -> int:
+        with self._lock:
+            return self._limit
+
+    def on_backoff(self) -> None:
+        """Shrink the limit right away when a request hits a rate limit."""
+        with self._lock:
+            self._window_backoffs += 1
+            if not self._decreased_in_window:
+                self._decrease("rate_limit_backoff")
+
+    def record(self, latency: float, is_error: bool, is_rate_limited: bool = False) -> None:
+        """Record the outcome of one completed request."""
+        with self._lock:
+            self._window_latencies.append(latency)
+            if is_error:
+                self._window_errors += 1
+            if is_rate_limited:
+                self._window_backoffs += 1
+
+            # One window is roughly one "round trip" worth of completions at the current limit
+            if len(self._window_latencies) >= max(self._limit, self.min_window_size):
+                self._end_window()
+
+    def summary(self) -> dict:
+        with self._lock:
+            limits = [entry["limit"] for entry in self.history]
+            return {
+                "policy": "aimd",
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "final_limit": self._limit,
+                "peak_limit": max(limits),
+                "baseline_p95_latency": self._baseline_p95,
+                "recent_p95_latency": list(self._recent_p95),
+                "history": list(self.history),
+            }
+
+    def _end_window(self) -> None:
+        latencies = sorted(self._window_latencies)
+        p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+        error_rate = self._window_errors / len(latencies)
+        self._recent_p95.append(p95)
+
+        if self._window_backoffs > 0:
+            if not self._decreased_in_window:
+                self._decrease("rate_limit_backoff")
+        elif error_rate > self.max_error_rate:
+            self._decrease("error_rate")
+        elif (
+            self._baseline_p95 is not None
+            and p95 > self._baseline_p95 * self.latency_tolerance
+            and p95 - self._baseline_p95 > self.min_latency_increase
+        ):
+            self._decrease("latency")
+        else:
+            self._increase()
+
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+
+        self._window_latencies = []
+        self._window_errors = 0
+        self._window_backoffs = 0
+        self._decreased_in_window = False
+
+    def _increase(self) -> None:
+        new_limit = self._clamp(self._limit + self.increase_step)
+        if new_limit != self._limit:
+            self._limit = new_limit
+            self._record_change("increase")
+
+    def _decrease(self, reason: str) -> None:
+        self._decreased_in_window = True
+        new_limit = self._clamp(math.floor(self._limit * self.decrease_factor))
+        if new_limit != self._limit:
+            self._limit = new_limit
+            self._record_change(reason)
+
+    def _clamp(self, limit: int) -> int:
+        return max(self.min_limit, min(self.max_limit, limit))
+
+    def _record_change(self, reason: str) -> None:
+        self.history.append(
+            {
+                "elapsed_seconds": round(time.time() - self._start_time, 3),
+                "limit": self._limit,
+                "reason": reason,
+            }
+        )
@@ -0,0 +1,196 @@
+import hashlib
+import importlib
+import inspect
+import json
+import pickle
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import DATASET_CACHE_PATH, PROMPT_PATH
+
+# Bump this when the layout of the cache files changes
+DATASET_CACHE_FORMAT_VERSION = 1
+
+# Modules whose code turns the raw data files into dataset entries; editing any of them invalidates the cache
+_PROCESSING_MODULES = (
+    "bfcl_eval.utils",
+    "bfcl_eval.constants.category_mapping",
+    "bfcl_eval.constants.default_prompts",
+    "bfcl_eval.constants.executable_backend_config",
+)
+
+# Content hash of each data file, along with the size and mtime it was computed for
+_FILE_HASHES_FILE_NAME = "file_hashes.json"
+_CATALOG_FILE_NAME = "catalog.json"
+_ENTRIES_DIR_NAME = "entries"
+
+
+class DatasetCache:
+    """
+    On-disk cache of the fully processed dataset entries (memory scenarios linked, agentic system prompt injected,
+    multi-turn function docs populated, language-specific hints added), plus a catalog of the entry ids of each category.
+
+    Every entry is keyed by the content hashes of the data files, the source code of the processing modules,
+    the test category and the processing flags, so editing any of them simply leads to a cache miss.
+    The data files are only hashed again when their size or mtime changes.
+
+    Entries are stored pickled, and unpickled on every lookup: callers get fresh objects that they are free to mutate.
+    The cache is best effort; if its directory is not writable, the entries are processed as usual.
+    """
+
+    def __init__(self, path: Path, data_path: Path = PROMPT_PATH) -> None:
+        self.path = Path(path)
+        self.data_path = Path(data_path)
+        self._lock = threading.Lock()
+        # Pickled entries already read (or built) in this process, keyed by cache key
+        self._memory: dict[str, bytes] = {}
+        self._fingerprint: Optional[str] = None
+        self._catalog: Optional[dict] = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything the processed entries depend on, besides the category and the flags."""
+        if self._fingerprint is None:
+            self._fingerprint = _hash_json(
+                [
+                    DATASET_CACHE_FORMAT_VERSION,
+                    VERSION_PREFIX,
+                    self._data_files_hash(),
+                    _processing_code_hash(),
+                ]
+            )
+        return self._fingerprint
+
+    def get_entries(
+        self, test_category: str, flags: dict, build: Callable[[], list[dict]]
+    ) -> list[dict]:
+        """The processed entries of a test category, built with `build` on a cache miss."""
+        key = _hash_json([self.fingerprint, test_category, flags])
+        with self._lock:
+            pickled = self._memory.get(key)
+        if pickled is None:
+            file_path = self.path / _ENTRIES_DIR_NAME / f"{test_category}.{_flags_suffix(flags)}.pkl"
+            pickled = self._read_entries_file(file_path, key)
+            if pickled is None:
+                pickled = pickle.dumps(build(), protocol=pickle.HIGHEST_PROTOCOL)
+                self._write_file(file_path, key.encode() + b"\n" + pickled)
+            with self._lock:
+                self._memory[key] = pickled
+        return pickle.loads(pickled)
+
+    def get_catalog_entry(
+        self, test_category: str, build: Callable[[], list[dict]]
+    ) -> dict:
+        """
+        `{"count": ..., "ids": [...]}` for a test category, where `build` returns the entries to catalog.
+        Categories are added to the catalog the first time they are looked up.
+        """
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = self._read_catalog()
+            catalog_entry = self._catalog.get(test_category)
+        if catalog_entry is not None:
+            return catalog_entry
+
+        entry_ids = [entry["id"] for entry in build()]
+        catalog_entry = {"count": len(entry_ids), "ids": entry_ids}
+        with self._lock:
+            self._catalog[test_category] = catalog_entry
+            catalog = {"fingerprint": self.fingerprint, "categories": self._catalog}
+            self._write_file(
+                self.path / _CATALOG_FILE_NAME,
+                json.dumps(catalog, ensure_ascii=False).encode("utf-8"),
+            )
+        return catalog_entry
+
+    def _read_catalog(self) -> dict:
+        try:
+            with open(self.path / _CATALOG_FILE_NAME, encoding="utf-8") as f:
+                catalog = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if catalog.get("fingerprint") != self.fingerprint:
+            return {}
+        return catalog["categories"]
+
+    @staticmethod
+    def _read_entries_file(file_path: Path, key: str) -> Optional[bytes]:
+        try:
+            with open(file_path, "rb") as f:
+                if f.readline().rstrip(b"\n") != key.encode():
+                    return None
+                return f.read()
+        except OSError:
+            return None
+
+    def _data_files_hash(self) -> str:
+        """Hash of the content of every data file. Files whose size and mtime did not change are not read again."""
+        hashes_path = self.path / _FILE_HASHES_FILE_NAME
+        try:
+            with open(hashes_path, encoding="utf-8") as f:
+                known_hashes = json.load(f)
+        except (OSError, ValueError):
+            known_hashes = {}
+
+        file_hashes = {}
+        for file_path in sorted(self.data_path.rglob("*")):
+            if not file_path.is_file():
+                continue
+            relative_path = file_path.relative_to(self.data_path).as_posix()
+            stat = file_path.stat()
+            known = known_hashes.get(relative_path)
+            if known is not None and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+                file_hashes[relative_path] = known
+            else:
+                file_hashes[relative_path] = [
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    hashlib.sha256(file_path.read_bytes()).hexdigest(),
+                ]
+
+        if file_hashes != known_hashes:
+            self._write_file(hashes_path, json.dumps(file_hashes, indent=1).encode("utf-8"))
+        return _hash_json(
+            [[relative_path, known[2]] for relative_path, known in file_hashes.items()]
+        )
+
+    def _write_file(self, file_path: Path, content: bytes) -> None:
+        # Imported here: `bfcl_eval.utils` imports this module
+        from bfcl_eval.utils import atomic_write_bytes
+
+        try:
+            atomic_write_bytes(file_path, content)
+        except OSError as e:
+            print(f"⚠️ Could not write the dataset cache file {file_path}: {e}")
+
+
+_dataset_cache: Optional[DatasetCache] = None
+_dataset_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    global _dataset_cache
+    with _dataset_cache_lock:
+        if _dataset_cache is None:
+            _dataset_cache = DatasetCache(DATASET_CACHE_PATH)
+        return _dataset_cache
+
+
+def _hash_json(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def _flags_suffix(flags: dict) -> str:
+    return "-".join(f"{name}={int(value)}" for name, value in sorted(flags.items()))
+
+
+@lru_cache(maxsize=None)
+def _processing_code_hash() -> str:
+    hasher = hashlib.sha256()
+    for module_name in _PROCESSING_MODULES:
+        module = importlib.import_module(module_name)
+        hasher.update(inspect.getsource(module).encode())
+    return hasher.hexdigest()
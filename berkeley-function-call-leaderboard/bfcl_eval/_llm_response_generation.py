@@ -1,29 +1,37 @@
 import argparse
+import asyncio
+import hashlib
+import json
 import multiprocessing as mp
 import os
 import shutil
+import time
 import traceback
 from collections import defaultdict, deque
+from contextlib import nullcontext
+from datetime import datetime
 from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import threading
 import queue
 from copy import deepcopy
 from typing import TYPE_CHECKING
 
+from bfcl_eval._result_store import DURABILITY_POLICIES, UPDATE_LOG_SUFFIX, ResultManifest
+from bfcl_eval._concurrency_controller import AdaptiveConcurrencyController
 from bfcl_eval.constants.eval_config import (
     PROJECT_ROOT,
+    RESPONSE_CACHE_PATH,
     RESULT_PATH,
+    RUN_METADATA_FILE_NAME,
     TEST_IDS_TO_GENERATE_PATH,
-    RESULT_FILE_PATTERN,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner_helper import load_file
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.utils import *
 from tqdm import tqdm
 
 from bfcl_eval.model_handler.base_handler import BaseHandler
-from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+from bfcl_eval.model_handler.response_cache import RESPONSE_CACHE_MODES, ResponseCache
 
 
 def get_args():
@@ -41,6 +49,12 @@ def get_args():
     parser.add_argument("--num-gpus", default=1, type=int)
     parser.add_argument("--backend", default="sglang", type=str, choices=["vllm", "sglang"])
     parser.add_argument("--gpu-memory-utilization", default=0.9, type=float)
+    parser.add_argument(
+        "--num-replicas",
+        default=1,
+        type=int,
+        help="Number of local server replicas to launch (each with `--num-gpus` GPUs, on consecutive ports). Requests are routed to the replica with the fewest requests in flight.",
+    )
     parser.add_argument("--result-dir", default=None, type=str)
     parser.add_argument("--run-ids", action="store_true", default=False)
     parser.add_argument("--allow-overwrite", "-o", action="store_true", default=False)
@@ -57,6 +71,62 @@ def get_args():
         default=None,
         help="Specify the path to a local directory containing the model's config/tokenizer/weights for fully offline inference. Use this only if the model weights are stored in a location other than the default HF_HOME directory.",
     )
+    parser.add_argument(
+        "--async-inference",
+        action="store_true",
+        default=False,
+        help="Use the asyncio inference engine instead of the thread pool. `--num-threads` then caps the number of in-flight requests.",
+    )
+    parser.add_argument(
+        "--response-cache",
+        type=str,
+        default=None,
+        choices=RESPONSE_CACHE_MODES,
+        help="Cache the raw model responses on disk: always query and store them (record), only serve them from the cache (replay), or serve them when available and query otherwise (replay-or-record).",
+    )
+    parser.add_argument(
+        "--response-cache-path",
+        type=str,
+        default=None,
+        help="Path to the response cache database, relative to the project root. Defaults to `response_cache/responses.sqlite`.",
+    )
+    parser.add_argument(
+        "--regenerate-failed",
+        action="store_true",
+        default=False,
+        help="Also regenerate the existing entries that failed during inference (recorded with an error), replacing them in the result files.",
+    )
+    parser.add_argument(
+        "--result-durability",
+        type=str,
+        default="flush",
+        choices=DURABILITY_POLICIES,
+        help="How hard to push each batch of results to disk: leave it in the file buffer until the end (none), flush it to the OS (flush), or also fsync it (fsync).",
+    )
+    parser.add_argument(
+        "--prefix-aware-scheduling",
+        action="store_true",
+        default=False,
+        help="For locally hosted models, dispatch the test cases that share the same function docs and system prompt back to back, so the server's prefix cache stays hot.",
+    )
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        default=False,
+        help="Adjust the number of in-flight requests at runtime (AIMD), starting from `--num-threads` and backing off on rate limits, errors or latency growth.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Upper bound for `--adaptive-concurrency`. Defaults to 100, or 100 per server replica for locally hosted models.",
+    )
+    parser.add_argument(
+        "--store-decoded-result",
+        action="store_true",
+        default=False,
+        help="Also store the decoded model responses in the result files, so that the evaluator does not need to decode them again.",
+    )
     args = parser.parse_args()
 
     return args
@@ -64,7 +134,7 @@ def get_args():
 
 def build_handler(model_name, temperature):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(
+    handler = config.get_handler_class()(
         model_name=config.model_name,
         temperature=temperature,
         registry_name=model_name,
@@ -95,7 +165,6 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
     model_name_dir = model_name.replace("/", "_")
     model_result_dir = args.result_dir / model_name_dir
 
-    existing_result = []
     for test_category in all_test_categories:
         # TODO: Simplify the handling of memory prerequisite entries/categories
         result_file_paths = [
@@ -113,12 +182,16 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
 
         for file_path in result_file_paths:
             if file_path.exists():
-                # Not allowing overwrite, we will load the existing results
+                # Not allowing overwrite, the existing results are looked up in the manifest below
                 if not args.allow_overwrite:
-                    existing_result.extend(load_file(file_path))
+                    pass
                 # Allow overwrite and not running specific test ids, we will delete the existing result file before generating new results
                 elif not args.run_ids:
                     file_path.unlink()
+                    # Also drop the update log left by an interrupted `--run-ids` run, so that its entries are not merged back
+                    file_path.with_name(file_path.name + UPDATE_LOG_SUFFIX).unlink(
+                        missing_ok=True
+                    )
                 # Allow overwrite and running specific test ids, we will do nothing here
                 else:
                     pass
@@ -136,7 +209,15 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
                     # It's not implemented yet, but it won't affect the accuracy, as those files will be overwritten anyway (assume generation success)
                     pass
 
-    existing_ids = [entry["id"] for entry in existing_result]
+    # The manifest indexes the result files without parsing them (they are only parsed if the manifest is missing or out of date)
+    existing_ids = set()
+    if not args.allow_overwrite:
+        manifest = ResultManifest(model_result_dir)
+        if getattr(args, "regenerate_failed", False):
+            # Entries that failed during inference are regenerated and replace the old ones
+            existing_ids = manifest.ids(status="ok")
+        else:
+            existing_ids = manifest.ids()
 
     test_cases_to_generate = [
         test_case
@@ -167,6 +248,41 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
     return sorted(test_cases_to_generate, key=sort_key)
 
 
+def _shared_prefix_key(test_case):
+    """
+    Hash of the part of the prompt that is shared across test cases: the prompt format, the function docs
+    (which end up in the system prompt or the tool block of the chat template) and the original system message, if any.
+    """
+    first_turn = test_case["question"][0] if test_case.get("question") else []
+    original_system_prompt = (
+        first_turn[0]["content"]
+        if first_turn and first_turn[0].get("role") == "system"
+        else None
+    )
+    serialized = json.dumps(
+        [
+            extract_prompt_format_from_id(test_case["id"]),
+            test_case["function"],
+            original_system_prompt,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def order_test_cases_by_shared_prefix(test_cases):
+    """
+    Reorder the test cases so that those sharing the same prompt prefix are dispatched back to back,
+    which keeps the prefix cache of the vLLM/SGLang server hot.
+    Groups are ordered by their first appearance, and the original order is kept within each group,
+    so the memory prerequisite entries still come first. `depends_on` is honoured by the scheduler regardless of the order.
+    """
+    groups = defaultdict(list)
+    for test_case in test_cases:
+        groups[_shared_prefix_key(test_case)].append(test_case)
+    return [test_case for group in groups.values() for test_case in group]
+
+
 def multi_threaded_inference(handler, test_case, include_input_log, exclude_state_log):
 
     assert type(test_case["function"]) is list
@@ -176,21 +292,29 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
             deepcopy(test_case), include_input_log, exclude_state_log
         )
     except Exception as e:
-        # This is usually the case when the model getting stuck on one particular test case.
-        # For example, timeout error or FC model returning invalid JSON response.
-        # Since temperature is already set to 0.001, retrying the same test case will not help.
-        # So we continue the generation process and record the error message as the model response
-        error_block = (
-            "-" * 100
-            + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
-            + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
-            + traceback.format_exc(limit=10)
-            + "-" * 100
-        )
-        print(error_block)
+        result, metadata = _handle_inference_error(test_case, e)
 
-        result = f"Error during inference: {str(e)}"
-        metadata = {"traceback": traceback.format_exc()}
+    result_to_write = {
+        "id": test_case["id"],
+        "result": result,
+        **metadata,
+    }
+
+    return result_to_write
+
+
+async def async_inference(handler, test_case, include_input_log, exclude_state_log):
+    """
+    Async counterpart of `multi_threaded_inference`, used by the asyncio inference engine.
+    """
+    assert type(test_case["function"]) is list
+
+    try:
+        result, metadata = await handler.inference_async(
+            deepcopy(test_case), include_input_log, exclude_state_log
+        )
+    except Exception as e:
+        result, metadata = _handle_inference_error(test_case, e)
 
     result_to_write = {
         "id": test_case["id"],
@@ -201,33 +325,332 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
     return result_to_write
 
 
+def _handle_inference_error(test_case, e):
+    # This is usually the case when the model getting stuck on one particular test case.
+    # For example, timeout error or FC model returning invalid JSON response.
+    # Since temperature is already set to 0.001, retrying the same test case will not help.
+    # So we continue the generation process and record the error message as the model response
+    error_block = (
+        "-" * 100
+        + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
+        + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
+        + traceback.format_exc(limit=10)
+        + "-" * 100
+    )
+    print(error_block)
+
+    result = f"Error during inference: {str(e)}"
+    metadata = {"traceback": traceback.format_exc()}
+
+    return result, metadata
+
+
+def _build_dependency_graph(test_cases_total):
+    """
+    Build the bookkeeping structures used by the schedulers to honour `depends_on`.
+    Returns the remaining dependencies of each test case, the reverse edges, an id lookup, and the test cases that are ready to run.
+    """
+    dependencies = {
+        test_case["id"]: set(test_case.get("depends_on", []))
+        for test_case in test_cases_total
+    }
+    children_of = defaultdict(list)
+    for test_case in test_cases_total:
+        for dependency_id in test_case.get("depends_on", []):
+            children_of[dependency_id].append(test_case["id"])
+
+    id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
+
+    ready_queue = deque(
+        [
+            test_case_id
+            for test_case_id, dependency_ids in dependencies.items()
+            if not dependency_ids
+        ]
+    )
+
+    return dependencies, children_of, id_to_test_case, ready_queue
+
+
+def _run_thread_pool_scheduler(
+    args,
+    handler,
+    model_name,
+    test_cases_total,
+    num_threads,
+    write_queue,
+    controller=None,
+    stop_event=None,
+):
+    # ───── dependency bookkeeping ──────────────────────────────
+    dependencies, children_of, id_to_test_case, ready_queue = _build_dependency_graph(
+        test_cases_total
+    )
+    in_flight: dict[Future, str] = {}  # future -> test_case_id
+    completed = set()
+
+    with ThreadPoolExecutor(max_workers=num_threads) as pool, tqdm(
+        total=len(test_cases_total), desc=f"Generating results for {model_name}"
+    ) as pbar:
+
+        def _fill_in_flight():
+            # refill the pool up to the current concurrency limit
+            while (
+                ready_queue
+                and len(in_flight) < _max_in_flight(num_threads, controller)
+                and not _should_stop(stop_event)
+            ):
+                test_case_id = ready_queue.popleft()
+                test_case = id_to_test_case[test_case_id]
+                future = pool.submit(
+                    multi_threaded_inference,
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+                in_flight[future] = test_case_id
+
+        # seed initial ready tasks
+        _fill_in_flight()
+
+        # main scheduler loop
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                test_case_id = in_flight.pop(future)
+                result_dict = future.result()
+
+                # Enqueue the result for the writer thread to handle file IO
+                write_queue.put(result_dict)
+
+                # Update progress bar right after inference completes
+                pbar.update()
+                completed.add(test_case_id)
+
+                # unlock children
+                for child_id in children_of[test_case_id]:
+                    dependencies[child_id].discard(test_case_id)
+                    if not dependencies[child_id]:
+                        ready_queue.append(child_id)
+
+            _fill_in_flight()
+
+
+async def _run_asyncio_scheduler(
+    args,
+    handler,
+    model_name,
+    test_cases_total,
+    num_threads,
+    write_queue,
+    controller=None,
+    stop_event=None,
+):
+    """
+    Same scheduling policy as `_run_thread_pool_scheduler`, but each in-flight test case is an asyncio task instead of a thread.
+    Handlers with a native async client keep many requests in flight without one thread per request;
+    the remaining blocking work (sync-only handlers, function execution in multi-turn entries) runs on the loop's default executor, which is sized to `num_threads`.
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=num_threads)
+    loop.set_default_executor(executor)
+
+    # ───── dependency bookkeeping ──────────────────────────────
+    dependencies, children_of, id_to_test_case, ready_queue = _build_dependency_graph(
+        test_cases_total
+    )
+    in_flight: dict[asyncio.Task, str] = {}  # task -> test_case_id
+
+    def _fill_in_flight():
+        while (
+            ready_queue
+            and len(in_flight) < _max_in_flight(num_threads, controller)
+            and not _should_stop(stop_event)
+        ):
+            test_case_id = ready_queue.popleft()
+            test_case = id_to_test_case[test_case_id]
+            task = asyncio.create_task(
+                async_inference(
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+            )
+            in_flight[task] = test_case_id
+
+    try:
+        with tqdm(
+            total=len(test_cases_total), desc=f"Generating results for {model_name}"
+        ) as pbar:
+            _fill_in_flight()
+
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    test_case_id = in_flight.pop(task)
+                    result_dict = task.result()
+
+                    # Enqueue the result for the writer thread to handle file IO
+                    write_queue.put(result_dict)
+
+                    pbar.update()
+
+                    # unlock children
+                    for child_id in children_of[test_case_id]:
+                        dependencies[child_id].discard(test_case_id)
+                        if not dependencies[child_id]:
+                            ready_queue.append(child_id)
+
+                _fill_in_flight()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        executor.shutdown(wait=True)
+
+
+def _max_in_flight(num_threads, controller):
+    # The controller itself is fed by the handlers, with one observation per request (see `observe_request`)
+    if controller is None:
+        return num_threads
+    return controller.limit
+
+
+def _should_stop(stop_event):
+    # Set when the result writer died: no new test case is started, the ones in flight are left to finish
+    return stop_event is not None and stop_event.is_set()
+
+
+def write_run_metadata(args, model_name, run_metadata):
+    """
+    Append the metadata of this generation run (engine, concurrency over time, etc.) to the model's run metadata file.
+    Each run adds one JSON line, so the file keeps the history of all runs for that model without ever being read back here;
+    a line cut short by an interrupted run does not affect the following ones.
+    """
+    model_result_dir = args.result_dir / model_name.replace("/", "_")
+    model_result_dir.mkdir(parents=True, exist_ok=True)
+    metadata_file = model_result_dir / RUN_METADATA_FILE_NAME
+
+    line = json.dumps(run_metadata) + "\n"
+    with open(metadata_file, "ab") as f:
+        if f.tell() > 0:
+            with open(metadata_file, "rb") as existing:
+                existing.seek(-1, os.SEEK_END)
+                if existing.read(1) != b"\n":
+                    # Terminate the partial line of an interrupted run
+                    line = "\n" + line
+        f.write(line.encode("utf-8"))
+
+
 def generate_results(args, model_name, test_cases_total):
     handler = build_handler(model_name, args.temperature)
+    if getattr(args, "response_cache", None) is not None:
+        handler.response_cache = ResponseCache(
+            (
+                PROJECT_ROOT / args.response_cache_path
+                if getattr(args, "response_cache_path", None) is not None
+                else RESPONSE_CACHE_PATH
+            ),
+            mode=args.response_cache,
+        )
+    handler.store_decoded_result = getattr(args, "store_decoded_result", False)
+
+    # Imported here: it pulls in the OpenAI client, which API models from other providers never need
+    from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
 
     if isinstance(handler, OSSHandler):
         handler: OSSHandler
         is_oss_model = True
         # For OSS models, if the user didn't explicitly set the number of threads,
-        # we default to 100 threads to speed up the inference.
+        # we default to 100 threads per server replica to speed up the inference.
         num_threads = (
             args.num_threads
             if args.num_threads is not None
-            else LOCAL_SERVER_MAX_CONCURRENT_REQUEST
+            else LOCAL_SERVER_MAX_CONCURRENT_REQUEST * getattr(args, "num_replicas", 1)
         )
     else:
         handler: BaseHandler
         is_oss_model = False
         num_threads = args.num_threads if args.num_threads is not None else 1
 
+    prefix_aware_scheduling = getattr(args, "prefix_aware_scheduling", False)
+    if prefix_aware_scheduling:
+        if is_oss_model:
+            test_cases_total = order_test_cases_by_shared_prefix(test_cases_total)
+        else:
+            print(
+                f"⚠️ --prefix-aware-scheduling only applies to locally hosted models; ignoring it for {model_name}."
+            )
+            prefix_aware_scheduling = False
+
+    controller = None
+    if getattr(args, "adaptive_concurrency", False):
+        # `--num-threads` becomes the starting point, and the controller can grow up to `--max-concurrency`
+        if args.max_concurrency is not None:
+            max_concurrency = args.max_concurrency
+        elif is_oss_model:
+            max_concurrency = LOCAL_SERVER_MAX_CONCURRENT_REQUEST * getattr(args, "num_replicas", 1)
+        else:
+            max_concurrency = LOCAL_SERVER_MAX_CONCURRENT_REQUEST
+        if is_oss_model and args.num_threads is None:
+            # The default number of threads is already what the servers accept, which would leave no room to grow
+            num_threads = max(1, int(max_concurrency * ADAPTIVE_CONCURRENCY_INITIAL_FRACTION))
+        if num_threads > max_concurrency:
+            print(
+                f"⚠️ --num-threads ({num_threads}) is above --max-concurrency ({max_concurrency}); starting from {max_concurrency} instead."
+            )
+            num_threads = max_concurrency
+        controller = AdaptiveConcurrencyController(
+            initial_limit=num_threads,
+            max_limit=max_concurrency,
+        )
+        num_threads = controller.max_limit
+
+    # Opened here rather than in the writer thread, so that a bad setting fails before any inference is done
+    result_writer = handler.open_result_writer(
+        args.result_dir,
+        update_mode=args.run_ids or getattr(args, "regenerate_failed", False),
+        durability=getattr(args, "result_durability", "flush"),
+    )
+    writer_errors: list[BaseException] = []
+    writer_failed = threading.Event()
+
     # Use a separate thread to write the results to the file to avoid concurrent IO issues
     def _writer():
-        """Consume result dicts from the queue and write them with exclusive access."""
-        while True:
-            item = write_queue.get()
-            if item is None:
-                break
-            handler.write(item, result_dir=args.result_dir, update_mode=args.run_ids)
-            write_queue.task_done()
+        """
+        Consume result dicts from the queue and write them with exclusive access.
+        Results are group-committed: the writer batches them and commits when the batch is full or its time window expires.
+        If writing fails, the error is kept for the main thread and the schedulers stop starting new test cases.
+        """
+        try:
+            with result_writer:
+                while True:
+                    try:
+                        item = write_queue.get(timeout=result_writer.time_until_commit())
+                    except queue.Empty:
+                        # The batch window expired while waiting for more results
+                        result_writer.commit()
+                        continue
+                    if item is None:
+                        break
+                    result_writer.write(item)
+                    if result_writer.should_commit():
+                        result_writer.commit()
+                    write_queue.task_done()
+        except BaseException as e:
+            writer_errors.append(e)
+            writer_failed.set()
+
+    def _stop_writer():
+        """Signal the writer thread to finish, wait for it, and re-raise whatever made it fail."""
+        if writer_thread.is_alive():
+            write_queue.put(None)
+            writer_thread.join()
+        if writer_errors:
+            raise RuntimeError(
+                f"Writing the results of {model_name} failed; the results generated after the last commit were not saved."
+            ) from writer_errors[0]
 
     write_queue: queue.Queue = queue.Queue()
 
@@ -242,88 +665,100 @@ def generate_results(args, model_name, test_cases_total):
                 backend=args.backend,
                 skip_server_setup=args.skip_server_setup,
                 local_model_path=args.local_model_path,
+                num_replicas=getattr(args, "num_replicas", 1),
             )
 
-        # ───── dependency bookkeeping ──────────────────────────────
-        dependencies = {
-            test_case["id"]: set(test_case.get("depends_on", []))
-            for test_case in test_cases_total
-        }
-        children_of = defaultdict(list)
-        for test_case in test_cases_total:
-            for dependency_id in test_case.get("depends_on", []):
-                children_of[dependency_id].append(test_case["id"])
-
-        id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
-
-        ready_queue = deque(
-            [
-                test_case_id
-                for test_case_id, dependency_ids in dependencies.items()
-                if not dependency_ids
-            ]
+        prefix_cache_metrics_before = (
+            handler.get_prefix_cache_metrics() if is_oss_model else None
         )
-        in_flight: dict[Future, str] = {}  # future -> test_case_id
-        completed = set()
-
-        with ThreadPoolExecutor(max_workers=num_threads) as pool, tqdm(
-            total=len(test_cases_total), desc=f"Generating results for {model_name}"
-        ) as pbar:
-
-            # seed initial ready tasks
-            while ready_queue and len(in_flight) < num_threads:
-                test_case_id = ready_queue.popleft()
-                test_case = id_to_test_case[test_case_id]
-                future = pool.submit(
-                    multi_threaded_inference,
+        start_time = time.time()
+        with controller if controller is not None else nullcontext():
+            if getattr(args, "async_inference", False):
+                asyncio.run(
+                    _run_asyncio_scheduler(
+                        args,
+                        handler,
+                        model_name,
+                        test_cases_total,
+                        num_threads,
+                        write_queue,
+                        controller,
+                        writer_failed,
+                    )
+                )
+            else:
+                _run_thread_pool_scheduler(
+                    args,
                     handler,
-                    test_case,
-                    args.include_input_log,
-                    args.exclude_state_log,
+                    model_name,
+                    test_cases_total,
+                    num_threads,
+                    write_queue,
+                    controller,
+                    writer_failed,
                 )
-                in_flight[future] = test_case_id
 
-            # main scheduler loop
-            while in_flight:
-                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
-                for future in done:
-                    test_case_id = in_flight.pop(future)
-                    result_dict = future.result()
-
-                    # Enqueue the result for the writer thread to handle file IO
-                    write_queue.put(result_dict)
-
-                    # Update progress bar right after inference completes
-                    pbar.update()
-                    completed.add(test_case_id)
-
-                    # unlock children
-                    for child_id in children_of[test_case_id]:
-                        dependencies[child_id].discard(test_case_id)
-                        if not dependencies[child_id]:
-                            ready_queue.append(child_id)
+        # Every result must be on disk before the run is recorded as done
+        _stop_writer()
 
-                # refill the pool up to max_workers
-                while ready_queue and len(in_flight) < num_threads:
-                    test_case_id = ready_queue.popleft()
-                    test_case = id_to_test_case[test_case_id]
-                    future = pool.submit(
-                        multi_threaded_inference,
-                        handler,
-                        test_case,
-                        args.include_input_log,
-                        args.exclude_state_log,
-                    )
-                    in_flight[future] = test_case_id
+        prefix_cache = None
+        if is_oss_model:
+            prefix_cache_hit_ratio = handler.compute_prefix_cache_hit_ratio(
+                prefix_cache_metrics_before, handler.get_prefix_cache_metrics()
+            )
+            prefix_cache = {
+                "prefix_aware_scheduling": prefix_aware_scheduling,
+                "hit_ratio": prefix_cache_hit_ratio,
+            }
+            if prefix_cache_hit_ratio is not None:
+                print(f"Prefix cache hit ratio for {model_name}: {prefix_cache_hit_ratio:.2%}")
+
+        write_run_metadata(
+            args,
+            model_name,
+            {
+                "start_time": datetime.fromtimestamp(start_time).isoformat(),
+                "duration_seconds": round(time.time() - start_time, 3),
+                "num_test_cases": len(test_cases_total),
+                "inference_engine": (
+                    "asyncio" if getattr(args, "async_inference", False) else "thread_pool"
+                ),
+                "concurrency": (
+                    controller.summary()
+                    if controller is not None
+                    else {"policy": "fixed", "limit": num_threads}
+                ),
+                "response_cache": (
+                    {
+                        "mode": handler.response_cache.mode,
+                        "path": str(handler.response_cache.path),
+                        "hits": handler.response_cache.hits,
+                        "misses": handler.response_cache.misses,
+                    }
+                    if handler.response_cache is not None
+                    else None
+                ),
+                "prefix_cache": prefix_cache,
+                "server_replicas": (
+                    handler.server_pool.summary()
+                    if is_oss_model and handler.server_pool is not None
+                    else None
+                ),
+            },
+        )
 
     finally:
-        # Signal writer thread to finish and wait for it
-        write_queue.put(None)
-        writer_thread.join()
+        if writer_thread.is_alive():
+            # Inference failed: still save the results gathered so far
+            write_queue.put(None)
+            writer_thread.join()
 
         if is_oss_model:
             handler.shutdown_local_server()
 
+        if handler.response_cache is not None:
+            handler.response_cache.close()
+
 
 def main(args):
 
@@ -386,7 +821,5 @@ def main(args):
                 f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
             )
         else:
+            # The result writer sorts the result files it touched by id at the end
             generate_results(args, model_name, test_cases_total)
-            # Sort the result files by id at the end
-            for model_result_json in args.result_dir.rglob(RESULT_FILE_PATTERN):
-                sort_file_content_by_id(model_result_json)
@@ -0,0 +1,522 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import (
+    RESULT_FILE_PATTERN,
+    RESULT_MANIFEST_FILE_NAME,
+    RESULT_WRITE_BATCH_SIZE,
+    RESULT_WRITE_BATCH_WINDOW_SECONDS,
+)
+from bfcl_eval.utils import (
+    extract_test_category_from_id,
+    get_directory_structure_by_id,
+    load_concatenated_json_line,
+    serialize_to_json,
+    sort_key,
+)
+
+# Suffix of the append-only update log kept next to a result file during an update-mode (`--run-ids`) run
+UPDATE_LOG_SUFFIX = ".update_log"
+
+# How hard to push each committed batch towards the disk
+#   - "none": leave the data in Python's file buffer until the file is closed
+#   - "flush": flush the buffer to the OS after each batch (default, survives a crash of the Python process)
+#   - "fsync": also fsync after each batch (survives a machine crash, slowest)
+DURABILITY_POLICIES = ["none", "flush", "fsync"]
+
+
+class UpdateLog:
+    """
+    Append-only log of updated entries for one result file.
+
+    Each line is `{"version": n, "entry": {...}}`; a later version of an id supersedes the earlier ones
+    and the entry in the canonical result file. An in-memory id -> byte offset index points to the latest version of each id,
+    so updates are plain appends and compaction only has to read the latest versions.
+    """
+
+    def __init__(self, result_file_path: Path) -> None:
+        self.result_file_path = result_file_path
+        self.path = result_file_path.with_name(result_file_path.name + UPDATE_LOG_SUFFIX)
+        self.index: dict[str, int] = {}
+        self.version = 0
+        if self.path.exists():
+            # Left over from an interrupted run, rebuild the index so that its updates are not lost
+            self._rebuild_index()
+        self._handle = open(self.path, "ab")
+
+    def _rebuild_index(self) -> None:
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from a crash; everything before it is intact
+                    break
+                self.index[record["entry"]["id"]] = offset
+                self.version = max(self.version, record["version"])
+                offset += len(line)
+        # Drop the partial line (if any) so that new records start on a clean line
+        os.truncate(self.path, offset)
+
+    def append(self, entries: list[tuple[dict, bytes]]) -> None:
+        """Log `(entry, serialized entry)` pairs."""
+        chunks = []
+        offset = self._handle.tell()
+        for entry, entry_line in entries:
+            self.version += 1
+            line = b'{"version": %d, "entry": %s}\n' % (self.version, entry_line)
+            self.index[entry["id"]] = offset
+            offset += len(line)
+            chunks.append(line)
+        self._handle.write(b"".join(chunks))
+
+    def sync(self, durability: str) -> None:
+        if durability == "none":
+            return
+        self._handle.flush()
+        if durability == "fsync":
+            os.fsync(self._handle.fileno())
+
+    def latest_entries(self) -> dict[str, dict]:
+        """Read the latest version of every logged entry, using the offset index."""
+        self._handle.flush()
+        entries = {}
+        with open(self.path, "rb") as f:
+            for entry_id, offset in self.index.items():
+                f.seek(offset)
+                entries[entry_id] = json.loads(f.readline())["entry"]
+        return entries
+
+    def remove(self) -> None:
+        self._handle.close()
+        self.path.unlink()
+
+
+def get_entry_status(entry: dict) -> str:
+    """Failed inference is recorded with a traceback and an error message as the result, see `_handle_inference_error`."""
+    if "traceback" in entry or str(entry.get("result", "")).startswith(
+        "Error during inference"
+    ):
+        return "error"
+    return "ok"
+
+
+class ResultManifest:
+    """
+    Small per-model index of the result files, stored as `result_manifest.jsonl` next to them.
+
+    For every entry it keeps the result file (relative to the model result folder), the byte offset and length of its line,
+    a content hash, and a status (`ok` or `error`). It also records the expected size and mtime of each result file.
+    The manifest is append-only while a run is in progress (the last record for an id wins) and is rewritten compactly at the end.
+
+    Resume, deduplication and "regenerate only failed entries" are then set lookups that never parse the result files.
+    When a result file does not match its recorded size and mtime (written by an older version, edited by hand, interrupted write),
+    that file alone is re-indexed by parsing it once.
+    """
+
+    def __init__(self, model_result_dir: Path) -> None:
+        self.model_result_dir = model_result_dir
+        self.path = model_result_dir / RESULT_MANIFEST_FILE_NAME
+        self.entries: dict[str, dict] = {}  # id -> record
+        # relative file path -> (size in bytes, mtime in ns, or None while the last write may still be buffered)
+        self.file_stats: dict[str, tuple[int, Optional[int]]] = {}
+        self._handle = None
+        self._load()
+
+    def _load(self) -> None:
+        needs_rewrite = False
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written last line from a crash
+                        needs_rewrite = True
+                        break
+                    self._apply(record)
+
+        # Make sure the manifest agrees with the result files that are actually on disk
+        result_files = {}
+        if self.model_result_dir.exists():
+            result_files = {
+                self.relative_path(file_path): file_path
+                for file_path in self.model_result_dir.rglob(RESULT_FILE_PATTERN)
+            }
+        for relative_path in list(self.file_stats):
+            if relative_path not in result_files:
+                self._drop_file(relative_path)
+                needs_rewrite = True
+        for relative_path, file_path in result_files.items():
+            stat = file_path.stat()
+            if self.file_stats.get(relative_path) != (stat.st_size, stat.st_mtime_ns):
+                self._drop_file(relative_path)
+                self._scan_file(relative_path, file_path)
+                needs_rewrite = True
+
+        if needs_rewrite:
+            self.rewrite()
+
+    def _apply(self, record: dict) -> None:
+        if record["type"] == "file":
+            self.file_stats[record["file"]] = (record["size"], record.get("mtime_ns"))
+        else:
+            self.entries[record["id"]] = record
+
+    def _drop_file(self, relative_path: str) -> None:
+        self.file_stats.pop(relative_path, None)
+        self.entries = {
+            entry_id: record
+            for entry_id, record in self.entries.items()
+            if record["file"] != relative_path
+        }
+
+    def _scan_file(self, relative_path: str, file_path: Path) -> None:
+        """Index a result file by parsing it. This is the only place where the manifest reads result entries."""
+        offset = 0
+        with open(file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        entries = [json.loads(line)]
+                        concatenated = False
+                    except json.JSONDecodeError:
+                        # Several JSON objects concatenated on one line, see `load_file`
+                        entries = load_concatenated_json_line(line.decode())
+                        concatenated = True
+                    for entry in entries:
+                        record = self.make_record(
+                            relative_path, entry, line.rstrip(b"\n"), offset
+                        )
+                        if concatenated:
+                            record["concatenated"] = True
+                        self.entries[entry["id"]] = record
+                offset += len(line)
+        self.file_stats[relative_path] = (offset, self._mtime_if_written(relative_path, offset))
+
+    @staticmethod
+    def make_record(relative_path: str, entry: dict, line: bytes, offset: int) -> dict:
+        return {
+            "type": "entry",
+            "id": entry["id"],
+            "file": relative_path,
+            "offset": offset,
+            "length": len(line),
+            "hash": hashlib.sha256(line).hexdigest(),
+            "status": get_entry_status(entry),
+        }
+
+    def relative_path(self, file_path: Path) -> str:
+        return file_path.relative_to(self.model_result_dir).as_posix()
+
+    def _mtime_if_written(self, relative_path: str, file_size: int) -> Optional[int]:
+        """The mtime of a result file, or None if it does not have the expected size on disk yet (e.g. buffered writes)."""
+        try:
+            stat = (self.model_result_dir / relative_path).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns if stat.st_size == file_size else None
+
+    def _file_record(self, relative_path: str) -> dict:
+        size, mtime_ns = self.file_stats[relative_path]
+        return {"type": "file", "file": relative_path, "size": size, "mtime_ns": mtime_ns}
+
+    def record(self, relative_path: str, records: list[dict], file_size: int) -> None:
+        """Add entry records for a result file, along with the new size (and mtime, once written) of that file."""
+        for record in records:
+            self._apply(record)
+        self.file_stats[relative_path] = (file_size, self._mtime_if_written(relative_path, file_size))
+        file_record = self._file_record(relative_path)
+
+        if self._handle is None:
+            self.model_result_dir.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "ab")
+        self._handle.write(
+            b"".join(
+                (json.dumps(record) + "\n").encode() for record in records + [file_record]
+            )
+        )
+
+    def replace_file(self, relative_path: str, records: list[dict], file_size: int) -> None:
+        self._drop_file(relative_path)
+        self.record(relative_path, records, file_size)
+
+    def sync(self, durability: str) -> None:
+        if self._handle is None or durability == "none":
+            return
+        self._handle.flush()
+        if durability == "fsync":
+            os.fsync(self._handle.fileno())
+
+    def ids(self, status: Optional[str] = None) -> set[str]:
+        return {
+            entry_id
+            for entry_id, record in self.entries.items()
+            if status is None or record["status"] == status
+        }
+
+    def records_for_file(self, relative_path: str) -> list[dict]:
+        return [
+            record for record in self.entries.values() if record["file"] == relative_path
+        ]
+
+    def rewrite(self) -> None:
+        """Rewrite the manifest with only the latest record of each entry and file."""
+        self.close()
+        if not self.model_result_dir.exists():
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            for relative_path, (size, mtime_ns) in self.file_stats.items():
+                if mtime_ns is None:
+                    # Writes that were still buffered when recorded have reached the file by now
+                    self.file_stats[relative_path] = (size, self._mtime_if_written(relative_path, size))
+                f.write(json.dumps(self._file_record(relative_path)) + "\n")
+            for record in self.entries.values():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class ResultWriter:
+    """
+    Group-commit writer for the result files of one model.
+
+    Entries are buffered and committed in batches, either when `batch_size` entries are pending
+    or when the oldest pending entry has waited `batch_window` seconds (see `should_commit`).
+    In append mode, one file handle per test category is kept open for the whole run.
+    In update mode, committed entries are appended to an `UpdateLog` per result file instead.
+    Every committed line is recorded in the model's `ResultManifest`.
+
+    When the writer is closed, each result file it touched is compacted once: the latest version of every entry
+    (from the result file or the update log) is written out sorted by id, copying the unchanged lines as raw bytes
+    located through the manifest, and duplicates are dropped.
+
+    Not thread-safe; the generation pipeline drives it from a single writer thread.
+    """
+
+    def __init__(
+        self,
+        model_result_dir: Path,
+        update_mode: bool = False,
+        durability: str = "flush",
+        batch_size: int = RESULT_WRITE_BATCH_SIZE,
+        batch_window: float = RESULT_WRITE_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Invalid durability policy '{durability}'. Choose from {DURABILITY_POLICIES}."
+            )
+        self.model_result_dir = model_result_dir
+        self.update_mode = update_mode
+        self.durability = durability
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+
+        self._pending: dict[Path, list[tuple[dict, bytes]]] = {}  # result file path -> (entry, serialized entry)
+        self._pending_count = 0
+        self._oldest_pending_time: Optional[float] = None
+        self._file_paths: dict[str, Path] = {}  # test category -> result file path
+        self._handles: dict[Path, BinaryIO] = {}
+        self._update_logs: dict[Path, UpdateLog] = {}
+        self.manifest = ResultManifest(model_result_dir)
+
+        self._recover_update_logs()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def get_result_file_path(self, test_entry_id: str) -> Path:
+        test_category = extract_test_category_from_id(test_entry_id)
+        if test_category not in self._file_paths:
+            # Determine the high-level grouping folder (non_live, live, etc.)
+            group_dir_path = self.model_result_dir / get_directory_structure_by_id(
+                test_entry_id
+            )
+            group_dir_path.mkdir(parents=True, exist_ok=True)
+            self._file_paths[test_category] = (
+                group_dir_path / f"{VERSION_PREFIX}_{test_category}_result.json"
+            )
+        return self._file_paths[test_category]
+
+    def write(self, result: Union[dict, list[dict]]) -> None:
+        """Buffer one or more entries, and commit the batch if it is full."""
+        if isinstance(result, dict):
+            result = [result]
+
+        for entry in result:
+            # Serialize right away, so that the pending batch holds a snapshot of the entry
+            file_path = self.get_result_file_path(entry["id"])
+            self._pending.setdefault(file_path, []).append((entry, serialize_to_json(entry)))
+            self._pending_count += 1
+
+        if self._oldest_pending_time is None and self._pending_count > 0:
+            self._oldest_pending_time = time.monotonic()
+
+        if self._pending_count >= self.batch_size:
+            self.commit()
+
+    def time_until_commit(self) -> Optional[float]:
+        """Seconds until the pending batch is due, or None if nothing is pending."""
+        if self._oldest_pending_time is None:
+            return None
+        return max(
+            0.0, self._oldest_pending_time + self.batch_window - time.monotonic()
+        )
+
+    def should_commit(self) -> bool:
+        remaining = self.time_until_commit()
+        return remaining is not None and remaining <= 0
+
+    def commit(self) -> None:
+        """Write all pending entries to their result files and apply the durability policy."""
+        for file_path, entries in self._pending.items():
+            if self.update_mode:
+                update_log = self._get_update_log(file_path)
+                update_log.append(entries)
+                update_log.sync(self.durability)
+            else:
+                # Note: We will sort all the entries when the writer is closed to ensure the order is consistent
+                entries.sort(key=lambda pending_entry: sort_key(pending_entry[0]))
+                handle = self._get_handle(file_path)
+                relative_path = self.manifest.relative_path(file_path)
+                offset = handle.tell()
+                lines, records = [], []
+                for entry, line in entries:
+                    records.append(
+                        self.manifest.make_record(relative_path, entry, line, offset)
+                    )
+                    lines.append(line + b"\n")
+                    offset += len(line) + 1
+                handle.write(b"".join(lines))
+                self._sync(handle)
+                self.manifest.record(relative_path, records, offset)
+
+        self.manifest.sync(self.durability)
+
+        self._pending = {}
+        self._pending_count = 0
+        self._oldest_pending_time = None
+
+    def close(self) -> None:
+        self.commit()
+        touched_files = set(self._handles) | set(self._update_logs)
+        for handle in self._handles.values():
+            # Whatever the policy, the data must reach the OS before we let go of the handle
+            handle.flush()
+            if self.durability == "fsync":
+                os.fsync(handle.fileno())
+            handle.close()
+        self._handles = {}
+
+        for file_path in touched_files:
+            self._compact(file_path, self._update_logs.pop(file_path, None))
+        self.manifest.rewrite()
+
+    def _get_handle(self, file_path: Path) -> BinaryIO:
+        if file_path not in self._handles:
+            self._handles[file_path] = open(file_path, "ab")
+        return self._handles[file_path]
+
+    def _sync(self, handle: BinaryIO) -> None:
+        if self.durability == "none":
+            return
+        handle.flush()
+        if self.durability == "fsync":
+            os.fsync(handle.fileno())
+
+    def _get_update_log(self, file_path: Path) -> UpdateLog:
+        if file_path not in self._update_logs:
+            self._update_logs[file_path] = UpdateLog(file_path)
+        return self._update_logs[file_path]
+
+    def _recover_update_logs(self) -> None:
+        """
+        Pick up the update logs left over by an interrupted update-mode run.
+        In update mode they are compacted together with this run's updates; otherwise they are compacted right away,
+        before anything is appended to the result files.
+        """
+        if not self.model_result_dir.exists():
+            return
+        for log_path in self.model_result_dir.rglob(f"*{UPDATE_LOG_SUFFIX}"):
+            file_path = log_path.with_name(log_path.name[: -len(UPDATE_LOG_SUFFIX)])
+            if self.update_mode:
+                self._get_update_log(file_path)
+            else:
+                self._compact(file_path, UpdateLog(file_path))
+        if not self.update_mode:
+            self.manifest.rewrite()
+
+    def _compact(self, file_path: Path, update_log: Optional[UpdateLog]) -> None:
+        """
+        Rewrite a result file sorted by id, with the latest version of each entry and without duplicates.
+        Only the updated entries are serialized; the other lines are copied as raw bytes.
+        The file is left untouched if it is already in order and there is nothing to merge.
+        """
+        relative_path = self.manifest.relative_path(file_path)
+        records = {record["id"]: record for record in self.manifest.records_for_file(relative_path)}
+        updated_entries = update_log.latest_entries() if update_log is not None else {}
+
+        sorted_ids = sorted(
+            set(records) | set(updated_entries),
+            key=lambda entry_id: sort_key({"id": entry_id}),
+        )
+        file_size = file_path.stat().st_size if file_path.exists() else 0
+        offsets = [records[entry_id]["offset"] for entry_id in sorted_ids if entry_id in records]
+        already_compact = (
+            not updated_entries
+            and all(a < b for a, b in zip(offsets, offsets[1:]))
+            # No duplicate or concatenated lines: the live lines cover the whole file
+            and sum(record["length"] + 1 for record in records.values()) == file_size
+        )
+
+        if not already_compact:
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
+            new_records = []
+            offset = 0
+            with open(tmp_path, "wb") as output, open(
+                file_path if file_path.exists() else os.devnull, "rb"
+            ) as source:
+                for entry_id in sorted_ids:
+                    if entry_id in updated_entries:
+                        entry = updated_entries[entry_id]
+                        line = serialize_to_json(entry)
+                        record = self.manifest.make_record(relative_path, entry, line, offset)
+                    else:
+                        record = dict(records[entry_id], offset=offset)
+                        source.seek(records[entry_id]["offset"])
+                        line = source.read(records[entry_id]["length"])
+                        if record.pop("concatenated", False):
+                            entry = next(
+                                entry
+                                for entry in load_concatenated_json_line(line.decode())
+                                if entry["id"] == entry_id
+                            )
+                            line = serialize_to_json(entry)
+                            record.update(
+                                length=len(line), hash=hashlib.sha256(line).hexdigest()
+                            )
+                    output.write(line + b"\n")
+                    new_records.append(record)
+                    offset += len(line) + 1
+                output.flush()
+                os.fsync(output.fileno())
+            os.replace(tmp_path, file_path)
+            self.manifest.replace_file(relative_path, new_records, offset)
+
+        if update_log is not None:
+            update_log.remove()
@@ -0,0 +1,64 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# SQLite limits the number of host parameters in one statement
+_MAX_KEYS_PER_QUERY = 500
+
+
+class SQLiteCache:
+    """
+    Key-value table of a local SQLite database, the storage of the response, ground truth trace and embedding caches.
+
+    A single connection is shared by all the threads of the process, serialized by `_lock`; concurrent processes
+    (e.g. evaluation workers) share the database file through WAL mode. Values are raw bytes: subclasses own the encoding.
+    With `durable=False`, the last few writes may be lost on a power failure, for values that are cheap to compute again.
+    """
+
+    def __init__(self, path: Path, table_name: str, durable: bool = True) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._table_name = table_name
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            if not durable:
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} (key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def get_value(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self._table_name} WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get_values(self, keys: list[str]) -> dict[str, bytes]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[start : start + _MAX_KEYS_PER_QUERY]
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM {self._table_name} WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_values(self, values: dict[str, bytes]) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self._table_name} (key, value, created_at) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in values.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -4,6 +4,8 @@ from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 
 LOCAL_SERVER_PORT = 1053
 LOCAL_SERVER_MAX_CONCURRENT_REQUEST = 100
+# With `--adaptive-concurrency` and no `--num-threads`, a locally hosted model starts at this fraction of `--max-concurrency`
+ADAPTIVE_CONCURRENCY_INITIAL_FRACTION = 0.25
 
 # Price got from Lambda Cloud, 23.92 per hour for 8x H100, on-demand pay as you go total price
 # Reference: https://lambda.ai/pricing
@@ -21,6 +23,15 @@ PROJECT_ROOT = Path(os.getenv("BFCL_PROJECT_ROOT", Path(__file__).resolve().pare
 
 RESULT_PATH = PROJECT_ROOT / "result"
 SCORE_PATH = PROJECT_ROOT / "score"
+RESPONSE_CACHE_PATH = PROJECT_ROOT / "response_cache" / "responses.sqlite"
+# Ground truth execution traces of the multi-turn entries, shared by all the models being evaluated
+GROUND_TRUTH_TRACE_CACHE_PATH = PROJECT_ROOT / "ground_truth_cache" / "multi_turn_traces.sqlite"
+# Embeddings computed by the vector memory backend, shared by all the runs
+EMBEDDING_CACHE_PATH = PROJECT_ROOT / "embedding_cache" / "embeddings.sqlite"
+# Processed dataset entries and the per-category catalog of entry ids, see `_dataset_cache.py`
+DATASET_CACHE_PATH = PROJECT_ROOT / "dataset_cache"
+# Recorded web search and page fetch responses of the web search backend, see `web_search_transport.py`
+WEB_SEARCH_CACHE_PATH = PROJECT_ROOT / "web_search_cache"
 DOTENV_PATH = PROJECT_ROOT / ".env"
 TEST_IDS_TO_GENERATE_PATH = PROJECT_ROOT / "test_case_ids_to_generate.json"
 
@@ -32,6 +43,16 @@ UTILS_PATH = PACKAGE_ROOT / "scripts"
 FORMAT_SENSITIVITY_IDS_PATH = PROMPT_PATH / f"{VERSION_PREFIX}_format_sensitivity.json"
 
 RESULT_FILE_PATTERN = f"{VERSION_PREFIX}_*_result.json"
+# With `bfcl evaluate --workers`, the entries of the multi-turn and agentic categories are checked in chunks of this size
+EVAL_CHUNK_SIZE = 20
+# The generation writer commits result entries in batches, when this many entries are pending
+# or when the oldest pending entry has waited this long, whichever comes first
+RESULT_WRITE_BATCH_SIZE = 64
+RESULT_WRITE_BATCH_WINDOW_SECONDS = 1.0
+# Per-model index of the result entries (file, offset, hash, status), kept next to the result files
+RESULT_MANIFEST_FILE_NAME = "result_manifest.jsonl"
+# Per-model file (in the model's result folder) recording the settings and concurrency history of each generation run, one JSON line per run
+RUN_METADATA_FILE_NAME = "generation_run_metadata.jsonl"
 
 RED_FONT = "\033[91m"
 RESET = "\033[0m"
@@ -1,69 +1,65 @@
+import importlib
 from dataclasses import dataclass
 from typing import Optional
 
-from bfcl_eval.model_handler.api_inference.claude import ClaudeHandler
-from bfcl_eval.model_handler.api_inference.cohere import CohereHandler
-from bfcl_eval.model_handler.api_inference.deepseek import DeepSeekAPIHandler, DeepSeekInternalAPIHandler
-from bfcl_eval.model_handler.api_inference.dm_cito import DMCitoHandler
-from bfcl_eval.model_handler.api_inference.fireworks import FireworksHandler
-from bfcl_eval.model_handler.api_inference.functionary import FunctionaryHandler
-from bfcl_eval.model_handler.api_inference.gemini import GeminiHandler
-from bfcl_eval.model_handler.api_inference.glm import GLMAPIHandler, GLMAPILocalHandler
-from bfcl_eval.model_handler.api_inference.gogoagent import GoGoAgentHandler
-from bfcl_eval.model_handler.api_inference.gorilla import GorillaHandler
-from bfcl_eval.model_handler.api_inference.grok import GrokHandler
-from bfcl_eval.model_handler.api_inference.kimi import KimiHandler
-from bfcl_eval.model_handler.api_inference.ling import LingAPIHandler
-from bfcl_eval.model_handler.api_inference.mining import MiningHandler
-from bfcl_eval.model_handler.api_inference.mistral import MistralHandler
-from bfcl_eval.model_handler.api_inference.nemotron import NemotronHandler
-from bfcl_eval.model_handler.api_inference.nova import NovaHandler
-from bfcl_eval.model_handler.api_inference.novita import NovitaHandler
-from bfcl_eval.model_handler.api_inference.nvidia import NvidiaHandler
-from bfcl_eval.model_handler.api_inference.openai_completion import (
-    OpenAICompletionsHandler,
-)
-from bfcl_eval.model_handler.api_inference.openai_response import OpenAIResponsesHandler
-from bfcl_eval.model_handler.api_inference.qwen import (
-    QwenAgentNoThinkHandler,
-    QwenAgentThinkHandler,
-    QwenAPIHandler,
-)
-from bfcl_eval.model_handler.api_inference.writer import WriterHandler
-from bfcl_eval.model_handler.local_inference.arch import ArchHandler
-from bfcl_eval.model_handler.local_inference.bielik import BielikHandler
-from bfcl_eval.model_handler.local_inference.bitagent import BitAgentHandler
-from bfcl_eval.model_handler.local_inference.deepseek_reasoning import (
-    DeepseekReasoningHandler,
-)
-from bfcl_eval.model_handler.local_inference.falcon_fc import Falcon3FCHandler
-from bfcl_eval.model_handler.local_inference.gemma import GemmaHandler
-from bfcl_eval.model_handler.local_inference.glm import GLMHandler
-from bfcl_eval.model_handler.local_inference.granite import (
-    GraniteFunctionCallingHandler,
-)
-from bfcl_eval.model_handler.api_inference.gpt_oss import GPTOSSInternalAPIHandler
-from bfcl_eval.model_handler.local_inference.granite_3 import Granite3FCHandler
-from bfcl_eval.model_handler.local_inference.hammer import HammerHandler
-from bfcl_eval.model_handler.local_inference.llama import LlamaHandler
-from bfcl_eval.model_handler.local_inference.llama_3_1 import LlamaHandler_3_1
-from bfcl_eval.model_handler.local_inference.minicpm import MiniCPMHandler
-from bfcl_eval.model_handler.local_inference.minicpm_fc import MiniCPMFCHandler
-from bfcl_eval.model_handler.local_inference.mistral_fc import MistralFCHandler
-from bfcl_eval.model_handler.local_inference.phi import PhiHandler
-from bfcl_eval.model_handler.local_inference.phi_fc import PhiFCHandler
-from bfcl_eval.model_handler.local_inference.quick_testing_oss import (
-    QuickTestingOSSHandler,
-)
-from bfcl_eval.model_handler.local_inference.qwen import QwenHandler
-from bfcl_eval.model_handler.local_inference.qwen_fc import QwenFCHandler
-from bfcl_eval.model_handler.local_inference.salesforce_llama import (
-    SalesforceLlamaHandler,
-)
-from bfcl_eval.model_handler.local_inference.salesforce_qwen import (
-    SalesforceQwenHandler,
-)
-from bfcl_eval.model_handler.local_inference.think_agent import ThinkAgentHandler
+API_HANDLER_PATH_PREFIX = "bfcl_eval.model_handler.api_inference"
+LOCAL_HANDLER_PATH_PREFIX = "bfcl_eval.model_handler.local_inference"
+
+# Module of each model handler class. A handler (and the vendor SDK it uses) is only imported
+# when a model that uses it is run, see `ModelConfig.get_handler_class`.
+HANDLER_FILE_PATH_MAPPING = {
+    "ClaudeHandler": f"{API_HANDLER_PATH_PREFIX}.claude",
+    "CohereHandler": f"{API_HANDLER_PATH_PREFIX}.cohere",
+    "DeepSeekAPIHandler": f"{API_HANDLER_PATH_PREFIX}.deepseek",
+    "DeepSeekInternalAPIHandler": f"{API_HANDLER_PATH_PREFIX}.deepseek",
+    "DMCitoHandler": f"{API_HANDLER_PATH_PREFIX}.dm_cito",
+    "FireworksHandler": f"{API_HANDLER_PATH_PREFIX}.fireworks",
+    "FunctionaryHandler": f"{API_HANDLER_PATH_PREFIX}.functionary",
+    "GeminiHandler": f"{API_HANDLER_PATH_PREFIX}.gemini",
+    "GLMAPIHandler": f"{API_HANDLER_PATH_PREFIX}.glm",
+    "GLMAPILocalHandler": f"{API_HANDLER_PATH_PREFIX}.glm",
+    "GoGoAgentHandler": f"{API_HANDLER_PATH_PREFIX}.gogoagent",
+    "GorillaHandler": f"{API_HANDLER_PATH_PREFIX}.gorilla",
+    "GPTOSSInternalAPIHandler": f"{API_HANDLER_PATH_PREFIX}.gpt_oss",
+    "GrokHandler": f"{API_HANDLER_PATH_PREFIX}.grok",
+    "KimiHandler": f"{API_HANDLER_PATH_PREFIX}.kimi",
+    "LingAPIHandler": f"{API_HANDLER_PATH_PREFIX}.ling",
+    "MiningHandler": f"{API_HANDLER_PATH_PREFIX}.mining",
+    "MistralHandler": f"{API_HANDLER_PATH_PREFIX}.mistral",
+    "NemotronHandler": f"{API_HANDLER_PATH_PREFIX}.nemotron",
+    "NovaHandler": f"{API_HANDLER_PATH_PREFIX}.nova",
+    "NovitaHandler": f"{API_HANDLER_PATH_PREFIX}.novita",
+    "NvidiaHandler": f"{API_HANDLER_PATH_PREFIX}.nvidia",
+    "OpenAICompletionsHandler": f"{API_HANDLER_PATH_PREFIX}.openai_completion",
+    "OpenAIResponsesHandler": f"{API_HANDLER_PATH_PREFIX}.openai_response",
+    "QwenAPIHandler": f"{API_HANDLER_PATH_PREFIX}.qwen",
+    "QwenAgentNoThinkHandler": f"{API_HANDLER_PATH_PREFIX}.qwen",
+    "QwenAgentThinkHandler": f"{API_HANDLER_PATH_PREFIX}.qwen",
+    "WriterHandler": f"{API_HANDLER_PATH_PREFIX}.writer",
+    "ArchHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.arch",
+    "BielikHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.bielik",
+    "BitAgentHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.bitagent",
+    "DeepseekReasoningHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.deepseek_reasoning",
+    "Falcon3FCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.falcon_fc",
+    "GemmaHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.gemma",
+    "GLMHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.glm",
+    "GraniteFunctionCallingHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.granite",
+    "Granite3FCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.granite_3",
+    "HammerHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.hammer",
+    "LlamaHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.llama",
+    "LlamaHandler_3_1": f"{LOCAL_HANDLER_PATH_PREFIX}.llama_3_1",
+    "MiniCPMHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.minicpm",
+    "MiniCPMFCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.minicpm_fc",
+    "MistralFCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.mistral_fc",
+    "PhiHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.phi",
+    "PhiFCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.phi_fc",
+    "QuickTestingOSSHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.quick_testing_oss",
+    "QwenHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.qwen",
+    "QwenFCHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.qwen_fc",
+    "SalesforceLlamaHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.salesforce_llama",
+    "SalesforceQwenHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.salesforce_qwen",
+    "ThinkAgentHandler": f"{LOCAL_HANDLER_PATH_PREFIX}.think_agent",
+}
 
 # -----------------------------------------------------------------------------
 # A mapping of model identifiers to their respective model configurations.
@@ -84,7 +80,7 @@ class ModelConfig:
         url (str): Reference URL for the model or hosting service.
         org (str): Organization providing the model.
         license (str): License under which the model is released.
-        model_handler (str): Handler name for invoking the model.
+        model_handler (str): Name of the handler class for invoking the model, as listed in `HANDLER_FILE_PATH_MAPPING`.
         input_price (Optional[float]): USD per million input tokens (None for open source models).
         output_price (Optional[float]): USD per million output tokens (None for open source models).
         is_fc_model (bool): True if this model is used in Function-Calling mode, otherwise False for Prompt-based mode.
@@ -110,6 +106,11 @@ class ModelConfig:
     # True if this model does not allow '.' in function names
     underscore_to_dot: bool = False
 
+    def get_handler_class(self) -> type:
+        """Import and return the handler class named by `model_handler`."""
+        module = importlib.import_module(HANDLER_FILE_PATH_MAPPING[self.model_handler])
+        return getattr(module, self.model_handler)
+
 
 # Inference through API calls
 api_inference_model_map = {
@@ -119,7 +120,7 @@ api_inference_model_map = {
         url="https://gorilla.cs.berkeley.edu/blogs/7_open_functions_v2.html",
         org="Gorilla LLM",
         license="Apache 2.0",
-        model_handler=GorillaHandler,
+        model_handler="GorillaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -131,7 +132,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-oss/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=GPTOSSInternalAPIHandler,
+        model_handler="GPTOSSInternalAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -143,7 +144,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekInternalAPIHandler,
+        model_handler="DeepSeekInternalAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -155,7 +156,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -167,7 +168,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -179,7 +180,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250325",
         org="DeepSeek",
         license="DeepSeek License",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -191,7 +192,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=1.25,
         output_price=10,
         is_fc_model=True,
@@ -203,7 +204,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=1.25,
         output_price=10,
         is_fc_model=False,
@@ -215,7 +216,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=True,
@@ -227,7 +228,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=False,
@@ -239,7 +240,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=True,
@@ -251,7 +252,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=False,
@@ -263,7 +264,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -275,7 +276,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -287,7 +288,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=True,
@@ -299,7 +300,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=False,
@@ -311,7 +312,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -323,7 +324,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -335,7 +336,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=False,
@@ -347,7 +348,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -359,7 +360,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=False,
@@ -371,7 +372,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=True,
@@ -383,7 +384,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -395,7 +396,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -407,7 +408,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=False,
@@ -419,7 +420,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=True,
@@ -431,7 +432,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=False,
@@ -443,7 +444,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=True,
@@ -455,7 +456,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -467,7 +468,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -479,7 +480,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=False,
@@ -491,7 +492,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=True,
@@ -503,7 +504,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="NovaHandler",
         input_price=0.8,
         output_price=3.2,
         is_fc_model=True,
@@ -515,7 +516,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="NovaHandler",
         input_price=0.06,
         output_price=0.24,
         is_fc_model=True,
@@ -527,7 +528,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="NovaHandler",
         input_price=0.035,
         output_price=0.14,
         is_fc_model=True,
@@ -539,7 +540,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=False,
@@ -551,7 +552,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=True,
@@ -563,7 +564,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=False,
@@ -575,7 +576,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=True,
@@ -587,7 +588,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=False,
@@ -599,7 +600,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=True,
@@ -611,7 +612,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=False,
@@ -623,7 +624,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=True,
@@ -635,7 +636,7 @@ api_inference_model_map = {
         url="https://huggingface.co/fireworks-ai/firefunction-v2",
         org="Fireworks",
         license="Apache 2.0",
-        model_handler=FireworksHandler,
+        model_handler="FireworksHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -647,7 +648,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -659,7 +660,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -671,7 +672,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -683,7 +684,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=False,
@@ -695,7 +696,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=True,
@@ -707,7 +708,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=False,
@@ -719,7 +720,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-small-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -731,7 +732,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-medium-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -743,7 +744,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-r7b",
         org="Cohere",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler="CohereHandler",
         input_price=0.0375,
         output_price=0.15,
         is_fc_model=True,
@@ -755,7 +756,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="CohereHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -767,7 +768,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a-reasoning",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="CohereHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -779,7 +780,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/Llama-3_1-Nemotron-Ultra-253B-v1",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NemotronHandler,
+        model_handler="NemotronHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -791,7 +792,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/nemotron-4-340b-instruct",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NvidiaHandler,
+        model_handler="NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -803,7 +804,7 @@ api_inference_model_map = {
         url="https://gogoagent.ai",
         org="BitAgent",
         license="Proprietary",
-        model_handler=GoGoAgentHandler,
+        model_handler="GoGoAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -815,7 +816,7 @@ api_inference_model_map = {
         url="https://writer.com/engineering/actions-with-palmyra-x-004/",
         org="Writer",
         license="Proprietary",
-        model_handler=WriterHandler,
+        model_handler="WriterHandler",
         input_price=5,
         output_price=12,
         is_fc_model=True,
@@ -827,7 +828,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -839,7 +840,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -851,7 +852,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -863,7 +864,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -875,7 +876,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -887,7 +888,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -899,7 +900,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -911,7 +912,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -923,7 +924,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -935,7 +936,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -947,7 +948,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -959,7 +960,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -971,7 +972,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -983,7 +984,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -995,7 +996,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1007,7 +1008,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1019,7 +1020,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1031,7 +1032,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1043,7 +1044,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1055,7 +1056,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1067,7 +1068,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=MiningHandler,
+        model_handler="MiningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1079,7 +1080,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1091,7 +1092,7 @@ api_inference_model_map = {
         url="https://huggingface.co/inclusionAI/Ling-lite-1.5",
         org="Ling",
         license="MIT",
-        model_handler=LingAPIHandler,
+        model_handler="LingAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1103,7 +1104,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.6",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPILocalHandler,
+        model_handler="GLMAPILocalHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1115,7 +1116,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPILocalHandler,
+        model_handler="GLMAPILocalHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1127,7 +1128,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1139,7 +1140,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5-Air",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1151,7 +1152,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1163,7 +1164,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1179,7 +1180,7 @@ local_inference_model_map = {
         url="https://huggingface.co/deepseek-ai/DeepSeek-R1",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepseekReasoningHandler,
+        model_handler="DeepseekReasoningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1191,7 +1192,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1203,7 +1204,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1215,7 +1216,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1227,7 +1228,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1239,7 +1240,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1251,7 +1252,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1263,7 +1264,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1275,7 +1276,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1287,7 +1288,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1299,7 +1300,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1311,7 +1312,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1323,7 +1324,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1335,7 +1336,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1347,7 +1348,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-70b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1359,7 +1360,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-8b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1371,7 +1372,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-32b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1383,7 +1384,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-3b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1395,7 +1396,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-1b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1407,7 +1408,7 @@ local_inference_model_map = {
         url="https://huggingface.co/mistralai/Ministral-8B-Instruct-2410",
         org="Mistral AI",
         license="Mistral AI Research License",
-        model_handler=MistralFCHandler,
+        model_handler="MistralFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1419,7 +1420,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/phi-4",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1431,7 +1432,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1443,7 +1444,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiFCHandler,
+        model_handler="PhiFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1455,7 +1456,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.2-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1467,7 +1468,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.1-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1479,7 +1480,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-20b-functioncalling",
         org="IBM",
         license="Apache-2.0",
-        model_handler=GraniteFunctionCallingHandler,
+        model_handler="GraniteFunctionCallingHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1491,7 +1492,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-7b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1503,7 +1504,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-3b",
         org="MadeAgents",
         license="qwen-research",
-        model_handler=HammerHandler,
+        model_handler="HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1515,7 +1516,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-1.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1527,7 +1528,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-0.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1539,7 +1540,7 @@ local_inference_model_map = {
         url="https://huggingface.co/THUDM/glm-4-9b-chat",
         org="THUDM",
         license="glm-4",
-        model_handler=GLMHandler,
+        model_handler="GLMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1551,7 +1552,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1563,7 +1564,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1575,7 +1576,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1587,7 +1588,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1599,7 +1600,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1611,7 +1612,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1623,7 +1624,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1635,7 +1636,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1647,7 +1648,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1659,7 +1660,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1671,7 +1672,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1683,7 +1684,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1695,7 +1696,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1707,7 +1708,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1719,7 +1720,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1731,7 +1732,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1743,7 +1744,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Team-ACE/ToolACE-2-8B",
         org="Huawei Noah & USTC",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1755,7 +1756,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMHandler,
+        model_handler="MiniCPMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1767,7 +1768,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMFCHandler,
+        model_handler="MiniCPMFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1779,7 +1780,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-8B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1791,7 +1792,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-70B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1803,7 +1804,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ZJared/Haha-7B",
         org="TeleAI",
         license="Apache 2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1815,7 +1816,7 @@ local_inference_model_map = {
         url="https://huggingface.co/speakleash/Bielik-11B-v2.3-Instruct",
         org="SpeakLeash & ACK Cyfronet AGH",
         license="Apache 2.0",
-        model_handler=BielikHandler,
+        model_handler="BielikHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1827,7 +1828,7 @@ local_inference_model_map = {
         url="https://huggingface.co/NovaSky-AI/Sky-T1-32B-Preview",
         org="NovaSky-AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1839,7 +1840,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-10B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1851,7 +1852,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-7B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1863,7 +1864,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-3B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1875,7 +1876,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-1B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1887,7 +1888,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-8B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1899,7 +1900,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-70B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1911,7 +1912,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-405B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1923,7 +1924,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-1.5B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1935,7 +1936,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-3B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1947,7 +1948,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-7B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1959,7 +1960,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-32B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1971,7 +1972,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-8B/",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1983,7 +1984,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-Bounty-8B",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=BitAgentHandler,
+        model_handler="BitAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1995,7 +1996,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ThinkAgents/ThinkAgent-1B",
         org="ThinkAgents",
         license="apache-2.0",
-        model_handler=ThinkAgentHandler,
+        model_handler="ThinkAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2007,7 +2008,7 @@ local_inference_model_map = {
         url="https://huggingface.co/phronetic-ai/RZN-T",
         org="Phronetic AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2024,7 +2025,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=False,
@@ -2036,7 +2037,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=True,
@@ -2048,7 +2049,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=False,
@@ -2060,7 +2061,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=True,
@@ -2072,7 +2073,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=True,
@@ -2084,7 +2085,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=False,
@@ -2097,7 +2098,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentThinkHandler,
+        model_handler="QwenAgentThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2109,7 +2110,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentNoThinkHandler,
+        model_handler="QwenAgentNoThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
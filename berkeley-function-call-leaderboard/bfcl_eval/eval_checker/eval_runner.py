@@ -1,6 +1,12 @@
 import argparse
+import multiprocessing as mp
 import statistics
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Optional
 
 from bfcl_eval.constants.enums import Language, ReturnFormat
 from bfcl_eval.constants.eval_config import *
@@ -8,6 +14,9 @@ from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
 from bfcl_eval.eval_checker.agentic_eval.agentic_checker import agentic_checker
 from bfcl_eval.eval_checker.ast_eval.ast_checker import ast_checker
 from bfcl_eval.eval_checker.eval_runner_helper import *
+from bfcl_eval.eval_checker.multi_turn_eval.ground_truth_trace_cache import (
+    set_ground_truth_trace_cache_enabled,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_checker import (
     multi_turn_checker,
     multi_turn_irrelevance_checker,
@@ -24,7 +33,7 @@ from tqdm import tqdm
 
 def get_handler(model_name: str) -> BaseHandler:
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler: BaseHandler = config.model_handler(
+    handler: BaseHandler = config.get_handler_class()(
         model_name=config.model_name,
         temperature=0,
         registry_name=model_name,
@@ -69,6 +78,113 @@ def _subset_entries_by_model_ids(
     return filtered_prompt_entries, filtered_ground_truth_entries
 
 
+# The fields of a result entry that the evaluation reads. The inference log, often the bulk of a result file,
+# is only copied into the score files of the multi-turn and agentic categories, so it is not loaded for the others.
+_RESULT_ENTRY_FIELDS = (
+    "id",
+    "result",
+    "decoded_result",
+    "latency",
+    "input_token_count",
+    "output_token_count",
+)
+
+
+# The fields of a result entry that the cost and latency statistics read
+_COST_LATENCY_FIELDS = ("id", "latency", "input_token_count", "output_token_count")
+
+
+def _load_model_result(model_result_json: Path, test_category: str) -> list[dict]:
+    fields = _RESULT_ENTRY_FIELDS
+    if is_multi_turn(test_category) or is_agentic(test_category):
+        fields += ("inference_log",)
+    return load_file(model_result_json, sort_by_id=True, fields=fields)
+
+
+class _LazyHandler:
+    """
+    Stands in for the model handler, and only builds it (and its API client) the first time a response has to be decoded.
+    Result files generated with `--store-decoded-result` carry the decoded responses, so they never need it.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        self._model_name = model_name
+        self._handler: Optional[BaseHandler] = None
+
+    def get_decoder_version(self) -> str:
+        return MODEL_CONFIG_MAPPING[self._model_name].get_handler_class().get_decoder_version()
+
+    def __getattr__(self, name):
+        if self._handler is None:
+            self._handler = get_handler(self._model_name)
+        return getattr(self._handler, name)
+
+
+def _is_stored_decoding_valid(handler, stored_decoded_result, **decode_params) -> bool:
+    """Whether the decoded result stored at generation time was produced by the current decoder, with the same arguments."""
+    if not isinstance(stored_decoded_result, dict):
+        return False
+    if stored_decoded_result.get("decoder_version") != handler.get_decoder_version():
+        return False
+    return all(
+        stored_decoded_result.get(key) == value for key, value in decode_params.items()
+    )
+
+
+def _decode_ast(
+    handler,
+    model_result_item,
+    return_format: ReturnFormat,
+    has_tool_call_tag: bool,
+    stored_decoded_result: Optional[dict],
+):
+    """`handler.decode_ast`, served from the stored decoded result when it is still valid (including re-raising a decoding error)."""
+    if _is_stored_decoding_valid(
+        handler,
+        stored_decoded_result,
+        return_format=return_format.value,
+        has_tool_call_tag=has_tool_call_tag,
+    ):
+        if "error" in stored_decoded_result:
+            raise Exception(stored_decoded_result["error"])
+        return stored_decoded_result["ast"]
+    return handler.decode_ast(model_result_item, return_format, has_tool_call_tag)
+
+
+def _get_stored_execute_steps(
+    handler, stored_decoded_result: Optional[dict], model_result_list
+) -> Optional[list[list]]:
+    """The per-step decode_execute outputs stored at generation time, if they are still valid and match the shape of the model result."""
+    if not _is_stored_decoding_valid(handler, stored_decoded_result):
+        return None
+    stored_steps = stored_decoded_result.get("execute")
+    if (
+        not isinstance(stored_steps, list)
+        or len(stored_steps) != len(model_result_list)
+        or any(
+            not isinstance(single_turn_model_result_list, list)
+            or len(single_turn_stored_steps) != len(single_turn_model_result_list)
+            for single_turn_stored_steps, single_turn_model_result_list in zip(
+                stored_steps, model_result_list
+            )
+        )
+    ):
+        return None
+    return stored_steps
+
+
+def _decode_execute_step(
+    handler, model_result_item, stored_steps: Optional[list[list]], turn_index, step_index
+) -> list[str]:
+    """`handler.decode_execute` for one step, served from the stored steps when available (including re-raising a decoding error)."""
+    if stored_steps is None:
+        return handler.decode_execute(model_result_item, has_tool_call_tag=False)
+    stored_step = stored_steps[turn_index][step_index]
+    if isinstance(stored_step, dict):
+        raise Exception(stored_step["error"])
+    return stored_step
+
+
 def _evaluate_single_agentic_entry(
     handler: BaseHandler,
     index,
@@ -77,6 +193,7 @@ def _evaluate_single_agentic_entry(
     prompt_entry,
     model_name,
     test_category,
+    stored_decoded_result: Optional[dict] = None,
 ):
     """Helper method to process a single agentic entry."""
     # Remove the function doc from the score file for better readability
@@ -108,12 +225,15 @@ def _evaluate_single_agentic_entry(
     # decode_execute returns a list of strings
     model_result_list_decoded: list[list[str]] = []
     last_unsuccessful_decoding_message = None
+    stored_steps = _get_stored_execute_steps(
+        handler, stored_decoded_result, model_result_list
+    )
 
-    for model_result_item in model_result_list[0]:
+    for step_index, model_result_item in enumerate(model_result_list[0]):
         # model_result_item is per step
         try:
-            decoded_result: list[str] = handler.decode_execute(
-                model_result_item, has_tool_call_tag=False
+            decoded_result: list[str] = _decode_execute_step(
+                handler, model_result_item, stored_steps, 0, step_index
             )
             if is_empty_execute_response(decoded_result):
                 last_unsuccessful_decoding_message = model_result_item
@@ -171,6 +291,7 @@ def _evaluate_single_multi_turn_entry(
     prompt_entry,
     model_name,
     test_category,
+    stored_decoded_result: Optional[dict] = None,
 ):
     """Helper method to process a single multi-turn entry."""
     # Remove the function doc from the score file for better readability
@@ -216,14 +337,18 @@ def _evaluate_single_multi_turn_entry(
 
     # decode_execute returns a list of strings
     multi_turn_model_result_list_decoded: list[list[list[str]]] = []
+    # Decoded at generation time, if the result file has them and the decoder did not change since
+    stored_steps = _get_stored_execute_steps(
+        handler, stored_decoded_result, model_result_list
+    )
     # Try decoding the model results into executable function calls
-    for single_turn_model_result_list in model_result_list:
+    for turn_index, single_turn_model_result_list in enumerate(model_result_list):
         single_turn_model_result_list_decoded = []
-        for model_result_item in single_turn_model_result_list:
+        for step_index, model_result_item in enumerate(single_turn_model_result_list):
             # model_result_item is per step
             try:
-                decoded_result: list[str] = handler.decode_execute(
-                    model_result_item, has_tool_call_tag=False
+                decoded_result: list[str] = _decode_execute_step(
+                    handler, model_result_item, stored_steps, turn_index, step_index
                 )
                 if is_empty_execute_response(decoded_result):
                     # Empty output is not considered as a valid function call
@@ -267,6 +392,7 @@ def _evaluate_single_relevance_entry(
     prompt_entry,
     model_name,
     test_category,
+    stored_decoded_result: Optional[dict] = None,
 ):
     """Helper method to process a single relevance/irrelevance entry."""
     contain_func_call = False
@@ -274,8 +400,12 @@ def _evaluate_single_relevance_entry(
     decode_error = None
 
     try:
-        decoded_result = handler.decode_ast(
-            model_result_item, language=ReturnFormat.PYTHON, has_tool_call_tag=False
+        decoded_result = _decode_ast(
+            handler,
+            model_result_item,
+            ReturnFormat.PYTHON,
+            False,
+            stored_decoded_result,
         )
         # Decode successfully, which means the model output is in valid function call format
         contain_func_call = True
@@ -327,14 +457,19 @@ def _evaluate_single_ast_entry(
     language: Language,
     return_format: ReturnFormat,
     has_tool_call_tag=False,
+    stored_decoded_result: Optional[dict] = None,
 ):
     """Helper method to process a single AST entry."""
     prompt_function = prompt_entry["function"]
 
     try:
         model_result_item_raw = model_result_item
-        model_result_item = handler.decode_ast(
-            model_result_item, return_format, has_tool_call_tag
+        model_result_item = _decode_ast(
+            handler,
+            model_result_item,
+            return_format,
+            has_tool_call_tag,
+            stored_decoded_result,
         )
     except Exception as e:
         return {
@@ -400,6 +535,28 @@ def format_sensitivity_runner(
     test_category,
     score_dir,
 ):
+    result, correct_count, extra_header_fields = _format_sensitivity_entry_results(
+        handler, model_result, prompt, possible_answer, model_name, test_category
+    )
+    return save_eval_results(
+        result,
+        correct_count,
+        model_result,
+        test_category,
+        model_name,
+        score_dir,
+        extra_header_fields=extra_header_fields,
+    )
+
+
+def _format_sensitivity_entry_results(
+    handler: BaseHandler,
+    model_result,
+    prompt,
+    possible_answer,
+    model_name,
+    test_category,
+) -> tuple[list[dict], int, dict]:
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
@@ -446,6 +603,7 @@ def format_sensitivity_runner(
             language=Language.PYTHON,
             return_format=return_format,
             has_tool_call_tag=has_tool_call_tag,
+            stored_decoded_result=model_result[i].get("decoded_result"),
         )
 
         # Update stats for this configuration
@@ -486,15 +644,7 @@ def format_sensitivity_runner(
         **accuracy_by_config,
     }
 
-    return save_eval_results(
-        result,
-        correct_count,
-        model_result,
-        test_category,
-        model_name,
-        score_dir,
-        extra_header_fields=extra_header_fields,
-    )
+    return result, correct_count, extra_header_fields
 
 
 def agentic_runner(
@@ -506,6 +656,22 @@ def agentic_runner(
     test_category,
     score_dir,
 ):
+    result, correct_count = _agentic_entry_results(
+        handler, model_result, prompt, possible_answer, model_name, test_category
+    )
+    return save_eval_results(
+        result, correct_count, model_result, test_category, model_name, score_dir
+    )
+
+
+def _agentic_entry_results(
+    handler: BaseHandler,
+    model_result,
+    prompt,
+    possible_answer,
+    model_name,
+    test_category,
+) -> tuple[list[dict], int]:
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
@@ -526,6 +692,7 @@ def agentic_runner(
             test_entry,
             model_name,
             test_category,
+            stored_decoded_result=model_result[i].get("decoded_result"),
         )
 
         if entry_result["valid"]:
@@ -534,9 +701,7 @@ def agentic_runner(
         entry_result["inference_log"] = model_result[i].get("inference_log", "")
         result.append(entry_result)
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
+    return result, correct_count
 
 
 def multi_turn_runner(
@@ -548,6 +713,22 @@ def multi_turn_runner(
     test_category,
     score_dir,
 ):
+    result, correct_count = _multi_turn_entry_results(
+        handler, model_result, prompt, possible_answer, model_name, test_category
+    )
+    return save_eval_results(
+        result, correct_count, model_result, test_category, model_name, score_dir
+    )
+
+
+def _multi_turn_entry_results(
+    handler: BaseHandler,
+    model_result,
+    prompt,
+    possible_answer,
+    model_name,
+    test_category,
+) -> tuple[list[dict], int]:
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
@@ -568,6 +749,7 @@ def multi_turn_runner(
             test_entry,
             model_name,
             test_category,
+            stored_decoded_result=model_result[i].get("decoded_result"),
         )
 
         if entry_result["valid"]:
@@ -576,14 +758,23 @@ def multi_turn_runner(
             entry_result["inference_log"] = model_result[i].get("inference_log", "")
             result.append(entry_result)
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
+    return result, correct_count
 
 
 def relevance_file_runner(
     handler: BaseHandler, model_result, prompt, model_name, test_category, score_dir
 ):
+    result, correct_count = _relevance_entry_results(
+        handler, model_result, prompt, model_name, test_category
+    )
+    return save_eval_results(
+        result, correct_count, model_result, test_category, model_name, score_dir
+    )
+
+
+def _relevance_entry_results(
+    handler: BaseHandler, model_result, prompt, model_name, test_category
+) -> tuple[list[dict], int]:
     # This function serves for both relevance and irrelevance tests, which share the exact opposite logic.
     # If `test_category` is "irrelevance", the model is expected to output no function call.
     # No function call means either the AST decoding fails (a error message is generated) or the decoded AST does not contain any function call (such as a empty list, `[]`).
@@ -596,7 +787,13 @@ def relevance_file_runner(
         prompt_entry = prompt[i]
 
         entry_result = _evaluate_single_relevance_entry(
-            handler, index, model_result_item, prompt_entry, model_name, test_category
+            handler,
+            index,
+            model_result_item,
+            prompt_entry,
+            model_name,
+            test_category,
+            stored_decoded_result=model_result[i].get("decoded_result"),
         )
 
         if entry_result["valid"]:
@@ -604,9 +801,7 @@ def relevance_file_runner(
         else:
             result.append(entry_result)
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
+    return result, correct_count
 
 
 def ast_file_runner(
@@ -618,6 +813,22 @@ def ast_file_runner(
     model_name,
     score_dir,
 ):
+    result, correct_count = _ast_entry_results(
+        handler, model_result, prompt, possible_answer, test_category, model_name
+    )
+    return save_eval_results(
+        result, correct_count, model_result, test_category, model_name, score_dir
+    )
+
+
+def _ast_entry_results(
+    handler: BaseHandler,
+    model_result,
+    prompt,
+    possible_answer,
+    test_category,
+    model_name,
+) -> tuple[list[dict], int]:
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
@@ -651,6 +862,7 @@ def ast_file_runner(
             language=language,
             return_format=return_format,
             has_tool_call_tag=False,
+            stored_decoded_result=model_result[i].get("decoded_result"),
         )
 
         if entry_result["valid"]:
@@ -658,9 +870,7 @@ def ast_file_runner(
         else:
             result.append(entry_result)
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
+    return result, correct_count
 
 
 #### Main runner function ####
@@ -676,20 +886,19 @@ def evaluate_task(
 ):
     print(f"🔍 Running test: {test_category}")
 
-    record_cost_latency(leaderboard_table, model_name, model_result)
-
     # Find the corresponding prompt entries
     prompt = load_dataset_entry(
         test_category, include_prereq=False, include_language_specific_hint=False
     )
+    extra_header_fields = None
 
     if is_relevance_or_irrelevance(test_category):
         prompt, _ = _subset_entries_by_model_ids(
             model_result, prompt, None, allow_missing=allow_missing
         )
 
-        accuracy, total_count = relevance_file_runner(
-            handler, model_result, prompt, model_name, test_category, score_dir
+        result, correct_count = _relevance_entry_results(
+            handler, model_result, prompt, model_name, test_category
         )
 
     else:
@@ -705,49 +914,81 @@ def evaluate_task(
         )
 
         if is_format_sensitivity(test_category):
-            accuracy, total_count = format_sensitivity_runner(
+            result, correct_count, extra_header_fields = _format_sensitivity_entry_results(
                 handler,
                 model_result,
                 prompt,
                 possible_answer,
                 model_name,
                 test_category,
-                score_dir,
             )
 
         elif is_multi_turn(test_category):
-            accuracy, total_count = multi_turn_runner(
+            result, correct_count = _multi_turn_entry_results(
                 handler,
                 model_result,
                 prompt,
                 possible_answer,
                 model_name,
                 test_category,
-                score_dir,
             )
 
         elif is_agentic(test_category):
-            accuracy, total_count = agentic_runner(
+            result, correct_count = _agentic_entry_results(
                 handler,
                 model_result,
                 prompt,
                 possible_answer,
                 model_name,
                 test_category,
-                score_dir,
             )
         # Single turn test
         else:
-            accuracy, total_count = ast_file_runner(
+            result, correct_count = _ast_entry_results(
                 handler,
                 model_result,
                 prompt,
                 possible_answer,
                 test_category,
                 model_name,
-                score_dir,
             )
 
+    return _record_task_scores(
+        leaderboard_table,
+        model_name,
+        test_category,
+        model_result,
+        result,
+        correct_count,
+        score_dir,
+        extra_header_fields=extra_header_fields,
+    )
+
+
+def _record_task_scores(
+    leaderboard_table,
+    model_name,
+    test_category,
+    model_result,
+    result,
+    correct_count,
+    score_dir,
+    extra_header_fields: dict = None,
+):
+    """
+    Write the score file of one result file from its per-entry results, and add its cost, latency and accuracy to the leaderboard table.
+    Both the serial and the parallel evaluation finish every result file here.
+    """
+    record_cost_latency(leaderboard_table, model_name, model_result)
+    accuracy, total_count = save_eval_results(
+        result,
+        correct_count,
+        model_result,
+        test_category,
+        model_name,
+        score_dir,
+        extra_header_fields=extra_header_fields,
+    )
     record_result(leaderboard_table, model_name, test_category, accuracy, total_count)
 
     print(f"✅ Test completed: {test_category}. 🎯 Accuracy: {accuracy:.2%}")
@@ -756,8 +997,15 @@ def evaluate_task(
 
 
 def runner(
-    model_names, test_categories, result_dir, score_dir, allow_missing: bool = False
+    model_names,
+    test_categories,
+    result_dir,
+    score_dir,
+    allow_missing: bool = False,
+    workers: int = 1,
+    use_ground_truth_cache: bool = True,
 ):
+    set_ground_truth_trace_cache_enabled(use_ground_truth_cache)
 
     # A dictionary to store the evaluation scores.
     # Key is model name, value is a dictionary with keys as test category
@@ -765,31 +1013,74 @@ def runner(
     # TODO: use defaultdict to initialize the leaderboard table
     leaderboard_table = {}
 
-    # Get a list of all entries in the folder
-    entries = result_dir.iterdir()
+    evaluation_jobs = _collect_evaluation_jobs(model_names, test_categories, result_dir)
+
+    if workers > 1:
+        _run_evaluation_jobs_in_parallel(
+            evaluation_jobs,
+            result_dir,
+            score_dir,
+            leaderboard_table,
+            allow_missing=allow_missing,
+            workers=workers,
+            use_ground_truth_cache=use_ground_truth_cache,
+        )
+    else:
+        previous_model_name = None
+        for model_name, test_category, model_result_json in tqdm(
+            evaluation_jobs, desc="Number of result files evaluated"
+        ):
+            if model_name != previous_model_name:
+                print(f"🦍 Model: {model_name}")
+                previous_model_name = model_name
+
+            handler = _LazyHandler(model_name.replace("_", "/"))
+            model_result = _load_model_result(model_result_json, test_category)
+
+            leaderboard_table = evaluate_task(
+                test_category,
+                result_dir,
+                score_dir,
+                model_result,
+                model_name,
+                handler,
+                leaderboard_table,
+                allow_missing=allow_missing,
+            )
+
+    # This function reads all the score files from local folder and updates the
+    # leaderboard table. This is helpful when you only want to run the
+    # evaluation for a subset of models and test categories.
+    update_leaderboard_table_with_local_score_file(leaderboard_table, score_dir)
+    # Write the leaderboard table to a file
+    generate_leaderboard_csv(leaderboard_table, score_dir)
+
+
+def _collect_evaluation_jobs(
+    model_names, test_categories, result_dir
+) -> list[tuple[str, str, Path]]:
+    """
+    List the (model name, test category, result file) triples to evaluate, in a fixed order.
+    The model name is the one of the result subdirectory, i.e. with "_" in place of "/".
+    """
+    evaluation_jobs = []
 
     # Filter out the subdirectories
-    subdirs = [entry for entry in entries if entry.is_dir()]
+    subdirs = sorted(entry for entry in result_dir.iterdir() if entry.is_dir())
 
     # Traverse each subdirectory
-    for subdir in tqdm(subdirs, desc="Number of models evaluated"):
+    for subdir in subdirs:
 
         model_name = subdir.relative_to(result_dir).name
         if model_names is not None and model_name not in model_names:
             continue
 
-        model_name_escaped = model_name.replace("_", "/")
-
-        print(f"🦍 Model: {model_name}")
-
         # Find and process all result JSON files recursively in the subdirectory
-        for model_result_json in subdir.rglob(RESULT_FILE_PATTERN):
+        for model_result_json in sorted(subdir.rglob(RESULT_FILE_PATTERN)):
             test_category = extract_test_category(model_result_json)
             if test_category not in test_categories:
                 continue
 
-            handler = get_handler(model_name_escaped)
-
             # We don't evaluate the following categories in the current iteration of the benchmark
             if (
                 is_chatable(test_category)
@@ -799,28 +1090,200 @@ def runner(
             ):
                 continue
 
-            model_result = load_file(model_result_json, sort_by_id=True)
+            evaluation_jobs.append((model_name, test_category, model_result_json))
 
-            leaderboard_table = evaluate_task(
+    return evaluation_jobs
+
+
+def _run_evaluation_jobs_in_parallel(
+    evaluation_jobs,
+    result_dir,
+    score_dir,
+    leaderboard_table,
+    allow_missing: bool,
+    workers: int,
+    use_ground_truth_cache: bool = True,
+) -> None:
+    """
+    Evaluate the result files in a pool of worker processes.
+
+    Each (model, category) pair is one task; the multi-turn and agentic categories, whose entries are slow to check,
+    are further split into chunks of `EVAL_CHUNK_SIZE` entries, and their score file is written here once all the chunks are done.
+    Workers load the result entries they check from disk; this process only reads the cost and latency fields.
+    Tasks are submitted lazily, at most two per worker ahead of the oldest unfinished one, and their outcome is merged
+    into the leaderboard table in the order of `evaluation_jobs`, so the result is the same as a serial evaluation.
+    """
+    tasks = _iter_evaluation_tasks(evaluation_jobs, result_dir, score_dir, allow_missing)
+    submitted = deque()  # (job, future), in job order
+    # Per-entry results of the chunked result file being merged
+    result, correct_count, chunks_merged = [], 0, 0
+
+    # Some backends (e.g. the memory vector store) are not fork-safe, same as in the generation pipeline
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=set_ground_truth_trace_cache_enabled,
+        initargs=(use_ground_truth_cache,),
+    ) as executor, tqdm(
+        total=len(evaluation_jobs), desc="Number of result files evaluated"
+    ) as pbar:
+
+        def _submit_more():
+            for job, task, task_args in islice(tasks, 2 * workers - len(submitted)):
+                submitted.append((job, executor.submit(task, *task_args)))
+
+        _submit_more()
+        while submitted:
+            (model_name, test_category, model_result, chunk_count), future = submitted.popleft()
+            outcome = future.result()
+            _submit_more()
+
+            if model_result is None:
+                # The whole category was evaluated (and its score file written) by the worker
+                _merge_leaderboard_table(leaderboard_table, outcome)
+                pbar.update()
+                continue
+
+            chunk_result, chunk_correct_count = outcome
+            result.extend(chunk_result)
+            correct_count += chunk_correct_count
+            chunks_merged += 1
+            if chunks_merged < chunk_count:
+                continue
+
+            _record_task_scores(
+                leaderboard_table,
+                model_name,
                 test_category,
-                result_dir,
-                score_dir,
                 model_result,
+                result,
+                correct_count,
+                score_dir,
+            )
+            result, correct_count, chunks_merged = [], 0, 0
+            pbar.update()
+
+
+def _iter_evaluation_tasks(evaluation_jobs, result_dir, score_dir, allow_missing: bool):
+    """
+    Yield the worker tasks of `evaluation_jobs` as `(job, task, task_args)`, where job is
+    `(model name, test category, model result, chunk count)`. For the chunked categories, the model result only holds
+    the fields needed for the cost and latency statistics; for the others, the worker does everything and it is None.
+    """
+    for model_name, test_category, model_result_json in evaluation_jobs:
+        if is_multi_turn(test_category) or is_agentic(test_category):
+            model_result = load_file(
+                model_result_json, sort_by_id=True, fields=_COST_LATENCY_FIELDS
+            )
+            # An empty result file still gets one (empty) chunk, and fails the same way as in a serial evaluation
+            chunk_starts = range(0, max(len(model_result), 1), EVAL_CHUNK_SIZE)
+            job = (model_name, test_category, model_result, len(chunk_starts))
+            for start in chunk_starts:
+                yield job, _evaluate_entry_chunk, (
+                    model_name,
+                    test_category,
+                    model_result_json,
+                    start,
+                    start + EVAL_CHUNK_SIZE,
+                    allow_missing,
+                )
+        else:
+            yield (model_name, test_category, None, 1), _evaluate_result_file, (
                 model_name,
-                handler,
-                leaderboard_table,
-                allow_missing=allow_missing,
+                test_category,
+                model_result_json,
+                result_dir,
+                score_dir,
+                allow_missing,
             )
 
-    # This function reads all the score files from local folder and updates the
-    # leaderboard table. This is helpful when you only want to run the
-    # evaluation for a subset of models and test categories.
-    update_leaderboard_table_with_local_score_file(leaderboard_table, score_dir)
-    # Write the leaderboard table to a file
-    generate_leaderboard_csv(leaderboard_table, score_dir)
 
+def _evaluate_entry_chunk(
+    model_name, test_category, model_result_json, start, stop, allow_missing
+) -> tuple[list[dict], int]:
+    """Worker task: check the entries `start:stop` (in id order) of a multi-turn or agentic result file."""
+    handler = _get_worker_handler(model_name.replace("_", "/"))
+    model_result, prompt, possible_answer = _load_aligned_entries(
+        model_result_json, test_category, allow_missing
+    )
+    chunk = (model_result[start:stop], prompt[start:stop], possible_answer[start:stop])
+    if is_multi_turn(test_category):
+        return _multi_turn_entry_results(handler, *chunk, model_name, test_category)
+    return _agentic_entry_results(handler, *chunk, model_name, test_category)
+
+
+@lru_cache(maxsize=1)
+def _load_aligned_entries(
+    model_result_json: Path, test_category: str, allow_missing: bool
+) -> tuple[list, list, list]:
+    """
+    Load a result file and align it with the prompt and ground truth entries, as `evaluate_task` does.
+    A worker usually gets several chunks of the same file in a row, so the last file is kept.
+    """
+    model_result = _load_model_result(model_result_json, test_category)
+    prompt = load_dataset_entry(
+        test_category, include_prereq=False, include_language_specific_hint=False
+    )
+    possible_answer = load_ground_truth_entry(test_category)
+    assert len(prompt) == len(
+        possible_answer
+    ), f"Length of ground truth ({len(possible_answer)}) should match prompt entries ({len(prompt)})."
+
+    prompt, possible_answer = _subset_entries_by_model_ids(
+        model_result, prompt, possible_answer, allow_missing=allow_missing
+    )
+    return model_result, prompt, possible_answer
+
+
+def _evaluate_result_file(
+    model_name, test_category, model_result_json, result_dir, score_dir, allow_missing
+) -> dict:
+    """Worker task: evaluate a whole result file, and return its part of the leaderboard table."""
+    handler = _get_worker_handler(model_name.replace("_", "/"))
+    model_result = _load_model_result(model_result_json, test_category)
+    return evaluate_task(
+        test_category,
+        result_dir,
+        score_dir,
+        model_result,
+        model_name,
+        handler,
+        {},
+        allow_missing=allow_missing,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_worker_handler(model_name: str) -> _LazyHandler:
+    # A worker process handles many chunks of the same few models
+    return _LazyHandler(model_name)
 
-def main(model, test_categories, result_dir, score_dir, partial_eval: bool = False):
+
+def _merge_leaderboard_table(leaderboard_table, partial_leaderboard_table) -> None:
+    for model_name, model_entry in partial_leaderboard_table.items():
+        if model_name not in leaderboard_table:
+            leaderboard_table[model_name] = {}
+            leaderboard_table[model_name]["cost"] = {"input_data": [], "output_data": []}
+            leaderboard_table[model_name]["latency"] = {"data": []}
+        for key, value in model_entry.items():
+            if key == "cost":
+                leaderboard_table[model_name]["cost"]["input_data"].extend(value["input_data"])
+                leaderboard_table[model_name]["cost"]["output_data"].extend(value["output_data"])
+            elif key == "latency":
+                leaderboard_table[model_name]["latency"]["data"].extend(value["data"])
+            else:
+                leaderboard_table[model_name][key] = value
+
+
+def main(
+    model,
+    test_categories,
+    result_dir,
+    score_dir,
+    partial_eval: bool = False,
+    workers: int = 1,
+    use_ground_truth_cache: bool = True,
+):
     if result_dir is None:
         result_dir = RESULT_PATH
     else:
@@ -854,6 +1317,8 @@ def main(model, test_categories, result_dir, score_dir, partial_eval: bool = Fal
         result_dir,
         score_dir,
         allow_missing=partial_eval,
+        workers=workers,
+        use_ground_truth_cache=use_ground_truth_cache,
     )
 
     print(
@@ -900,6 +1365,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     )
+    parser.add_argument(
+        "--workers",
+        default=1,
+        type=int,
+        help="Number of worker processes used for the evaluation; 1 evaluates everything in the current process",
+    )
+    parser.add_argument(
+        "--no-ground-truth-cache",
+        default=False,
+        action="store_true",
+        help="Execute the multi-turn ground truth for every entry instead of reusing the cached execution traces",
+    )
 
     args = parser.parse_args()
 
@@ -910,4 +1387,6 @@ if __name__ == "__main__":
         args.result_dir,
         args.score_dir,
         partial_eval=args.partial_eval,
+        workers=args.workers,
+        use_ground_truth_cache=not args.no_ground_truth_cache,
     )
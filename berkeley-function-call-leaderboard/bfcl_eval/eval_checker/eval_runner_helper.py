@@ -4,7 +4,6 @@ from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.column_headers import *
 from bfcl_eval.constants.eval_config import *
@@ -236,11 +235,7 @@ def get_category_score(score_dict: dict, test_category: str) -> dict:
         score["display_accuracy"] = score["accuracy"]
         return score
     else:
-        num_entry = len(
-            load_dataset_entry(
-                test_category, include_prereq=False, include_language_specific_hint=False
-            )
-        )
+        num_entry = get_category_entry_count(test_category)
         # If a category is not being evaluated, it needs to be distinguished from the situation where the evaluation score is 0
         # It will still be considered 0 in the overall score calculation though
         # We use `display_accuracy` to special handle
@@ -615,6 +610,7 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
 
     wandb_project = os.getenv("WANDB_BFCL_PROJECT")
     if wandb_project and wandb_project != "ENTITY:PROJECT":
+        import pandas as pd
         import wandb
 
         # Initialize WandB run
@@ -688,7 +684,8 @@ def update_leaderboard_table_with_local_score_file(
         # Find and process all score JSON files recursively in the subdirectory
         pattern = f"{VERSION_PREFIX}_*_score.json"
         for model_score_json in subdir.rglob(pattern):
-            metadata = load_file(model_score_json)[0]
+            # The first line holds the summary; the rest are the per-entry failures, which can be large
+            metadata = next(iter_file(model_score_json))
             test_category = extract_test_category(model_score_json)
             if model_name not in leaderboard_table:
                 leaderboard_table[model_name] = {}
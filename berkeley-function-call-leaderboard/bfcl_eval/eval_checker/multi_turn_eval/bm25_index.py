@@ -0,0 +1,156 @@
+import math
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Bump this when the layout of the exported index changes; snapshots with another version are re-indexed
+BM25_INDEX_FORMAT_VERSION = 1
+
+
+class BM25PlusIndex:
+    """
+    BM25+ index over a set of unique documents (e.g. the keys of a memory), maintained incrementally as documents are added and removed.
+
+    Scores are identical, bit for bit, to those of `rank_bm25.BM25Plus` built from scratch over the same documents
+    in the same (insertion) order: the term and document statistics are kept up to date, and the scoring formula
+    is evaluated with the same NumPy operations in the same order.
+    Each search then only touches the postings of the query terms, instead of tokenizing and indexing the whole corpus again.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, delta: float = 1) -> None:
+        self.k1 = k1
+        self.b = b
+        self.delta = delta
+        # Document -> number of tokens, in insertion order (which is also the order used to break ties)
+        self._doc_lengths: dict[str, int] = {}
+        # Term -> {document: term frequency}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        # Position of each document and the document lengths as an array; rebuilt lazily after a change
+        self._positions: Optional[dict[str, int]] = None
+        self._doc_length_array: Optional[np.ndarray] = None
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        return text.replace("_", " ").lower().split()
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[str], **kwargs) -> "BM25PlusIndex":
+        index = cls(**kwargs)
+        for document in documents:
+            index.add(document)
+        return index
+
+    @property
+    def documents(self) -> list[str]:
+        return list(self._doc_lengths)
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, document: str) -> bool:
+        return document in self._doc_lengths
+
+    def add(self, document: str) -> None:
+        if document in self._doc_lengths:
+            raise ValueError(f"Document {document!r} is already indexed.")
+        tokens = self.tokenize(document)
+        frequencies = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[document] = frequency
+        self._doc_lengths[document] = len(tokens)
+        self._total_length += len(tokens)
+        self._invalidate()
+
+    def remove(self, document: str) -> None:
+        self._total_length -= self._doc_lengths.pop(document)
+        for term in set(self.tokenize(document)):
+            postings = self._postings[term]
+            del postings[document]
+            if not postings:
+                del self._postings[term]
+        self._invalidate()
+
+    def clear(self) -> None:
+        self._doc_lengths.clear()
+        self._postings.clear()
+        self._total_length = 0
+        self._invalidate()
+
+    def get_scores(self, query: str) -> np.ndarray:
+        """The BM25+ score of every document for `query`, in document order."""
+        self._build_arrays()
+        corpus_size = len(self._doc_lengths)
+        # Like rank_bm25, an empty index raises ZeroDivisionError
+        avgdl = self._total_length / corpus_size
+        score = np.zeros(corpus_size)
+        doc_len = self._doc_length_array
+        for q in self.tokenize(query):
+            postings = self._postings.get(q)
+            q_freq = np.zeros(corpus_size, dtype=np.int64)
+            if postings:
+                idf = math.log((corpus_size + 1) / len(postings))
+                for document, frequency in postings.items():
+                    q_freq[self._positions[document]] = frequency
+            else:
+                idf = 0
+            score += idf * (
+                self.delta
+                + (q_freq * (self.k1 + 1))
+                / (self.k1 * (1 - self.b + self.b * doc_len / avgdl) + q_freq)
+            )
+        return score
+
+    def search(self, query: str, k: int = 5) -> list[tuple[float, str]]:
+        """The `k` best (score, document) pairs for `query`, best first; ties keep the document order."""
+        scores = self.get_scores(query)
+        ranked_results = sorted(
+            zip(scores, self._doc_lengths), key=lambda x: x[0], reverse=True
+        )
+        return ranked_results[:k]
+
+    def export(self) -> dict:
+        """The index as a JSON-serializable dictionary, to be restored with `from_export` without tokenizing anything."""
+        return {
+            "version": BM25_INDEX_FORMAT_VERSION,
+            "params": [self.k1, self.b, self.delta],
+            "doc_lengths": self._doc_lengths,
+            "postings": self._postings,
+        }
+
+    @classmethod
+    def from_export(cls, data: dict) -> Optional["BM25PlusIndex"]:
+        """The index exported by `export`, or None if the data comes from another format version or is malformed."""
+        try:
+            if data["version"] != BM25_INDEX_FORMAT_VERSION:
+                return None
+            k1, b, delta = data["params"]
+            index = cls(k1=k1, b=b, delta=delta)
+            index._doc_lengths = {
+                str(document): int(length) for document, length in data["doc_lengths"].items()
+            }
+            index._postings = {
+                str(term): {str(document): int(frequency) for document, frequency in postings.items()}
+                for term, postings in data["postings"].items()
+            }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        if any(
+            document not in index._doc_lengths
+            for postings in index._postings.values()
+            for document in postings
+        ):
+            return None
+        index._total_length = sum(index._doc_lengths.values())
+        return index
+
+    def _invalidate(self) -> None:
+        self._positions = None
+        self._doc_length_array = None
+
+    def _build_arrays(self) -> None:
+        if self._positions is None:
+            self._positions = {document: i for i, document in enumerate(self._doc_lengths)}
+            self._doc_length_array = np.array(list(self._doc_lengths.values()))
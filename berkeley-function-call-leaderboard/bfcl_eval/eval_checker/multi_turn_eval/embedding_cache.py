@@ -0,0 +1,222 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from bfcl_eval._sqlite_cache import SQLiteCache
+from bfcl_eval.constants.eval_config import EMBEDDING_CACHE_PATH
+
+# Embeddings kept in memory by a `BatchingEncoder`, most recently used first; older ones are read back from the on-disk cache
+MAX_MEMORY_EMBEDDINGS = 10_000
+
+class EmbeddingCache(SQLiteCache):
+    """
+    Content-addressed cache of text embeddings, stored in a local SQLite database shared by all the runs
+    (and all the evaluation worker processes) of the project.
+
+    The key is a hash of the encoder fingerprint and the exact text. Texts are not normalized (case, whitespace, Unicode form):
+    whether such a change leaves the embedding untouched depends on the tokenizer, so only identical texts share an entry.
+    The value is the raw float32 vector.
+    """
+
+    def __init__(self, path: Path) -> None:
+        # Losing the last few embeddings on a power failure is harmless, they are just computed again
+        super().__init__(path, "embeddings", durable=False)
+
+    @staticmethod
+    def make_key(encoder_fingerprint: str, text: str) -> str:
+        hasher = hashlib.sha256(encoder_fingerprint.encode())
+        hasher.update(b"\0")
+        hasher.update(text.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        return {
+            key: np.frombuffer(value, dtype=np.float32)
+            for key, value in self.get_values(keys).items()
+        }
+
+    def put_many(self, vectors: dict[str, np.ndarray]) -> None:
+        self.put_values(
+            {
+                key: np.asarray(vector, dtype=np.float32).tobytes()
+                for key, vector in vectors.items()
+            }
+        )
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH)
+        return _embedding_cache
+
+
+class _EncodeRequest:
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.vectors: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+        # Set when the request is done, or when its thread has to take over as the leader
+        self.wakeup = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self.vectors is not None or self.error is not None
+
+
+class BatchingEncoder:
+    """
+    Front end of an encoder shared by many threads (e.g. the vector memory backends of the test entries being inferred in parallel).
+
+    Embeddings are looked up in memory (the `max_memory_size` most recently used), then in the on-disk `EmbeddingCache`; only the remaining texts reach the encoder.
+    Concurrent encode calls are coalesced: the first caller becomes the leader and encodes the queued texts in batches
+    of up to `max_batch_size`, while the other callers wait for their results. Callers arriving while a batch is being encoded
+    simply join the next one, so no artificial delay is needed; `max_wait` can be raised to collect larger batches.
+    Once its own texts are done, the leader hands over to the next waiting caller.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[list[str]], np.ndarray],
+        encoder_fingerprint: str,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0,
+        max_memory_size: int = MAX_MEMORY_EMBEDDINGS,
+    ) -> None:
+        self.encode_batch = encode_batch
+        self.encoder_fingerprint = encoder_fingerprint
+        self.cache = cache
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_memory_size = max_memory_size
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._queue: deque[_EncodeRequest] = deque()
+        self._leader_active = False
+        # Statistics, for the benchmark
+        self.encoded_texts = 0
+        self.encode_calls = 0
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Embeddings of `texts`, one row per text, in order."""
+        with self._lock:
+            vectors = self._recall(texts)
+        missing = list(dict.fromkeys(text for text in texts if text not in vectors))
+
+        if missing and self.cache is not None:
+            keys = {text: self.cache.make_key(self.encoder_fingerprint, text) for text in missing}
+            cached = self.cache.get_many(list(keys.values()))
+            for text in missing:
+                if keys[text] in cached:
+                    vectors[text] = cached[keys[text]]
+            missing = [text for text in missing if text not in vectors]
+
+        if missing:
+            encoded = self._encode_uncached(missing)
+            vectors.update(zip(missing, encoded))
+            if self.cache is not None:
+                self.cache.put_many(
+                    {
+                        self.cache.make_key(self.encoder_fingerprint, text): vector
+                        for text, vector in zip(missing, encoded)
+                    }
+                )
+
+        with self._lock:
+            self._remember({text: vectors[text] for text in texts})
+        return np.stack([vectors[text] for text in texts]).astype(np.float32, copy=False)
+
+    def _encode_uncached(self, texts: list[str]) -> np.ndarray:
+        request = _EncodeRequest(texts)
+        with self._lock:
+            self._queue.append(request)
+            is_leader = not self._leader_active
+            self._leader_active = True
+
+        if is_leader:
+            if self.max_wait > 0:
+                # Give concurrent callers a chance to join the first batch
+                time.sleep(self.max_wait)
+        else:
+            request.wakeup.wait()
+
+        if not request.done:
+            # Either the first caller, or promoted by the previous leader
+            self._lead(request)
+
+        if request.error is not None:
+            raise request.error
+        return request.vectors
+
+    def _lead(self, own_request: _EncodeRequest) -> None:
+        while not own_request.done:
+            with self._lock:
+                batch = [self._queue.popleft()]
+                batch_size = len(batch[0].texts)
+                while (
+                    self._queue
+                    and batch_size + len(self._queue[0].texts) <= self.max_batch_size
+                ):
+                    batch_size += len(self._queue[0].texts)
+                    batch.append(self._queue.popleft())
+
+            with self._lock:
+                # Texts encoded by an earlier batch while this one was queued
+                by_text = self._recall(text for request in batch for text in request.texts)
+            unique_texts = list(
+                dict.fromkeys(
+                    text for request in batch for text in request.texts if text not in by_text
+                )
+            )
+            try:
+                if unique_texts:
+                    encoded = np.asarray(self.encode_batch(unique_texts), dtype=np.float32)
+                    by_text.update(zip(unique_texts, encoded))
+                    with self._lock:
+                        self._remember(dict(zip(unique_texts, encoded)))
+                for request in batch:
+                    request.vectors = np.stack([by_text[text] for text in request.texts])
+            except BaseException as e:
+                for request in batch:
+                    request.error = e
+            with self._lock:
+                self.encode_calls += bool(unique_texts)
+                self.encoded_texts += len(unique_texts)
+            for request in batch:
+                request.wakeup.set()
+
+        with self._lock:
+            if self._queue:
+                # Hand over to the next waiting caller
+                self._queue[0].wakeup.set()
+            else:
+                self._leader_active = False
+
+    def _recall(self, texts: Iterable[str]) -> dict[str, np.ndarray]:
+        """The in-memory embeddings of `texts`, marked as recently used. Must be called with the lock held."""
+        found = {}
+        for text in texts:
+            if text in self._memory:
+                self._memory.move_to_end(text)
+                found[text] = self._memory[text]
+        return found
+
+    def _remember(self, vectors: dict[str, np.ndarray]) -> None:
+        """Must be called with the lock held."""
+        for text, vector in vectors.items():
+            self._memory.setdefault(text, vector)
+            self._memory.move_to_end(text)
+        while len(self._memory) > self.max_memory_size:
+            self._memory.popitem(last=False)
@@ -11,6 +11,8 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
 
 
 class File:
+    # Attributes that define the equality of a file, used for the structural state hash
+    _state_hash_attributes = ("name", "content")
 
     def __init__(self, name: str, content: str = "") -> None:
         """
@@ -63,6 +65,8 @@ class File:
 
 
 class Directory:
+    # Attributes that define the equality of a directory (not `parent`), used for the structural state hash
+    _state_hash_attributes = ("name", "contents")
 
     def __init__(self, name: str, parent: Optional["Directory"] = None) -> None:
         """
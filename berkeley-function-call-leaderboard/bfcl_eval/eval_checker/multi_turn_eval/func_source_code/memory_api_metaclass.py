@@ -1,9 +1,14 @@
-import json
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from overrides import final
 
+from bfcl_eval.eval_checker.multi_turn_eval.memory_snapshot_store import (
+    SNAPSHOT_FILE_SUFFIX,
+    load_snapshot,
+    write_snapshot,
+)
 from bfcl_eval.utils import (
     get_directory_structure_by_id,
     is_first_memory_prereq_entry,
@@ -22,7 +27,7 @@ class MemoryAPI(ABC):
         self.snapshot_folder: Path | None = None
 
     @final
-    def _prepare_snapshot(self, initial_config: dict) -> Optional[dict]:
+    def _prepare_snapshot(self, initial_config: dict) -> Optional[Mapping]:
         """Helper to prepare snapshot folders/files and load previous memory data.
 
         Sub-classes should call this method and then load the specific portions of the snapshot
@@ -33,7 +38,8 @@ class MemoryAPI(ABC):
             initial_config (dict): The configuration dict passed from the evaluation harness.
 
         Returns:
-            Optional[dict]: The previously saved memory snapshot if it exists, otherwise `None`.
+            Optional[Mapping]: The previously saved memory snapshot if it exists, otherwise `None`.
+                Its sections are loaded on first access, and must be copied before being modified.
         """
         # We don't care about the ``long_context`` parameter here – subclasses keep that
         model_result_dir: Path = initial_config["model_result_dir"]
@@ -54,7 +60,11 @@ class MemoryAPI(ABC):
             self.snapshot_folder = memory_snapshot_folder
 
         self.snapshot_folder.mkdir(parents=True, exist_ok=True)
-        self.latest_snapshot_file = memory_snapshot_folder / f"{self.scenario}_final.json"
+        self.latest_snapshot_file = (
+            memory_snapshot_folder / f"{self.scenario}_final{SNAPSHOT_FILE_SUFFIX}"
+        )
+        # The snapshot the memory is loaded from, which the next snapshot is written as a delta against
+        self._parent_snapshot = None
 
         if is_first_memory_prereq_entry(self.test_id):
             # The very first entry of a prerequisite chain should start with a clean state.
@@ -62,7 +72,8 @@ class MemoryAPI(ABC):
 
         # For non-first entries we MUST have a snapshot to load from.
         # But if the first entry got a error during inference, then there will be no snapshot file
-        if not self.latest_snapshot_file.exists():
+        self._parent_snapshot = load_snapshot(self.latest_snapshot_file)
+        if self._parent_snapshot is None:
             msg = (
                 "⚠️" * 100
                 + f"\nWarning: Not first memory entry, but no snapshot file found in this path: {self.latest_snapshot_file}. The memory will start empty for {initial_config['test_id']}.\n"
@@ -72,8 +83,24 @@ class MemoryAPI(ABC):
 
             return None
 
-        with open(self.latest_snapshot_file, "r") as f:
-            return json.load(f)
+        return self._parent_snapshot
+
+    @final
+    def _write_snapshot(self, sections: dict[str, Any]) -> Path:
+        """Helper to save the memory snapshot of the current test entry, and make it the latest snapshot of the scenario.
+
+        Args:
+            sections (dict): The memory data, e.g. `{"core_memory": ..., "archival_memory": ...}`. Must be JSON serializable.
+
+        Returns:
+            Path: The snapshot file of the current test entry.
+        """
+        return write_snapshot(
+            self.snapshot_folder / self.test_id,
+            sections,
+            parent=self._parent_snapshot,
+            copies=(self.latest_snapshot_file,),
+        )
 
     @abstractmethod
     def _load_scenario(self, initial_config: dict, long_context: bool = False):
@@ -1,12 +1,12 @@
 import json
 import re
 from copy import deepcopy
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from bfcl_eval.eval_checker.multi_turn_eval.bm25_index import BM25PlusIndex
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
-from rank_bm25 import BM25Plus
 
 # https://lilianweng.github.io/posts/2023-06-23-agent/#component-two-memory
 MAX_CORE_MEMORY_SIZE = 7
@@ -23,6 +23,9 @@ class MemoryAPI_kv(MemoryAPI):
     def __init__(self):
         self.core_memory = {}
         self.archival_memory = {}
+        # BM25+ indexes of the keys, kept up to date by the methods that add or remove keys
+        self._core_memory_index = BM25PlusIndex()
+        self._archival_memory_index = BM25PlusIndex()
         self._api_description = """This tool belongs to the memory suite, which provides APIs to interact with a key-value based memory system."""
         self.snapshot_folder = None
 
@@ -34,33 +37,26 @@ class MemoryAPI_kv(MemoryAPI):
         if memory_data:
             self.core_memory = deepcopy(memory_data["core_memory"])
             self.archival_memory = deepcopy(memory_data["archival_memory"])
+            self._core_memory_index = self._restore_index(
+                memory_data.get("core_memory_index"), self.core_memory
+            )
+            self._archival_memory_index = self._restore_index(
+                memory_data.get("archival_memory_index"), self.archival_memory
+            )
 
     def _flush_memory_to_local_file(self):
         """
-        Flush (save) current memory (both core and archival) to a local JSON file.
+        Flush (save) current memory (both core and archival) to a local snapshot file.
+        The key indexes are saved along, so that the next entry does not have to index the keys again.
         """
-
-        # Write the snapshot file for the current test entry
-        with open(self.snapshot_folder / f"{self.test_id}.json", "w") as f:
-            json.dump(
-                {
-                    "core_memory": self.core_memory,
-                    "archival_memory": self.archival_memory,
-                },
-                f,
-                indent=4,
-            )
-
-        # Update the latest snapshot file content
-        with open(self.latest_snapshot_file, "w") as f:
-            json.dump(
-                {
-                    "core_memory": self.core_memory,
-                    "archival_memory": self.archival_memory,
-                },
-                f,
-                indent=4,
-            )
+        self._write_snapshot(
+            {
+                "core_memory": self.core_memory,
+                "archival_memory": self.archival_memory,
+                "core_memory_index": self._synced_index("core_memory").export(),
+                "archival_memory_index": self._synced_index("archival_memory").export(),
+            }
+        )
 
     def _dump_core_memory_to_context(self) -> str:
         if not self.core_memory:
@@ -68,24 +64,38 @@ class MemoryAPI_kv(MemoryAPI):
         return json.dumps(self.core_memory, indent=4)
 
     @staticmethod
-    def _similarity_search(query: str, corpus: list[str], k: int = 5):
+    def _restore_index(exported_index: Optional[dict], memory: dict) -> BM25PlusIndex:
+        """The key index saved in a snapshot, or a new one if the snapshot has none (or one that does not match the memory)."""
+        index = BM25PlusIndex.from_export(exported_index) if exported_index else None
+        if index is None or index.documents != list(memory):
+            index = BM25PlusIndex.from_documents(memory)
+        return index
+
+    def _synced_index(self, memory_name: str) -> BM25PlusIndex:
+        """
+        The key index of `core_memory` or `archival_memory`.
+        If the memory was modified without going through the methods of this class, its keys are indexed again.
+        """
+        memory = getattr(self, memory_name)
+        index = getattr(self, f"_{memory_name}_index")
+        if index.documents != list(memory):
+            index = BM25PlusIndex.from_documents(memory)
+            setattr(self, f"_{memory_name}_index", index)
+        return index
+
+    def _similarity_search(self, memory_name: str, query: str, k: int = 5):
         """
-        Search for the most similar text in the corpus to the query using BM25+ algorithm.
+        Search for the keys of a memory that are the most similar to the query using BM25+ algorithm.
 
         Args:
+            memory_name (str): `core_memory` or `archival_memory`.
             query (str): The query text to search for.
-            corpus (list[str]): A list of text strings to search in.
             k (int): The number of results to return.
 
         Returns:
-            ranked_results (list[tuple[float, str]]): A list of tuples containing the BM25+ score and the text string.
+            ranked_results (list[tuple[float, str]]): A list of tuples containing the BM25+ score and the key.
         """
-        tokenized_corpus = [text.replace("_", " ").lower().split() for text in corpus]
-        bm25 = BM25Plus(tokenized_corpus)
-        tokenized_query = query.replace("_", " ").lower().split()
-        scores = bm25.get_scores(tokenized_query)
-        ranked_results = sorted(zip(scores, corpus), key=lambda x: x[0], reverse=True)
-        return {"ranked_results": ranked_results[:k]}
+        return {"ranked_results": self._synced_index(memory_name).search(query, k)}
 
     @staticmethod
     def _is_valid_key_format(s):
@@ -120,6 +130,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key name must be unique."}
 
         self.core_memory[key] = value
+        self._core_memory_index.add(key)
         return {"status": "Key-value pair added."}
 
     def core_memory_remove(self, key: str) -> Dict[str, str]:
@@ -134,6 +145,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         if key in self.core_memory:
             del self.core_memory[key]
+            self._core_memory_index.remove(key)
             return {"status": "Key removed."}
         else:
             return {"error": "Key not found."}
@@ -168,6 +180,7 @@ class MemoryAPI_kv(MemoryAPI):
             status (str): Status of the operation.
         """
         self.core_memory = {}
+        self._core_memory_index.clear()
         return {"status": "Short term memory cleared."}
 
     def core_memory_retrieve(self, key: str) -> Dict[str, str]:
@@ -207,8 +220,7 @@ class MemoryAPI_kv(MemoryAPI):
         Returns:
             ranked_results (List[Tuple[float, str]]): A list of tuples containing the BM25+ score and the key.
         """
-        keys = deepcopy(list(self.core_memory.keys()))
-        return self._similarity_search(query, keys, k)
+        return self._similarity_search("core_memory", query, k)
 
     def core_memory_retrieve_all(self) -> Dict[str, str]:
         """
@@ -244,6 +256,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key name must be unique."}
 
         self.archival_memory[key] = value
+        self._archival_memory_index.add(key)
         return {"status": "Key added."}
 
     def archival_memory_remove(self, key: str) -> Dict[str, str]:
@@ -258,6 +271,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         if key in self.archival_memory:
             del self.archival_memory[key]
+            self._archival_memory_index.remove(key)
             return {"status": "Key removed."}
         else:
             return {"error": "Key not found."}
@@ -292,6 +306,7 @@ class MemoryAPI_kv(MemoryAPI):
             status (str): Status of the operation.
         """
         self.archival_memory = {}
+        self._archival_memory_index.clear()
         return {"status": "Long term memory cleared."}
 
     def archival_memory_retrieve(self, key: str) -> Dict[str, str]:
@@ -330,5 +345,4 @@ class MemoryAPI_kv(MemoryAPI):
         Returns:
             ranked_results (List[Tuple[float, str]]): A list of tuples containing the BM25+ score and the key.
         """
-        keys = deepcopy(list(self.archival_memory.keys()))
-        return self._similarity_search(query, keys, k)
+        return self._similarity_search("archival_memory", query, k)
@@ -1,4 +1,3 @@
-import json
 from copy import deepcopy
 from typing import Dict
 
@@ -32,28 +31,9 @@ class MemoryAPI_rec_sum(MemoryAPI):
 
     def _flush_memory_to_local_file(self):
         """
-        Flush (save) current memory to a local JSON file.
+        Flush (save) current memory to a local snapshot file.
         """
-
-        # Write the snapshot file for the current test entry
-        with open(self.snapshot_folder / f"{self.test_id}.json", "w") as f:
-            json.dump(
-                {
-                    "memory": self.memory,
-                },
-                f,
-                indent=4,
-            )
-
-        # Update the latest snapshot file content
-        with open(self.latest_snapshot_file, "w") as f:
-            json.dump(
-                {
-                    "memory": self.memory,
-                },
-                f,
-                indent=4,
-            )
+        self._write_snapshot({"memory": self.memory})
 
     def _dump_core_memory_to_context(self) -> str:
         if not self.memory:
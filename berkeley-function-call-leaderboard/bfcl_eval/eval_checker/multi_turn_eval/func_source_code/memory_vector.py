@@ -1,19 +1,21 @@
+import hashlib
+import importlib.metadata
+import io
 import json
+import threading
+import zipfile
+from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
+from bfcl_eval.eval_checker.multi_turn_eval.embedding_cache import (
+    BatchingEncoder,
+    get_embedding_cache,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
-
-# isort: off
-# Note: This import order is necessary to avoid segfault issue due to FAISS and PyTorch each load a different OpenMP runtime
-# See https://github.com/pytorch/pytorch/issues/149201#issuecomment-2725586827
-# TODO: Find a common OpenMP runtime to avoid this issue
-from sentence_transformers import SentenceTransformer
-import faiss
-
-# isort: on
+from bfcl_eval.utils import atomic_write_bytes
 
 # https://lilianweng.github.io/posts/2023-06-23-agent/#component-two-memory
 MAX_CORE_MEMORY_SIZE = 7
@@ -23,8 +25,59 @@ MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH = 2000
 
 
 # Use a global SentenceTransformer model for all vector stores.
-ENCODER = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
-ENCODER_DIM = ENCODER.get_sentence_embedding_dimension()
+# PyTorch, FAISS and the model weights take several seconds to load, so they are only loaded on first use
+ENCODER_MODEL_NAME = "all-MiniLM-L6-v2"
+ENCODER_DIM = 384
+# Embeddings saved next to the snapshots are only reused by the same encoder
+ENCODER_FINGERPRINT = f"{ENCODER_MODEL_NAME}:{ENCODER_DIM}:sentence-transformers=={importlib.metadata.version('sentence-transformers')}"
+
+_encoder = None
+_embedder: Optional[BatchingEncoder] = None
+_resource_lock = threading.Lock()
+
+
+def _import_faiss():
+    # isort: off
+    # Note: This import order is necessary to avoid segfault issue due to FAISS and PyTorch each load a different OpenMP runtime
+    # See https://github.com/pytorch/pytorch/issues/149201#issuecomment-2725586827
+    # TODO: Find a common OpenMP runtime to avoid this issue
+    import sentence_transformers
+    import faiss
+
+    # isort: on
+    return faiss
+
+
+def get_encoder():
+    """The SentenceTransformer model shared by all the vector stores, loaded on first use."""
+    global _encoder
+    with _resource_lock:
+        if _encoder is None:
+            _import_faiss()
+            from sentence_transformers import SentenceTransformer
+
+            encoder = SentenceTransformer(ENCODER_MODEL_NAME, device="cpu")
+            assert (
+                encoder.get_sentence_embedding_dimension() == ENCODER_DIM
+            ), f"Unexpected embedding dimension for {ENCODER_MODEL_NAME}"
+            _encoder = encoder
+        return _encoder
+
+
+def get_embedder() -> BatchingEncoder:
+    """
+    The front end all the vector stores encode through, which caches the embeddings on disk
+    and batches the encode calls made concurrently by the inference threads.
+    """
+    global _embedder
+    with _resource_lock:
+        if _embedder is None:
+            _embedder = BatchingEncoder(
+                lambda texts: get_encoder().encode(texts, normalize_embeddings=True),
+                ENCODER_FINGERPRINT,
+                cache=get_embedding_cache(),
+            )
+        return _embedder
 
 
 class MemoryAPI_vector(MemoryAPI):
@@ -49,35 +102,36 @@ class MemoryAPI_vector(MemoryAPI):
         memory_data = self._prepare_snapshot(initial_config)
 
         if memory_data:
-            self.core_memory.load_from_snapshot(memory_data["core_memory"])
-            self.archival_memory.load_from_snapshot(memory_data["archival_memory"])
+            embeddings = _load_embeddings(_get_embeddings_path(self.latest_snapshot_file))
+            self.core_memory.load_from_snapshot(
+                memory_data["core_memory"], embeddings.get("core_memory")
+            )
+            self.archival_memory.load_from_snapshot(
+                memory_data["archival_memory"], embeddings.get("archival_memory")
+            )
 
     def _flush_memory_to_local_file(self):
         """
-        Flush (save) current memory (both core and archival) to a local JSON file.
+        Flush (save) current memory (both core and archival) to a local snapshot file.
+        The embeddings are saved next to it, so that loading the snapshot does not need to encode the texts again.
         """
+        embeddings = {
+            "core_memory": self.core_memory.export_embeddings(),
+            "archival_memory": self.archival_memory.export_embeddings(),
+        }
 
-        # Write the snapshot file for the current test entry
-        with open(self.snapshot_folder / f"{self.test_id}.json", "w") as f:
-            json.dump(
-                {
-                    "core_memory": self.core_memory.export(),
-                    "archival_memory": self.archival_memory.export(),
-                },
-                f,
-                indent=4,
-            )
-
-        # Update the latest snapshot file content
-        with open(self.latest_snapshot_file, "w") as f:
-            json.dump(
-                {
-                    "core_memory": self.core_memory.export(),
-                    "archival_memory": self.archival_memory.export(),
-                },
-                f,
-                indent=4,
-            )
+        # Write the snapshot file for the current test entry, and update the latest snapshot file content
+        snapshot_file = self._write_snapshot(
+            {
+                "core_memory": self.core_memory.export(),
+                "archival_memory": self.archival_memory.export(),
+            }
+        )
+        serialized_embeddings = _serialize_embeddings(embeddings)
+        atomic_write_bytes(_get_embeddings_path(snapshot_file), serialized_embeddings)
+        atomic_write_bytes(
+            _get_embeddings_path(self.latest_snapshot_file), serialized_embeddings
+        )
 
     def _dump_core_memory_to_context(self) -> str:
         if not self.core_memory:
@@ -241,6 +295,7 @@ class VectorStore:
         self.max_entry_length = max_entry_length
 
         # Cosine similarity via inner product on L2‑normalised vectors.
+        faiss = _import_faiss()
         index_flat = faiss.IndexFlatIP(ENCODER_DIM)
         self._index = faiss.IndexIDMap(index_flat)
 
@@ -250,10 +305,7 @@ class VectorStore:
 
     def _embed(self, text: str | List[str]) -> np.ndarray:
         """Return an L2-normalised NumPy array suitable for FAISS."""
-        vecs = ENCODER.encode(
-            text if isinstance(text, list) else [text], normalize_embeddings=True
-        )
-        return np.asarray(vecs, dtype=np.float32)
+        return get_embedder().encode(text if isinstance(text, list) else [text])
 
     def add(self, text: str) -> dict[str, str]:
         if len(text) > self.max_entry_length:
@@ -353,20 +405,102 @@ class VectorStore:
             "store": self._store,
         }
 
-    def load_from_snapshot(self, snapshot_data: dict) -> None:
+    def export_embeddings(self) -> dict[str, np.ndarray]:
+        """
+        Export the vectors held by the index, sorted by ID, along with a checksum that ties them to the stored texts and the encoder.
+        """
+        ids = _import_faiss().vector_to_array(self._index.id_map).astype(np.int64)
+        if len(ids):
+            vectors = self._index.index.reconstruct_n(0, self._index.ntotal)
+        else:
+            vectors = np.zeros((0, ENCODER_DIM), dtype=np.float32)
+        order = np.argsort(ids)
+        ids, vectors = ids[order], np.ascontiguousarray(vectors[order], dtype=np.float32)
+        return {
+            "ids": ids,
+            "vectors": vectors,
+            "checksum": np.array(_embedding_checksum(self._store, ids, vectors)),
+        }
+
+    def load_from_snapshot(
+        self, snapshot_data: dict, embeddings: Optional[dict[str, np.ndarray]] = None
+    ) -> None:
         """
         Load the vector store from a snapshot.
+        `embeddings` (see `export_embeddings`) are used as is if they match the stored texts and the current encoder;
+        otherwise the texts are embedded again.
         """
         self._next_id = snapshot_data["next_id"]
         self._store = {int(k): v for k, v in snapshot_data["store"].items()}
         self._index.reset()
 
         if self._store:
-            # Re-embed every stored text in one batch
             # To keep IDs aligned with vectors, sort by ID
             ids = np.array(sorted(self._store.keys()), dtype=np.int64)
-            texts = [self._store[i] for i in ids]
-            vectors = self._embed(texts)
+            if embeddings is not None and _is_valid_embedding(self._store, ids, embeddings):
+                vectors = embeddings["vectors"]
+            else:
+                # Re-embed every stored text in one batch
+                texts = [self._store[i] for i in ids]
+                vectors = self._embed(texts)
 
             # Re-populate the index with the known IDs
             self._index.add_with_ids(vectors, ids)
+
+
+def _get_embeddings_path(snapshot_file: Path) -> Path:
+    return snapshot_file.with_suffix(".embeddings.npz")
+
+
+def _serialize_embeddings(embeddings: dict[str, dict[str, np.ndarray]]) -> bytes:
+    """The `.npz` content of the embeddings saved next to a snapshot; written with `atomic_write_bytes`, like the snapshot."""
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        **{
+            f"{store_name}.{key}": value
+            for store_name, store_embeddings in embeddings.items()
+            for key, value in store_embeddings.items()
+        },
+    )
+    return buffer.getvalue()
+
+
+def _load_embeddings(path: Path) -> dict[str, dict[str, np.ndarray]]:
+    """The embeddings saved next to a snapshot, keyed by store name. Missing or unreadable files give no embeddings."""
+    embeddings = {}
+    try:
+        with np.load(path) as data:
+            for name in data.files:
+                store_name, key = name.split(".", 1)
+                embeddings.setdefault(store_name, {})[key] = data[name]
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        return {}
+    return embeddings
+
+
+def _embedding_checksum(store: dict[int, str], ids: np.ndarray, vectors: np.ndarray) -> str:
+    hasher = hashlib.sha256(ENCODER_FINGERPRINT.encode())
+    hasher.update(json.dumps([store.get(int(vec_id)) for vec_id in ids]).encode())
+    hasher.update(ids.tobytes())
+    hasher.update(vectors.tobytes())
+    return hasher.hexdigest()
+
+
+def _is_valid_embedding(
+    store: dict[int, str], ids: np.ndarray, embeddings: dict[str, np.ndarray]
+) -> bool:
+    """Whether saved embeddings cover exactly the stored texts, were computed by the current encoder, and are intact."""
+    try:
+        saved_ids = embeddings["ids"]
+        vectors = embeddings["vectors"]
+        checksum = str(embeddings["checksum"])
+    except KeyError:
+        return False
+    return (
+        saved_ids.dtype == np.int64
+        and np.array_equal(saved_ids, ids)
+        and vectors.dtype == np.float32
+        and vectors.shape == (len(ids), ENCODER_DIM)
+        and _embedding_checksum(store, ids, vectors) == checksum
+    )
@@ -6,14 +6,13 @@ from urllib.parse import urlparse
 
 import html2text
 import requests
+from bfcl_eval.eval_checker.multi_turn_eval.web_search_transport import (
+    BRAVE_SEARCH_URL,
+    SERPAPI_SEARCH_URL,
+    get_web_search_transport,
+)
 from bs4 import BeautifulSoup
 
-try:
-    from serpapi import GoogleSearch
-    SERPAPI_AVAILABLE = True
-except ImportError:
-    SERPAPI_AVAILABLE = False
-
 ERROR_TEMPLATES = [
     "503 Server Error: Service Unavailable for url: {url}",
     "429 Client Error: Too Many Requests for url: {url}",
@@ -43,13 +42,19 @@ class WebSearchAPI:
         # This one is used to determine the content of the error message
         self._rng = random.Random(1053)
         
+        # All the HTTP requests go through this transport, which can record and replay them, or serve a local fixture corpus
+        self._transport = get_web_search_transport()
+
         # Determine which API to use based on available keys
         self.brave_api_key = os.getenv("BRAVE_API_KEY")
         self.serpapi_key = os.getenv("SERPAPI_API_KEY")
         
-        if self.brave_api_key:
+        if os.getenv("BFCL_WEB_SEARCH_FIXTURE_PATH"):
+            # The fixture corpus is served in the Brave Search API format, no key needed
             self.search_provider = "brave"
-        elif self.serpapi_key and SERPAPI_AVAILABLE:
+        elif self.brave_api_key:
+            self.search_provider = "brave"
+        elif self.serpapi_key:
             self.search_provider = "serpapi"
         else:
             self.search_provider = None
@@ -197,8 +202,8 @@ class WebSearchAPI:
         # Infinite retry loop with exponential backoff
         while True:
             try:
-                response = requests.get(
-                    "https://api.search.brave.com/res/v1/web/search",
+                response = self._transport.get(
+                    BRAVE_SEARCH_URL,
                     headers=headers,
                     params=params,
                     timeout=20
@@ -274,8 +279,12 @@ class WebSearchAPI:
         # Infinite retry loop with exponential backoff
         while True:
             try:
-                search = GoogleSearch(params)
-                search_results = search.get_dict()
+                # Same request as `serpapi.GoogleSearch(params).get_dict()`
+                search_results = self._transport.get(
+                    SERPAPI_SEARCH_URL,
+                    params={**params, "source": "python", "output": "json"},
+                    timeout=60,
+                ).json()
             except Exception as e:
                 # If the underlying HTTP call raised a 429 we retry, otherwise propagate
                 if "429" in str(e):
@@ -341,16 +350,6 @@ class WebSearchAPI:
 
         return results
 
-    def _search_with_serpapi(self, keywords: str, max_results: int, region: str) -> list:
-        """Search using SerpAPI."""
-        backoff = 2  # initial back-off in seconds
-        params = {
-            "engine": "duckduckgo",
-            "q": keywords,
-            "kl": region,
-            "api_key": self.serpapi_key,
-        }
-
     def fetch_url_content(self, url: str, mode: str = "raw") -> str:
         """
         This function retrieves content from the provided URL and processes it based on the selected mode.
@@ -389,7 +388,7 @@ class WebSearchAPI:
                 "Sec-Fetch-User": "?1",
                 "Sec-Fetch-Dest": "document",
             }
-            response = requests.get(url, headers=headers, timeout=20, allow_redirects=True)
+            response = self._transport.get(url, headers=headers, timeout=20, allow_redirects=True)
             response.raise_for_status()
 
             # Note: Un-comment this when we want to simulate a random error
@@ -0,0 +1,194 @@
+import hashlib
+import importlib
+import inspect
+import json
+import pickle
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from bfcl_eval._sqlite_cache import SQLiteCache
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import GROUND_TRUTH_TRACE_CACHE_PATH
+from bfcl_eval.constants.executable_backend_config import CLASS_FILE_PATH_MAPPING
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    execute_multi_turn_func_call,
+    release_execution_instances,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.state_hash import (
+    STATE_HASH_VERSION,
+    instance_state_digests,
+)
+
+# Bump this when the layout of the stored traces changes
+TRACE_FORMAT_VERSION = 2
+
+# The ground truth is executed under this name in the execution instance registry
+_GROUND_TRUTH_MODEL_NAME = "ground_truth_trace"
+
+# Modules the ground truth execution depends on besides the backend classes themselves (part of the cache key):
+# the function call dispatcher, the state digests, and the helpers the backends import
+_EXECUTION_MODULES = (
+    "bfcl_eval.constants.executable_backend_config",
+    "bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils",
+    "bfcl_eval.eval_checker.multi_turn_eval.state_hash",
+    "bfcl_eval.eval_checker.multi_turn_eval.bm25_index",
+    "bfcl_eval.eval_checker.multi_turn_eval.memory_snapshot_store",
+    "bfcl_eval.eval_checker.multi_turn_eval.web_search_transport",
+    "bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context",
+    "bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass",
+)
+
+# Set to False by `bfcl evaluate --no-ground-truth-cache`
+_cache_enabled = True
+
+
+class GroundTruthTraceCache(SQLiteCache):
+    """
+    Persistent cache of the ground truth execution of multi-turn entries, shared by all the models being evaluated.
+
+    For each turn, the trace holds the execution results of the ground truth function calls, a snapshot
+    (pickle) of every involved backend instance at the end of the turn, and the state digests of those instances
+    (see `state_hash.py`), which is what the state and response checkers compare against.
+
+    The key covers the dataset version, the entry id, the entry content (initial config, involved classes, ground truth)
+    and the source code of the involved backend classes and of the modules in `_EXECUTION_MODULES`,
+    so editing any of them simply leads to a cache miss.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, "traces")
+
+    def make_key(
+        self,
+        test_entry: dict,
+        multi_turn_ground_truth_list: list[list[str]],
+        long_context: bool,
+    ) -> str:
+        serialized = json.dumps(
+            [
+                TRACE_FORMAT_VERSION,
+                STATE_HASH_VERSION,
+                VERSION_PREFIX,
+                test_entry["id"],
+                test_entry["initial_config"],
+                test_entry["involved_classes"],
+                multi_turn_ground_truth_list,
+                long_context,
+                [
+                    _backend_source_hash(class_name)
+                    for class_name in test_entry["involved_classes"]
+                ],
+                _execution_source_hash(),
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[list[tuple[list[str], dict[str, bytes], dict]]]:
+        value = self.get_value(key)
+        return None if value is None else pickle.loads(value)
+
+    def put(self, key: str, trace: list[tuple[list[str], dict[str, bytes], dict]]) -> None:
+        self.put_values({key: pickle.dumps(trace)})
+
+
+_ground_truth_trace_cache: Optional[GroundTruthTraceCache] = None
+_ground_truth_trace_cache_lock = threading.Lock()
+
+
+def get_ground_truth_trace_cache() -> GroundTruthTraceCache:
+    global _ground_truth_trace_cache
+    with _ground_truth_trace_cache_lock:
+        if _ground_truth_trace_cache is None:
+            _ground_truth_trace_cache = GroundTruthTraceCache(GROUND_TRUTH_TRACE_CACHE_PATH)
+        return _ground_truth_trace_cache
+
+
+def set_ground_truth_trace_cache_enabled(enabled: bool) -> None:
+    """When disabled, the ground truth is executed for every entry and the cache is neither read nor written."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def get_ground_truth_trace(
+    test_entry: dict,
+    multi_turn_ground_truth_list: list[list[str]],
+    long_context: bool,
+) -> list[tuple[list[str], dict[str, bytes], dict]]:
+    """
+    Returns, for each turn, the execution results of the ground truth function calls, the snapshots of the ground truth instances
+    (keyed by class name) at the end of that turn, and their state digests (keyed by class name, then attribute name).
+    The ground truth is only executed on a cache miss, or when the cache is disabled.
+    Use `restore_instances` to turn the snapshots of a turn back into instances.
+    """
+    if not _cache_enabled:
+        return _execute_ground_truth(test_entry, multi_turn_ground_truth_list, long_context)
+    cache = get_ground_truth_trace_cache()
+    key = cache.make_key(test_entry, multi_turn_ground_truth_list, long_context)
+    trace = cache.get(key)
+    if trace is None:
+        trace = _execute_ground_truth(test_entry, multi_turn_ground_truth_list, long_context)
+        cache.put(key, trace)
+    return trace
+
+
+def restore_instances(instance_snapshots: dict[str, bytes]) -> dict[str, object]:
+    """Fresh copies of the instances of one turn of a ground truth trace."""
+    return {
+        class_name: pickle.loads(instance_snapshot)
+        for class_name, instance_snapshot in instance_snapshots.items()
+    }
+
+
+def _execute_ground_truth(
+    test_entry: dict,
+    multi_turn_ground_truth_list: list[list[str]],
+    long_context: bool,
+) -> list[tuple[list[str], dict[str, bytes], dict]]:
+    trace = []
+    try:
+        for single_turn_ground_truth_list in multi_turn_ground_truth_list:
+            execution_results, ground_truth_instances = execute_multi_turn_func_call(
+                func_call_list=single_turn_ground_truth_list,
+                initial_config=test_entry["initial_config"],
+                involved_classes=test_entry["involved_classes"],
+                model_name=_GROUND_TRUTH_MODEL_NAME,
+                test_entry_id=test_entry["id"],
+                long_context=long_context,
+                is_evaL_run=True,
+            )
+            trace.append(
+                (
+                    execution_results,
+                    {
+                        class_name: pickle.dumps(instance)
+                        for class_name, instance in ground_truth_instances.items()
+                    },
+                    {
+                        class_name: instance_state_digests(instance)
+                        for class_name, instance in ground_truth_instances.items()
+                    },
+                )
+            )
+    finally:
+        release_execution_instances(
+            _GROUND_TRUTH_MODEL_NAME, test_entry["id"], is_evaL_run=True
+        )
+    return trace
+
+
+@lru_cache(maxsize=None)
+def _backend_source_hash(class_name: str) -> str:
+    module = importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name])
+    return hashlib.sha256(inspect.getsource(module).encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _execution_source_hash() -> str:
+    hasher = hashlib.sha256()
+    for module_name in _EXECUTION_MODULES:
+        module = importlib.import_module(module_name)
+        hasher.update(inspect.getsource(module).encode())
+    return hasher.hexdigest()
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from bfcl_eval.utils import atomic_write_bytes, serialize_to_json
+
+SNAPSHOT_FILE_SUFFIX = ".snap"
+# Bump this when the layout of the snapshot files changes
+SNAPSHOT_FORMAT_VERSION = 1
+_MAGIC = b"BFCL-MEMORY-SNAPSHOT\n"
+
+# Every that many snapshots in a chain, the snapshot is written in full, to bound the number of files read on load
+MAX_DELTA_CHAIN_DEPTH = 8
+_ZLIB_LEVEL = 6
+
+# How a section is stored
+_FULL = "full"  # The whole value
+_DELTA = "delta"  # A patch against the value of the same section in the parent snapshot
+_PARENT = "parent"  # Same value as in the parent snapshot
+
+
+class MemorySnapshot(Mapping):
+    """
+    A memory snapshot written by `write_snapshot`, i.e. a mapping from section name (e.g. `core_memory`) to a JSON-like value.
+
+    Only the header is read when the snapshot is opened; each section is read, decompressed and decoded
+    (along with the parent snapshots it is a delta against) the first time it is accessed.
+    The values are shared with the child snapshots in the same process, so they must not be mutated: copy them first.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if f.readline() != _MAGIC:
+                raise ValueError(f"{self.path} is not a memory snapshot file.")
+            header = json.loads(f.readline())
+            self._data_offset = f.tell()
+        if header["format_version"] != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"{self.path} was written with snapshot format version {header['format_version']}, expected {SNAPSHOT_FORMAT_VERSION}."
+            )
+        self.depth: int = header["depth"]
+        self._sections: dict[str, dict] = header["sections"]
+        # The file later snapshots should refer to as their parent, which is not overwritten by later entries
+        self.canonical_path = _resolve(self.path, header["canonical"])
+        self._parent_path = _resolve(self.path, header["parent"])
+        self._parent: Optional[MemorySnapshot] = None
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._values:
+            section = self._sections[name]
+            if section["kind"] == _PARENT:
+                value = self.parent[name]
+            else:
+                with open(self.path, "rb") as f:
+                    f.seek(self._data_offset + section["offset"])
+                    value = json.loads(zlib.decompress(f.read(section["length"])))
+                if section["kind"] == _DELTA:
+                    value = _apply_delta(self.parent[name], value)
+            self._values[name] = value
+        return self._values[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    @property
+    def parent(self) -> "MemorySnapshot":
+        if self._parent is None:
+            self._parent = _load_canonical_snapshot(self._parent_path)
+        return self._parent
+
+    def to_dict(self) -> dict:
+        return {name: self[name] for name in self}
+
+
+class _JsonSnapshot(dict):
+    """A snapshot in the original JSON format. It cannot be the parent of a delta."""
+
+    canonical_path = None
+    depth = 0
+
+    def to_dict(self) -> dict:
+        return dict(self)
+
+
+def load_snapshot(path: Path) -> Optional[Mapping]:
+    """
+    The snapshot at `path`, or the snapshot in the original JSON format next to it (same name, `.json` extension)
+    for results generated before the snapshot store existed. None if there is neither.
+    """
+    path = Path(path)
+    if path.exists():
+        snapshot = MemorySnapshot(path)
+        if snapshot.canonical_path != path and snapshot.canonical_path.exists():
+            # Same content as its canonical copy, which may already be decoded in this process
+            return _load_canonical_snapshot(snapshot.canonical_path)
+        return snapshot
+    json_path = path.with_suffix(".json")
+    if json_path.exists():
+        with open(json_path, "r") as f:
+            return _JsonSnapshot(json.load(f))
+    return None
+
+
+@lru_cache(maxsize=256)
+def _load_canonical_snapshot(path: Path) -> MemorySnapshot:
+    """
+    Canonical copies are named after their content and never change, so they are only read and decoded once per process;
+    e.g. all the entries of a memory scenario load the same final snapshot, and consecutive snapshots share their parents.
+    """
+    return MemorySnapshot(path)
+
+
+def write_snapshot(
+    name: Path,
+    sections: dict[str, Any],
+    parent: Optional[Mapping] = None,
+    copies: tuple[Path, ...] = (),
+) -> Path:
+    """
+    Write a snapshot to `{name}.{content hash}.snap` (the canonical copy, which later snapshots refer to), and to each of `copies`.
+    Returns the path of the canonical copy.
+
+    Sections are compressed, and those that did not change since the `parent` snapshot (the one the memory was loaded from)
+    are stored as a reference to it, or as a patch against it (keys added, removed or changed in dicts, text appended to strings)
+    when that is smaller. Every `MAX_DELTA_CHAIN_DEPTH` snapshots, the snapshot is written in full.
+
+    The content hash covers the parent file name, which itself covers the grandparent and so on: a canonical copy is never
+    overwritten with a different content, even when an entry of the chain is generated again, so the chains never break.
+    """
+    name = Path(name)
+    if (
+        parent is None
+        or parent.canonical_path is None
+        or parent.depth + 1 > MAX_DELTA_CHAIN_DEPTH
+    ):
+        parent = None
+
+    blobs = []
+    header_sections = {}
+    offset = 0
+    for section_name, value in sections.items():
+        # Compare with the parent on the values as they will be read back (e.g. integer dict keys become strings)
+        encoded = serialize_to_json(value)
+        value = json.loads(encoded)
+        kind, payload = _FULL, encoded
+        if parent is not None and section_name in parent:
+            parent_value = parent[section_name]
+            if parent_value == value and serialize_to_json(parent_value) == encoded:
+                kind, payload = _PARENT, None
+            else:
+                delta = _make_delta(parent_value, value)
+                encoded_delta = serialize_to_json(delta)
+                if len(encoded_delta) < len(encoded) and serialize_to_json(
+                    _apply_delta(parent_value, delta)
+                ) == encoded:
+                    kind, payload = _DELTA, encoded_delta
+
+        header_sections[section_name] = {"kind": kind}
+        if payload is not None:
+            blob = zlib.compress(payload, _ZLIB_LEVEL)
+            header_sections[section_name].update(offset=offset, length=len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+
+    if all(section["kind"] == _FULL for section in header_sections.values()):
+        parent = None
+    data = b"".join(blobs)
+
+    hasher = hashlib.sha256(json.dumps(header_sections, sort_keys=True).encode())
+    hasher.update(parent.canonical_path.name.encode() if parent is not None else b"")
+    hasher.update(data)
+    canonical_path = name.with_name(
+        f"{name.name}.{hasher.hexdigest()[:16]}{SNAPSHOT_FILE_SUFFIX}"
+    )
+
+    for path in (canonical_path, *map(Path, copies)):
+        header = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "canonical": _relative(path, canonical_path),
+            "parent": _relative(path, parent.canonical_path) if parent is not None else None,
+            "depth": parent.depth + 1 if parent is not None else 0,
+            "sections": header_sections,
+        }
+        atomic_write_bytes(path, _MAGIC + json.dumps(header).encode() + b"\n" + data)
+    return canonical_path
+
+
+def export_snapshot_to_json(snapshot_path: Path, json_path: Optional[Path] = None) -> Path:
+    """Write a snapshot in the original JSON format (next to it by default), e.g. to inspect it. Returns the JSON file path."""
+    snapshot_path = Path(snapshot_path)
+    json_path = Path(json_path) if json_path is not None else snapshot_path.with_suffix(".json")
+    with open(json_path, "w") as f:
+        json.dump(MemorySnapshot(snapshot_path).to_dict(), f, indent=4)
+    return json_path
+
+
+def _make_delta(old: Any, new: Any) -> dict:
+    """A patch that turns `old` into `new`: `{"v": new}`, `{"a": appended_text}`, or for dicts `{"set": ..., "del": ..., "patch": ...}`."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        delta = {
+            "set": {},
+            "del": [key for key in old if key not in new],
+            "patch": {},
+        }
+        for key, value in new.items():
+            if key not in old:
+                delta["set"][key] = value
+            elif old[key] != value:
+                delta["patch"][key] = _make_delta(old[key], value)
+        return delta
+    if isinstance(old, str) and isinstance(new, str) and old and new.startswith(old):
+        return {"a": new[len(old) :]}
+    return {"v": new}
+
+
+def _apply_delta(old: Any, delta: dict) -> Any:
+    """
+    Apply a patch made by `_make_delta`, without modifying `old`.
+    Keys of a patched dict keep their position and added keys come last, like when updating a dict in place.
+    """
+    if "v" in delta:
+        return delta["v"]
+    if "a" in delta:
+        return old + delta["a"]
+    deleted = set(delta["del"])
+    new = {key: value for key, value in old.items() if key not in deleted}
+    for key, key_delta in delta["patch"].items():
+        new[key] = _apply_delta(old[key], key_delta)
+    new.update(delta["set"])
+    return new
+
+
+def _relative(path: Path, target: Path) -> str:
+    return Path(os.path.relpath(target, path.parent)).as_posix()
+
+
+def _resolve(path: Path, relative_path: Optional[str]) -> Optional[Path]:
+    if relative_path is None:
+        return None
+    return Path(os.path.normpath(path.parent / relative_path))
+
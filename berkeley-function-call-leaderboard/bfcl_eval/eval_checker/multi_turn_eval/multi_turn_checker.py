@@ -1,7 +1,15 @@
+from collections import Counter
+
+from bfcl_eval.eval_checker.multi_turn_eval.ground_truth_trace_cache import (
+    get_ground_truth_trace,
+    restore_instances,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     execute_multi_turn_func_call,
     is_empty_execute_response,
+    release_execution_instances,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.state_hash import instance_state_digests
 
 #### Main functions ####
 
@@ -16,7 +24,27 @@ def multi_turn_checker(
     """
     The main function that checks the correctness of the model's function call execution.
     """
+    try:
+        return _multi_turn_execution_checker(
+            multi_turn_model_result_list_decoded,
+            multi_turn_ground_truth_list,
+            test_entry,
+            model_name,
+        )
+    finally:
+        # The model instances of this entry are not needed anymore
+        release_execution_instances(model_name, test_entry["id"], is_evaL_run=True)
 
+
+def _multi_turn_execution_checker(
+    multi_turn_model_result_list_decoded: list[list[list[str]]],
+    multi_turn_ground_truth_list: list[list[str]],
+    test_entry: dict,
+    model_name: str,
+) -> dict:
+    """
+    Execute the model's and the ground truth's function calls turn by turn, and compare the resulting states and responses.
+    """
     initial_config: dict = test_entry["initial_config"]
     involved_classes: list = test_entry["involved_classes"]
     test_entry_id: str = test_entry["id"]
@@ -24,6 +52,13 @@ def multi_turn_checker(
     execution_results: list[dict] = []
     all_turn_model_execution_results: list[str] = []
 
+    # The ground truth does not depend on the model, so its execution is cached across models
+    ground_truth_trace = get_ground_truth_trace(
+        test_entry,
+        multi_turn_ground_truth_list,
+        long_context=("long_context" in test_category or "composite" in test_category),
+    )
+
     # First execute all the function calls
     for turn_index, single_turn_ground_truth_list in enumerate(
         multi_turn_ground_truth_list
@@ -54,20 +89,12 @@ def multi_turn_checker(
             single_turn_model_execution_results.extend(single_step_model_execution_results)
             single_turn_model_execution_results_uncombined.append(single_step_model_execution_results)
 
-        # Execute the ground truth function calls
-        single_turn_ground_truth_execution_results, ground_truth_instances = (
-            execute_multi_turn_func_call(
-                func_call_list=single_turn_ground_truth_list,
-                initial_config=initial_config,
-                involved_classes=involved_classes,
-                model_name=model_name + "_ground_truth",
-                test_entry_id=test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=True,
-            )
-        )
+        # Results and end-of-turn state of the ground truth function calls
+        (
+            single_turn_ground_truth_execution_results,
+            ground_truth_instance_snapshots,
+            ground_truth_state_digests,
+        ) = ground_truth_trace[turn_index]
 
         all_turn_model_execution_results.extend(single_turn_model_execution_results)
         execution_results.append(
@@ -99,15 +126,18 @@ def multi_turn_checker(
 
         ## Check after each turn ##
         assert len(model_instances) == len(
-            ground_truth_instances
-        ), f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instances)}"
-        assert set(model_instances.keys()) == set(ground_truth_instances.keys())
+            ground_truth_instance_snapshots
+        ), f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instance_snapshots)}"
+        assert set(model_instances.keys()) == set(ground_truth_instance_snapshots.keys())
 
         # Check the state of the instances
-        state_check_result = state_checker(model_instances, ground_truth_instances)
-        if not state_check_result["valid"]:
-            state_check_result["execution_result"] = execution_results
-            return state_check_result
+        # Matching state digests mean matching states; only restore the ground truth instances and compare them attribute by attribute otherwise
+        if not _state_digests_match(model_instances, ground_truth_state_digests):
+            ground_truth_instances = restore_instances(ground_truth_instance_snapshots)
+            state_check_result = state_checker(model_instances, ground_truth_instances)
+            if not state_check_result["valid"]:
+                state_check_result["execution_result"] = execution_results
+                return state_check_result
 
         # Check the response of the function calls
         # We use the all_turn_model_execution_results to accomodate the situation where the model invokes a function in a previous turn, and thus don't need to invoke it again in the current turn.
@@ -256,6 +286,19 @@ def method_invoke_order_checker(model_instances: dict, ground_truth_instances: d
 #### Helper functions ####
 
 
+def _state_digests_match(model_instances: dict, ground_truth_state_digests: dict) -> bool:
+    """
+    Checks if every model instance has the same state digests as the corresponding ground truth instance.
+    A False result is inconclusive (some values can only be compared with `==`), and should be confirmed by the state_checker.
+    """
+    for class_name, ground_truth_digests in ground_truth_state_digests.items():
+        if None in ground_truth_digests.values():
+            return False
+        if instance_state_digests(model_instances[class_name]) != ground_truth_digests:
+            return False
+    return True
+
+
 def _compare_instances(model_obect, ground_truth_object):
     """
     Checks if the model_object has the same attributes as the ground_truth_object. They are instances of the same class.
@@ -296,19 +339,34 @@ def _is_subsequence_unordered(list1, list2) -> tuple[bool, list]:
     Checks if all elements of list1 are present in list2, regardless of order.
     Also returns the elements of list1 that are not present in list2.
     """
+    # Count the occurrences in list2, so that each of them matches at most one item of list1 (to handle duplicates)
+    missing_elements = []
+    try:
+        list2_counter = Counter(list2)
+        for item in list1:
+            if list2_counter[item] > 0:
+                list2_counter[item] -= 1
+            else:
+                missing_elements.append(item)
+    except TypeError:
+        # Unhashable items; fall back to removing the matched items from a copy of list2
+        return _is_subsequence_unordered_unhashable(list1, list2)
+
+    # If there are missing elements, list1 is not a subsequence of list2
+    is_subsequence = len(missing_elements) == 0
+    return is_subsequence, missing_elements
+
+
+def _is_subsequence_unordered_unhashable(list1, list2) -> tuple[bool, list]:
     # Copy list2 to avoid modifying the original list during checks
     list2_copy = list2[:]
-    
-    # Check each item in list1 to see if it exists in list2_copy
+
     missing_elements = []
     for item in list1:
         try:
-            # Attempt to remove one occurrence of `item` from list2_copy to handle duplicates
+            # Remove one occurrence of `item` from list2_copy to handle duplicates
             list2_copy.remove(item)
         except ValueError:
-            # If item is not found, add it to missing_elements
             missing_elements.append(item)
-    
-    # If there are missing elements, list1 is not a subsequence of list2
-    is_subsequence = len(missing_elements) == 0
-    return is_subsequence, missing_elements
+
+    return len(missing_elements) == 0, missing_elements
@@ -1,8 +1,12 @@
+import ast
 import copy
 import importlib
 import inspect
 import json
 import re
+import threading
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
 from bfcl_eval.constants.executable_backend_config import (
     CLASS_FILE_PATH_MAPPING,
@@ -10,6 +14,91 @@ from bfcl_eval.constants.executable_backend_config import (
 )
 
 
+class ExecutionInstanceRegistry:
+    """
+    Keeps the backend instances (`GorillaFileSystem`, `TradingBot`, etc.) of the test entries that are being executed.
+
+    The instances of an entry live across the turns and steps of its conversation, and are keyed by
+    the (model name, test entry id) pair, so that the generation run, the model evaluation and the ground truth evaluation
+    of the same entry each get their own copies. They must be released with `release` once the entry is done,
+    otherwise they stay in memory for the life of the process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._instances: dict[tuple[str, str], dict[str, object]] = {}
+
+    def get_or_create(
+        self,
+        model_name: str,
+        test_entry_id: str,
+        class_name: str,
+        initial_config: dict,
+        long_context: bool,
+    ) -> object:
+        with self._lock:
+            entry_instances = self._instances.setdefault((model_name, test_entry_id), {})
+            if class_name in entry_instances:
+                # This happens in subsequent turns
+                return entry_instances[class_name]
+
+        module = importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name])
+        class_ = getattr(module, class_name)
+        class_instance = class_()
+        if class_name not in STATELESS_CLASSES:
+            class_initial_config = initial_config.get(class_name, {})
+            # Deep copy the initial configuration to avoid mutation issues
+            class_instance._load_scenario(
+                copy.deepcopy(class_initial_config), long_context=long_context
+            )
+
+        with self._lock:
+            return self._instances.setdefault((model_name, test_entry_id), {}).setdefault(
+                class_name, class_instance
+            )
+
+    def release(self, model_name: str, test_entry_id: str) -> None:
+        """Drop all the instances of an entry. Releasing an entry that has no instances is a no-op."""
+        with self._lock:
+            self._instances.pop((model_name, test_entry_id), None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._instances)
+
+
+_execution_instance_registry = ExecutionInstanceRegistry()
+
+# Public method names of each backend class, computed once per class
+_public_method_names_cache: dict[type, list[str]] = {}
+
+
+def _get_public_method_names(class_instance) -> list[str]:
+    class_ = type(class_instance)
+    if class_ not in _public_method_names_cache:
+        _public_method_names_cache[class_] = [
+            method_name
+            for method_name, _ in inspect.getmembers(
+                class_instance, predicate=inspect.ismethod
+            )
+            # Skip private methods
+            if not method_name.startswith("_")
+        ]
+    return _public_method_names_cache[class_]
+
+
+def release_execution_instances(
+    model_name: str, test_entry_id: str, is_evaL_run: bool = False
+) -> None:
+    """
+    Release the backend instances created by `execute_multi_turn_func_call` for one test entry.
+    Call it with the same `model_name` and `is_evaL_run` once the entry has finished generating or evaluating.
+    """
+    if is_evaL_run:
+        model_name += "_eval"
+    _execution_instance_registry.release(model_name, test_entry_id)
+
+
 def execute_multi_turn_func_call(
     func_call_list: list[str],  # a list of strings of func calls
     initial_config: dict,
@@ -20,67 +109,50 @@ def execute_multi_turn_func_call(
     is_evaL_run: bool = False,
 ) -> tuple[list[str], dict]:
     """
-    TODO: Add docstring
+    Execute the function calls against the backend instances of the test entry, creating them on the first call.
+    The instances are kept in the execution instance registry until `release_execution_instances` is called for the entry.
+    Returns the execution result of each function call and the involved instances, keyed by class name.
     """
     if is_evaL_run:
         model_name += "_eval"
 
     class_method_name_mapping = {}
+    method_to_instance = {}
     involved_instances = {}
+    # The names under which the instances are visible to the evaluated function calls
+    instance_namespace = {}
     for class_name in involved_classes:
-        module_name = CLASS_FILE_PATH_MAPPING[class_name]
-        # TODO: Handler the model name issue from handler more elegantly
-        instance_name = (
-            f"{model_name}_{test_entry_id}_{class_name}_instance"
+        class_instance = _execution_instance_registry.get_or_create(
+            model_name, test_entry_id, class_name, initial_config, long_context
         )
-        instance_name = re.sub(r'[-./]', '_', instance_name)
-        if instance_name not in globals():
-            module = importlib.import_module(module_name)
-            class_ = getattr(module, class_name)
-            class_instance = class_()
-            if class_name not in STATELESS_CLASSES:
-                class_initial_config = initial_config.get(class_name, {})
-                # Deep copy the initial configuration to avoid mutation issues
-                class_instance._load_scenario(
-                    copy.deepcopy(class_initial_config), long_context=long_context
-                )
-            globals()[instance_name] = class_instance
-        # This happens in subsequent turns
-        else:
-            class_instance = globals()[instance_name]
-
         involved_instances[class_name] = class_instance
 
-        # Retrieve all method names and map them to the instance
-        for method_name, method in inspect.getmembers(
-            class_instance, predicate=inspect.ismethod
-        ):
-            # Skip private methods
-            if method_name.startswith("_"):
-                continue
+        instance_name = f"{class_name}_instance"
+        instance_namespace[instance_name] = class_instance
+        # Map all the method names to the instance
+        for method_name in _get_public_method_names(class_instance):
             class_method_name_mapping[method_name] = instance_name
+            method_to_instance[method_name] = class_instance
+
+    # Only needed for the calls that the dispatcher cannot handle, built on first use
+    eval_namespace = None
 
     execution_results = []
     for func_call in func_call_list:
-        # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
-
-        # Evaluate the function call
         try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error. 
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
+            parsed_call = _parse_func_call(func_call)
+            if parsed_call is not None and parsed_call.callee_names <= method_to_instance.keys():
+                # Plain (possibly nested) method calls with literal arguments: dispatch them directly
+                if parsed_call.plan[1] in DISALLOWED_FUNCTION_NAMES:
+                    raise Exception(f"Function call {parsed_call.plan[1]} is not allowed.")
+                func_call_result = _dispatch_call(parsed_call.plan, method_to_instance)
+            else:
+                if eval_namespace is None:
+                    # A single namespace (rather than separate globals and locals) so that the instances are also visible inside comprehensions
+                    eval_namespace = {**globals(), **instance_namespace}
+                func_call_result = _eval_func_call(
+                    func_call, class_method_name_mapping, eval_namespace
+                )
 
             if type(func_call_result) == str:
                 pass
@@ -100,6 +172,103 @@ def execute_multi_turn_func_call(
     return execution_results, involved_instances
 
 
+# Functions that are never executed, even if a backend class happens to define them
+DISALLOWED_FUNCTION_NAMES = ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]
+
+
+class _ParsedCall(NamedTuple):
+    # Nested tuples: ("call", method_name, args, kwargs) or ("value", literal, is_mutable)
+    plan: tuple
+    # Every function name called in the expression, including the nested calls
+    callee_names: frozenset
+
+
+@lru_cache(maxsize=65536)
+def _parse_func_call(func_call: str) -> Optional[_ParsedCall]:
+    """
+    Parse a function call string like `cd(folder='documents')` into an execution plan, once per distinct string.
+    Returns None for anything but a call by plain name whose arguments are literals or such calls themselves;
+    those are left to `_eval_func_call`.
+    """
+    try:
+        tree = ast.parse(func_call.strip(), mode="eval")
+    except SyntaxError:
+        return None
+    callee_names = set()
+    plan = _build_call_plan(tree.body, callee_names)
+    if plan is None or plan[0] != "call":
+        return None
+    return _ParsedCall(plan, frozenset(callee_names))
+
+
+def _build_call_plan(node: ast.AST, callee_names: set) -> Optional[tuple]:
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name):
+            return None
+        args = []
+        for arg in node.args:
+            if isinstance(arg, ast.Starred):
+                return None
+            arg_plan = _build_call_plan(arg, callee_names)
+            if arg_plan is None:
+                return None
+            args.append(arg_plan)
+        kwargs = []
+        for keyword in node.keywords:
+            # `**kwargs` has no argument name
+            if keyword.arg is None:
+                return None
+            value_plan = _build_call_plan(keyword.value, callee_names)
+            if value_plan is None:
+                return None
+            kwargs.append((keyword.arg, value_plan))
+        callee_names.add(node.func.id)
+        return ("call", node.func.id, tuple(args), tuple(kwargs))
+
+    if any(isinstance(child, ast.Call) for child in ast.walk(node)):
+        # e.g. a call nested in a list literal
+        return None
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return ("value", value, isinstance(value, (list, dict, set)))
+
+
+def _dispatch_call(plan: tuple, method_to_instance: dict):
+    if plan[0] == "value":
+        _, value, is_mutable = plan
+        # The plan is shared by every execution of the same string, so it must not be mutated by the backend
+        return copy.deepcopy(value) if is_mutable else value
+    _, method_name, args, kwargs = plan
+    method = getattr(method_to_instance[method_name], method_name)
+    return method(
+        *[_dispatch_call(arg, method_to_instance) for arg in args],
+        **{name: _dispatch_call(value, method_to_instance) for name, value in kwargs},
+    )
+
+
+def _eval_func_call(func_call: str, class_method_name_mapping: dict, eval_namespace: dict):
+    """Fallback for the calls that `_parse_func_call` does not handle (builtins, expressions, syntax errors, ...)."""
+    # Add the instance name to the method calls
+    func_call = _process_method_calls(func_call, class_method_name_mapping)
+
+    # We need to make a copy here because otherwise the `eval(func_call)` would error.
+    func_call_copy = func_call
+    # Before calling `eval`, we need to make sure that the function call is safe
+    # We do so by checking if the function is `kill` or `exit`, etc.
+    # Extract the function name first
+    if "(" in func_call_copy:
+        func_call_copy = func_call_copy.split("(")[0]
+    # Situation where the function call is a method call
+    if "." in func_call_copy:
+        func_call_copy = func_call_copy.split(".")[1]
+    if func_call_copy in DISALLOWED_FUNCTION_NAMES:
+        raise Exception(f"Function call {func_call_copy} is not allowed.")
+
+    return eval(func_call, eval_namespace)
+
+
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
@@ -0,0 +1,171 @@
+import datetime
+import hashlib
+import io
+import math
+import pickle
+import re
+from typing import Any, Optional
+
+# Bump this when the way digests are computed changes, so that digests stored in the ground truth trace cache are not reused
+STATE_HASH_VERSION = 1
+
+# Immutable values, encoded from their content (the repr for non-string types) and a tag for their type.
+# Two values of the same type with the same repr are equal.
+_SCALAR_TAGS = {
+    type(None): b"n",
+    bool: b"b",
+    int: b"i",
+    float: b"f",
+    complex: b"c",
+    str: b"s",
+    bytes: b"y",
+    datetime.date: b"d",
+    datetime.datetime: b"t",
+    datetime.time: b"h",
+    datetime.timedelta: b"e",
+}
+
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+# Pickled floats (opcode `G`) that may be NaN or infinite; NaN is not equal to itself, so such containers are not hashed from their pickle
+_PICKLED_NON_FINITE_FLOAT = re.compile(rb"G[\x7f\xff][\xf0-\xff]")
+
+
+def instance_state_digests(instance: object) -> dict[str, Optional[bytes]]:
+    """
+    Digest of each public attribute of a backend instance, i.e. of the state compared by the state checker.
+    """
+    return {
+        attr_name: state_digest(value)
+        for attr_name, value in vars(instance).items()
+        if not attr_name.startswith("_")
+    }
+
+
+def state_digest(value: Any) -> Optional[bytes]:
+    """
+    Merkle-style digest of a value, such that equal digests mean equal values.
+
+    Containers of builtin values (the bulk of the backend state: dicts of orders, bookings, messages...)
+    are hashed from their pickle, which is computed at C speed. Containers holding objects are hashed
+    from the encodings of their items (dicts and sets order-insensitively, like `==`).
+
+    Objects take part in the hash if their class lists the attributes that define their equality in `_state_hash_attributes`.
+    Their digest is cached on the object and reused as long as those attributes still hold the same immutable values,
+    so unchanged nodes (e.g. the files of a large file system) are not hashed again after every turn.
+
+    Returns None for values that cannot be hashed structurally (other objects, NaN, cycles); such values must be compared with `==`.
+    Different digests do not guarantee different values (e.g. `1 == 1.0`, or dicts built in a different order),
+    so a digest mismatch should also be confirmed with `==`.
+    """
+    try:
+        return _hash(b"value:", _encode(value, set()))
+    except _Unhashable:
+        return None
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def _hash(tag: bytes, *parts: bytes) -> bytes:
+    hasher = hashlib.blake2b(tag, digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _encode_scalar(value: Any) -> bytes:
+    """Self-delimiting encoding of a scalar: type tag, length and content."""
+    value_type = type(value)
+    if value_type is str:
+        data = value.encode("utf-8", "surrogatepass")
+    elif value_type is bytes:
+        data = value
+    else:
+        if value_type is float and math.isnan(value):
+            # NaN is not equal to itself
+            raise _Unhashable
+        data = repr(value).encode()
+    return _SCALAR_TAGS[value_type] + len(data).to_bytes(8, "little") + data
+
+
+def _encode(value: Any, ancestors: set[int]) -> bytes:
+    """
+    Scalars are encoded inline; containers and objects are replaced by a 1-byte tag followed by a 16-byte digest,
+    which keeps every encoding self-delimiting.
+    """
+    value_type = type(value)
+    if value_type in _SCALAR_TAGS:
+        return _encode_scalar(value)
+
+    if id(value) in ancestors:
+        raise _Unhashable
+    ancestors.add(id(value))
+    try:
+        if value_type in _CONTAINER_TYPES:
+            pickled = _pickle_builtin_container(value)
+            if pickled is not None:
+                return b"P" + _hash(b"pickle:", pickled)
+
+        if value_type is dict:
+            # Order-insensitive, like dict equality
+            items = sorted(
+                _encode(key, ancestors) + _encode(item, ancestors)
+                for key, item in value.items()
+            )
+            return b"D" + _hash(b"dict:", *items)
+        if value_type is list:
+            return b"L" + _hash(b"list:", *(_encode(item, ancestors) for item in value))
+        if value_type is tuple:
+            return b"T" + _hash(b"tuple:", *(_encode(item, ancestors) for item in value))
+        if value_type is set or value_type is frozenset:
+            return b"S" + _hash(b"set:", *sorted(_encode(item, ancestors) for item in value))
+
+        attr_names = getattr(value_type, "_state_hash_attributes", None)
+        if attr_names is None:
+            raise _Unhashable
+        return b"O" + _object_digest(value, attr_names, ancestors)
+    finally:
+        ancestors.discard(id(value))
+
+
+def _pickle_builtin_container(value: Any) -> Optional[bytes]:
+    """The pickle of a container made only of builtin values, or None if it holds other objects or non-finite floats."""
+    buffer = io.BytesIO()
+    try:
+        _BuiltinPickler(buffer, protocol=4).dump(value)
+    except _Unhashable:
+        return None
+    except RecursionError:
+        raise _Unhashable
+    pickled = buffer.getvalue()
+    if _PICKLED_NON_FINITE_FLOAT.search(pickled):
+        return None
+    return pickled
+
+
+class _BuiltinPickler(pickle.Pickler):
+    # Not called for the builtin containers and scalars, which the C pickler handles itself
+    def reducer_override(self, obj):
+        if type(obj) in _SCALAR_TAGS or isinstance(obj, type):
+            return NotImplemented
+        raise _Unhashable
+
+
+def _object_digest(value: Any, attr_names: tuple[str, ...], ancestors: set[int]) -> bytes:
+    attr_values = tuple(getattr(value, attr_name) for attr_name in attr_names)
+    cache = value.__dict__.get("_state_hash_cache")
+    if cache is not None:
+        cached_values, cached_digest = cache
+        if all(a is b for a, b in zip(attr_values, cached_values)):
+            return cached_digest
+
+    digest = _hash(
+        type(value).__qualname__.encode() + b":",
+        *(_encode(attr_value, ancestors) for attr_value in attr_values),
+    )
+    # Mutable attributes (e.g. the contents of a directory) can change in place, so only cache nodes made of immutable values
+    if all(type(attr_value) in _SCALAR_TAGS for attr_value in attr_values):
+        value._state_hash_cache = (attr_values, digest)
+    return digest
@@ -0,0 +1,293 @@
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+from bfcl_eval.constants.eval_config import PROJECT_ROOT, WEB_SEARCH_CACHE_PATH
+from bfcl_eval.utils import atomic_write_bytes
+
+# - "live": every request goes to the network (the default)
+# - "record": every request goes to the network, and the response is stored (or overwritten) in the cache
+# - "replay": serve responses from the cache when possible, otherwise go to the network and store the response
+# - "strict-replay": only serve responses from the cache; a cache miss is an error, nothing goes to the network
+WEB_SEARCH_TRANSPORT_MODES = ["live", "record", "replay", "strict-replay"]
+
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+SERPAPI_SEARCH_URL = "https://serpapi.com/search"
+
+# Request parameters that hold credentials; they are not part of the cache key and are not stored
+_SECRET_PARAMS = {"api_key", "serp_api_key"}
+# Responses that are not worth replaying: rate limits and server-side failures are retried or transient
+_UNCACHED_STATUS_CODES = {429} | set(range(500, 600))
+
+
+class WebSearchCacheMissError(Exception):
+    """Raised in `strict-replay` mode when a request has no recorded response."""
+
+
+class WebResponse:
+    """The part of a `requests.Response` that `WebSearchAPI` uses, so that responses can be stored and served without the network."""
+
+    def __init__(self, status_code: int, text: str, url: str, reason: str = "") -> None:
+        self.status_code = status_code
+        self.text = text
+        self.url = url
+        self.reason = reason
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        # Same message as `requests.Response.raise_for_status`
+        if 400 <= self.status_code < 500:
+            message = f"{self.status_code} Client Error: {self.reason} for url: {self.url}"
+        elif 500 <= self.status_code < 600:
+            message = f"{self.status_code} Server Error: {self.reason} for url: {self.url}"
+        else:
+            return
+        raise requests.HTTPError(message, response=self)
+
+    def to_dict(self) -> dict:
+        return {
+            "status_code": self.status_code,
+            "text": self.text,
+            "url": self.url,
+            "reason": self.reason,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WebResponse":
+        return cls(data["status_code"], data["text"], data["url"], data.get("reason", ""))
+
+
+class LiveTransport:
+    """Sends the requests over the network with `requests`."""
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: float = 20,
+        allow_redirects: bool = True,
+    ) -> WebResponse:
+        response = requests.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+        )
+        return WebResponse(response.status_code, response.text, response.url, response.reason)
+
+
+class CachingTransport:
+    """
+    Record/replay layer in front of another transport, backed by a content-addressed on-disk cache.
+
+    The key is a hash of the URL and the query parameters, credentials excluded; headers (user agent, API token) are not part of it.
+    Each response is stored in its own gzipped JSON file, along with the request it answers, under `{key[:2]}/{key}.json.gz`,
+    so that a cache can be inspected, merged or checked in as a fixture. Rate-limit and server errors are never stored.
+    """
+
+    def __init__(self, inner, path: Path, mode: str) -> None:
+        if mode not in WEB_SEARCH_TRANSPORT_MODES or mode == "live":
+            raise ValueError(
+                f"Invalid web search cache mode '{mode}'. Choose from {WEB_SEARCH_TRANSPORT_MODES[1:]}."
+            )
+        self.inner = inner
+        self.path = Path(path)
+        self.mode = mode
+
+    @staticmethod
+    def make_request(url: str, params: Optional[dict]) -> dict:
+        return {
+            "method": "GET",
+            "url": url,
+            "params": {
+                str(name): value
+                for name, value in sorted((params or {}).items())
+                if name not in _SECRET_PARAMS
+            },
+        }
+
+    @staticmethod
+    def make_key(request: dict) -> str:
+        serialized = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: float = 20,
+        allow_redirects: bool = True,
+    ) -> WebResponse:
+        request = self.make_request(url, params)
+        key = self.make_key(request)
+        file_path = self.path / key[:2] / f"{key}.json.gz"
+
+        if self.mode != "record":
+            recorded = self._read(file_path)
+            if recorded is not None:
+                return recorded
+            if self.mode == "strict-replay":
+                print(f"⚠️ [WebSearchAPI] No recorded response for GET {url} {request['params']} (strict-replay).")
+                raise WebSearchCacheMissError(
+                    f"No recorded response for GET {url} with parameters {request['params']}; the web search cache is in strict-replay mode."
+                )
+
+        response = self.inner.get(
+            url, params=params, headers=headers, timeout=timeout, allow_redirects=allow_redirects
+        )
+        if response.status_code not in _UNCACHED_STATUS_CODES:
+            record = {"request": request, "response": response.to_dict()}
+            atomic_write_bytes(
+                file_path, gzip.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            )
+        return response
+
+    @staticmethod
+    def _read(file_path: Path) -> Optional[WebResponse]:
+        try:
+            with gzip.open(file_path, "rt", encoding="utf-8") as f:
+                return WebResponse.from_dict(json.load(f)["response"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+class FixtureTransport:
+    """
+    Local stand-in for the web, serving a fixture corpus instead of the network.
+
+    The corpus is a JSON Lines file with one page per line: `{"url": ..., "title": ..., "snippet": ..., "content": ...}`,
+    where `snippet` (the search result description) and `content` (the page HTML) are optional.
+    Requests to the Brave Search API are answered by ranking the pages against the query with BM25+, in the Brave response format;
+    requests to the URL of a page return its content, and any other URL gets a 404.
+    """
+
+    def __init__(self, corpus_path: Path) -> None:
+        # Imported here: it is only needed when the fixture backend is used
+        from rank_bm25 import BM25Plus
+
+        self.corpus_path = Path(corpus_path)
+        self.pages: list[dict] = []
+        with open(self.corpus_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self.pages.append(json.loads(line))
+        self._pages_by_url = {_normalize_url(page["url"]): page for page in self.pages}
+        self._tokenized_pages = [
+            _tokenize(" ".join([page["title"], page.get("snippet", ""), _page_text(page)]))
+            for page in self.pages
+        ]
+        self._bm25 = BM25Plus(self._tokenized_pages) if self.pages else None
+
+    def search(self, query: str, count: int = 10) -> list[dict]:
+        """The pages matching at least one term of the query, best first (ties in corpus order)."""
+        query_tokens = _tokenize(query)
+        if self._bm25 is None or not query_tokens:
+            return []
+        scores = self._bm25.get_scores(query_tokens)
+        query_terms = set(query_tokens)
+        ranked = sorted(
+            (
+                i
+                for i, tokens in enumerate(self._tokenized_pages)
+                if query_terms.intersection(tokens)
+            ),
+            key=lambda i: scores[i],
+            reverse=True,
+        )
+        return [self.pages[i] for i in ranked[:count]]
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: float = 20,
+        allow_redirects: bool = True,
+    ) -> WebResponse:
+        params = params or {}
+        if url == BRAVE_SEARCH_URL:
+            results = [
+                {
+                    "title": page["title"],
+                    "url": page["url"],
+                    "description": page.get("snippet", ""),
+                }
+                for page in self.search(str(params.get("q", "")), int(params.get("count") or 10))
+            ]
+            return WebResponse(200, json.dumps({"web": {"results": results}}), url, "OK")
+
+        page = self._pages_by_url.get(_normalize_url(url))
+        if page is None:
+            return WebResponse(404, "", url, "Not Found")
+        return WebResponse(200, _page_html(page), url, "OK")
+
+
+def _tokenize(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _normalize_url(url: str) -> str:
+    parsed = urlparse(url)
+    return parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        path=parsed.path.rstrip("/"),
+        fragment="",
+    ).geturl()
+
+
+def _page_html(page: dict) -> str:
+    if page.get("content"):
+        return page["content"]
+    return (
+        f"<html><head><title>{html.escape(page['title'])}</title></head>"
+        f"<body><h1>{html.escape(page['title'])}</h1><p>{html.escape(page.get('snippet', ''))}</p></body></html>"
+    )
+
+
+def _page_text(page: dict) -> str:
+    return re.sub(r"<[^>]+>", " ", page.get("content", ""))
+
+
+_web_search_transport = None
+_web_search_transport_lock = threading.Lock()
+
+
+def get_web_search_transport():
+    """
+    The transport shared by all the `WebSearchAPI` instances, configured from the environment:
+    - `BFCL_WEB_SEARCH_FIXTURE_PATH`: serve this fixture corpus instead of the web (see `FixtureTransport`), no API key needed.
+    - `BFCL_WEB_SEARCH_CACHE`: one of `WEB_SEARCH_TRANSPORT_MODES`, `live` by default.
+    - `BFCL_WEB_SEARCH_CACHE_PATH`: the cache directory, relative to the project root. Defaults to `web_search_cache/`.
+    """
+    global _web_search_transport
+    with _web_search_transport_lock:
+        if _web_search_transport is None:
+            fixture_path = os.getenv("BFCL_WEB_SEARCH_FIXTURE_PATH")
+            transport = (
+                FixtureTransport(PROJECT_ROOT / fixture_path) if fixture_path else LiveTransport()
+            )
+            mode = os.getenv("BFCL_WEB_SEARCH_CACHE") or "live"
+            if mode != "live":
+                cache_path = os.getenv("BFCL_WEB_SEARCH_CACHE_PATH")
+                transport = CachingTransport(
+                    transport,
+                    PROJECT_ROOT / cache_path if cache_path else WEB_SEARCH_CACHE_PATH,
+                    mode,
+                )
+            _web_search_transport = transport
+        return _web_search_transport
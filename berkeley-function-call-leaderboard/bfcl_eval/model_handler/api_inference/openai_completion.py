@@ -15,7 +15,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 
 
 class OpenAICompletionsHandler(BaseHandler):
@@ -30,6 +30,8 @@ class OpenAICompletionsHandler(BaseHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
         self.client = OpenAI(**self._build_client_kwargs())
+        # Created lazily by `_get_async_client`, only when the asyncio inference engine is used
+        self.async_client = None
 
     def _build_client_kwargs(self):
         """Collect OpenAI client keyword arguments from environment variables, but only
@@ -49,6 +51,34 @@ class OpenAICompletionsHandler(BaseHandler):
 
         return kwargs
 
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Mirror `self.client` into an `AsyncOpenAI` client for the asyncio inference engine.
+        Subclasses often replace `self.client` with their own endpoint and credentials, so the async client is built from it rather than from the environment.
+        """
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(
+                api_key=self.client.api_key,
+                base_url=self.client.base_url,
+                organization=self.client.organization,
+                timeout=self.client.timeout,
+                default_headers=getattr(self.client, "_custom_headers", None),
+            )
+        return self.async_client
+
+    def _supports_native_async(self) -> bool:
+        """
+        The native async path is only taken when the handler talks to a plain OpenAI client through the request flow defined in this class.
+        Subclasses that customize the query or the client (streaming, extra fields, third-party SDKs) fall back to running their sync query in a worker thread.
+        """
+        cls = type(self)
+        return (
+            isinstance(self.client, OpenAI)
+            and cls._query_FC is OpenAICompletionsHandler._query_FC
+            and cls._query_prompting is OpenAICompletionsHandler._query_prompting
+            and cls.generate_with_backoff is OpenAICompletionsHandler.generate_with_backoff
+        )
+
     def decode_ast(self, result, language, has_tool_call_tag):
         if self.is_fc_model:
             decoded_output = []
@@ -74,9 +104,28 @@ class OpenAICompletionsHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self._get_async_client().chat.completions.create(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._build_FC_request_kwargs(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        if not self._supports_native_async():
+            return await super()._query_FC_async(inference_data)
+
+        return await self.generate_with_backoff_async(
+            **self._build_FC_request_kwargs(inference_data)
+        )
+
+    def _build_FC_request_kwargs(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -91,7 +140,7 @@ class OpenAICompletionsHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -216,15 +265,28 @@ class OpenAICompletionsHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
-        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
-
         return self.generate_with_backoff(
-            messages=inference_data["message"],
-            model=self.model_name,
-            temperature=self.temperature,
-            store=False,
+            **self._build_prompting_request_kwargs(inference_data)
         )
 
+    async def _query_prompting_async(self, inference_data: dict):
+        if not self._supports_native_async():
+            return await super()._query_prompting_async(inference_data)
+
+        return await self.generate_with_backoff_async(
+            **self._build_prompting_request_kwargs(inference_data)
+        )
+
+    def _build_prompting_request_kwargs(self, inference_data: dict) -> dict:
+        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+
+        return {
+            "messages": inference_data["message"],
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "store": False,
+        }
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
         test_entry_id: str = test_entry["id"]
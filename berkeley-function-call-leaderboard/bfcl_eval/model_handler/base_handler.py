@@ -1,8 +1,13 @@
+import asyncio
+import hashlib
+import inspect
 import json
+import sys
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generator, Optional
 
-from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval._result_store import ResultWriter
 from bfcl_eval.constants.default_prompts import (
     DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_FC,
     DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_PROMPTING,
@@ -17,8 +22,13 @@ from bfcl_eval.constants.executable_backend_config import (
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     execute_multi_turn_func_call,
     is_empty_execute_response,
+    release_execution_instances,
+)
+from bfcl_eval.model_handler.response_cache import ResponseCache, ResponseCacheMissError
+from bfcl_eval.model_handler.utils import (
+    add_memory_instruction_system_prompt,
+    get_ast_decode_params,
 )
-from bfcl_eval.model_handler.utils import add_memory_instruction_system_prompt
 from bfcl_eval.utils import *
 from overrides import final
 
@@ -60,6 +70,10 @@ class BaseHandler:
         # Replace the slash with underscore to avoid creating subdirectories
         self.registry_dir_name = registry_name.replace("/", "_")
         self.temperature = temperature
+        # Set by the generation pipeline when `--response-cache` is used
+        self.response_cache: Optional[ResponseCache] = None
+        # Set by the generation pipeline when `--store-decoded-result` is used
+        self.store_decoded_result = False
 
         # Set any additional attributes passed via kwargs
         for _key, _value in kwargs.items():
@@ -91,6 +105,151 @@ class BaseHandler:
             else:
                 return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    async def inference_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ):
+        """
+        Async counterpart of `inference`, used by the asyncio inference engine (`--async-inference`).
+        The dispatch logic must stay in sync with `inference`.
+        """
+        if "FC" in self.registry_name or self.is_fc_model:
+            if contain_multi_turn_interaction(test_entry["id"]):
+                return await self.inference_multi_turn_FC_async(
+                    test_entry, include_input_log, exclude_state_log
+                )
+            else:
+                return await self.inference_single_turn_FC_async(
+                    test_entry, include_input_log
+                )
+        else:
+            if contain_multi_turn_interaction(test_entry["id"]):
+                return await self.inference_multi_turn_prompting_async(
+                    test_entry, include_input_log, exclude_state_log
+                )
+            else:
+                return await self.inference_single_turn_prompting_async(
+                    test_entry, include_input_log
+                )
+
+    #### Inference step drivers ####
+
+    # The inference loops below are written once, as generators that yield the `inference_data` every time they need a model response and receive `(api_response, query_latency)` back.
+    # The same loop can then be driven either synchronously (thread pool engine) or asynchronously (asyncio engine).
+
+    @staticmethod
+    def _advance_inference_steps(
+        steps: Generator, query_result: Any
+    ) -> tuple[bool, Any]:
+        """
+        Resume the step generator with the latest query result.
+        Returns `(True, final_result)` once the generator is exhausted, otherwise `(False, next_inference_data)`.
+        """
+        try:
+            return False, steps.send(query_result)
+        except StopIteration as stop:
+            return True, stop.value
+
+    @final
+    def _run_inference_steps(self, steps: Generator, query: Callable[[dict], Any]):
+        finished, payload = self._advance_inference_steps(steps, None)
+        while not finished:
+            finished, payload = self._advance_inference_steps(
+                steps, self._query_with_cache(query, payload)
+            )
+        return payload
+
+    @final
+    async def _run_inference_steps_async(
+        self,
+        steps: Generator,
+        query: Callable[[dict], Awaitable[Any]],
+        offload_steps: bool,
+    ):
+        """
+        If `offload_steps` is True, the code between two queries (decoding, function execution, state logging) runs in a worker thread so that the event loop is never blocked by it.
+        This is needed for multi-turn entries, whose backends can be CPU heavy or do blocking IO (e.g. web search).
+        """
+
+        async def advance(query_result):
+            if offload_steps:
+                return await asyncio.to_thread(
+                    self._advance_inference_steps, steps, query_result
+                )
+            return self._advance_inference_steps(steps, query_result)
+
+        finished, payload = await advance(None)
+        while not finished:
+            finished, payload = await advance(
+                await self._query_with_cache_async(query, payload)
+            )
+        return payload
+
+    #### Response cache ####
+
+    def _get_response_cache_key(self, query: Callable, inference_data: dict) -> str:
+        # The sync and async variants of a query send the same request, so they share cache entries
+        query_name = query.__name__.removesuffix("_async")
+        return self.response_cache.make_key(
+            self.registry_name, self.model_name, self.temperature, query_name, inference_data
+        )
+
+    def _replay_cached_response(self, cache_key: str, inference_data: dict):
+        """Returns the cached query result (and restores the query outputs in `inference_data`), or None on a cache miss."""
+        if self.response_cache.mode == "record":
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            if self.response_cache.mode == "replay":
+                raise ResponseCacheMissError(
+                    f"No cached response for this request of {self.registry_name} (key {cache_key})."
+                )
+            return None
+        query_result, query_outputs = cached
+        inference_data.update(query_outputs)
+        return query_result
+
+    def _record_response(
+        self, cache_key: str, inference_data: dict, keys_before: set, query_result
+    ) -> None:
+        # Keep whatever the query added to `inference_data` (e.g. the input log), so that a replay is indistinguishable
+        query_outputs = {
+            key: value
+            for key, value in inference_data.items()
+            if key not in keys_before or key == "inference_input_log"
+        }
+        self.response_cache.put(cache_key, query_result, query_outputs)
+
+    @final
+    def _query_with_cache(self, query: Callable[[dict], Any], inference_data: dict):
+        if self.response_cache is None:
+            return query(inference_data)
+
+        cache_key = self._get_response_cache_key(query, inference_data)
+        query_result = self._replay_cached_response(cache_key, inference_data)
+        if query_result is None:
+            keys_before = set(inference_data)
+            query_result = query(inference_data)
+            self._record_response(cache_key, inference_data, keys_before, query_result)
+        return query_result
+
+    @final
+    async def _query_with_cache_async(
+        self, query: Callable[[dict], Awaitable[Any]], inference_data: dict
+    ):
+        if self.response_cache is None:
+            return await query(inference_data)
+
+        cache_key = self._get_response_cache_key(query, inference_data)
+        query_result = self._replay_cached_response(cache_key, inference_data)
+        if query_result is None:
+            keys_before = set(inference_data)
+            query_result = await query(inference_data)
+            self._record_response(cache_key, inference_data, keys_before, query_result)
+        return query_result
+
     @final
     def inference_multi_turn_FC(
         self,
@@ -98,6 +257,45 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        try:
+            return self._run_inference_steps(
+                self._inference_multi_turn_FC_steps(
+                    test_entry, include_input_log, exclude_state_log
+                ),
+                self._query_FC,
+            )
+        finally:
+            release_execution_instances(
+                self.model_name_underline_replaced, test_entry["id"]
+            )
+
+    @final
+    async def inference_multi_turn_FC_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> tuple[list[list], dict]:
+        try:
+            return await self._run_inference_steps_async(
+                self._inference_multi_turn_FC_steps(
+                    test_entry, include_input_log, exclude_state_log
+                ),
+                self._query_FC_async,
+                offload_steps=True,
+            )
+        finally:
+            release_execution_instances(
+                self.model_name_underline_replaced, test_entry["id"]
+            )
+
+    @final
+    def _inference_multi_turn_FC_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> Generator[dict, tuple, tuple[list[list], dict]]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -119,6 +317,8 @@ class BaseHandler:
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
 
         all_reasoning_content: list[list] = []
+        # The decode_execute output of each step, or the decoding error; stored in the result with `--store-decoded-result`
+        all_decoded_responses: list[list] = []
 
         # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
         _, involved_instances = execute_multi_turn_func_call(
@@ -206,6 +406,7 @@ class BaseHandler:
             current_turn_output_token_count: list[float] = []
             current_turn_latency: list[float] = []
             current_turn_reasoning_content = []
+            current_turn_decoded_responses = []
 
             count = 0
             while True:
@@ -217,7 +418,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_FC(inference_data)
+                api_response, query_latency = yield inference_data
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -262,6 +463,7 @@ class BaseHandler:
                     decoded_model_responses = self.decode_execute(
                         model_responses, has_tool_call_tag=False
                     )
+                    current_turn_decoded_responses.append(decoded_model_responses)
                     current_step_inference_log.append(
                         {
                             "role": "handler_log",
@@ -282,6 +484,7 @@ class BaseHandler:
                         break
 
                 except Exception as e:
+                    current_turn_decoded_responses.append({"error": str(e)})
                     print("Failed to decode the model response. Proceed to next turn.")
                     current_step_inference_log.append(
                         {
@@ -335,6 +538,7 @@ class BaseHandler:
             all_model_response.append(current_turn_response)
             all_inference_log.append(current_turn_inference_log)
             all_reasoning_content.append(current_turn_reasoning_content)
+            all_decoded_responses.append(current_turn_decoded_responses)
             total_input_token_count.append(current_turn_input_token_count)
             total_output_token_count.append(current_turn_output_token_count)
             total_latency.append(current_turn_latency)
@@ -388,6 +592,12 @@ class BaseHandler:
         ):
             metadata["reasoning_content"] = all_reasoning_content
 
+        if self.store_decoded_result:
+            metadata["decoded_result"] = {
+                "decoder_version": self.get_decoder_version(),
+                "execute": all_decoded_responses,
+            }
+
         return all_model_response, metadata
 
     @final
@@ -397,6 +607,45 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        try:
+            return self._run_inference_steps(
+                self._inference_multi_turn_prompting_steps(
+                    test_entry, include_input_log, exclude_state_log
+                ),
+                self._query_prompting,
+            )
+        finally:
+            release_execution_instances(
+                self.model_name_underline_replaced, test_entry["id"]
+            )
+
+    @final
+    async def inference_multi_turn_prompting_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> tuple[list[list], dict]:
+        try:
+            return await self._run_inference_steps_async(
+                self._inference_multi_turn_prompting_steps(
+                    test_entry, include_input_log, exclude_state_log
+                ),
+                self._query_prompting_async,
+                offload_steps=True,
+            )
+        finally:
+            release_execution_instances(
+                self.model_name_underline_replaced, test_entry["id"]
+            )
+
+    @final
+    def _inference_multi_turn_prompting_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> Generator[dict, tuple, tuple[list[list], dict]]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -413,6 +662,8 @@ class BaseHandler:
         all_model_response: list[list] = []
         # Only for reasoning models, reasoning content will be stored as part of metadata and in inference log
         all_reasoning_content: list[list] = []
+        # The decode_execute output of each step, or the decoding error; stored in the result with `--store-decoded-result`
+        all_decoded_responses: list[list] = []
         # The debugging log for human to understand
         all_inference_log: list[list[dict]] = []
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
@@ -492,6 +743,7 @@ class BaseHandler:
 
             current_turn_response = []
             current_turn_reasoning_content = []
+            current_turn_decoded_responses = []
             current_turn_inference_log: list[dict] = {
                 "begin_of_turn_query": current_turn_message
             }
@@ -509,7 +761,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_prompting(inference_data)
+                api_response, query_latency = yield inference_data
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -553,6 +805,7 @@ class BaseHandler:
                     decoded_model_responses = self.decode_execute(
                         model_responses, has_tool_call_tag=False
                     )
+                    current_turn_decoded_responses.append(decoded_model_responses)
                     current_step_inference_log.append(
                         {
                             "role": "handler_log",
@@ -574,6 +827,7 @@ class BaseHandler:
                         break
 
                 except Exception as e:
+                    current_turn_decoded_responses.append({"error": str(e)})
                     print("Failed to decode the model response. Proceed to next turn.")
                     current_step_inference_log.append(
                         {
@@ -625,6 +879,7 @@ class BaseHandler:
             # Add to the total list
             all_model_response.append(current_turn_response)
             all_reasoning_content.append(current_turn_reasoning_content)
+            all_decoded_responses.append(current_turn_decoded_responses)
             all_inference_log.append(current_turn_inference_log)
             total_input_token_count.append(current_turn_input_token_count)
             total_output_token_count.append(current_turn_output_token_count)
@@ -679,12 +934,37 @@ class BaseHandler:
         ):
             metadata["reasoning_content"] = all_reasoning_content
 
+        if self.store_decoded_result:
+            metadata["decoded_result"] = {
+                "decoder_version": self.get_decoder_version(),
+                "execute": all_decoded_responses,
+            }
+
         return all_model_response, metadata
 
     @final
     def inference_single_turn_FC(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
+        return self._run_inference_steps(
+            self._inference_single_turn_FC_steps(test_entry, include_input_log),
+            self._query_FC,
+        )
+
+    @final
+    async def inference_single_turn_FC_async(
+        self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        return await self._run_inference_steps_async(
+            self._inference_single_turn_FC_steps(test_entry, include_input_log),
+            self._query_FC_async,
+            offload_steps=False,
+        )
+
+    @final
+    def _inference_single_turn_FC_steps(
+        self, test_entry: dict, include_input_log: bool
+    ) -> Generator[dict, tuple, tuple[any, dict]]:
         inference_data: dict = {}
         inference_data = self._pre_query_processing_FC(inference_data, test_entry)
         inference_data = self._compile_tools(inference_data, test_entry)
@@ -692,7 +972,7 @@ class BaseHandler:
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_FC(inference_data)
+        api_response, query_latency = yield inference_data
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_FC(api_response)
@@ -716,18 +996,44 @@ class BaseHandler:
         ):
             metadata["reasoning_content"] = model_response_data["reasoning_content"]
 
+        if self.store_decoded_result:
+            decoded_result = self._decode_ast_for_result(
+                test_entry["id"], model_response_data["model_responses"]
+            )
+            if decoded_result is not None:
+                metadata["decoded_result"] = decoded_result
+
         return model_response_data["model_responses"], metadata
 
     @final
     def inference_single_turn_prompting(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
+        return self._run_inference_steps(
+            self._inference_single_turn_prompting_steps(test_entry, include_input_log),
+            self._query_prompting,
+        )
+
+    @final
+    async def inference_single_turn_prompting_async(
+        self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        return await self._run_inference_steps_async(
+            self._inference_single_turn_prompting_steps(test_entry, include_input_log),
+            self._query_prompting_async,
+            offload_steps=False,
+        )
+
+    @final
+    def _inference_single_turn_prompting_steps(
+        self, test_entry: dict, include_input_log: bool
+    ) -> Generator[dict, tuple, tuple[any, dict]]:
         inference_data: dict = self._pre_query_processing_prompting(test_entry)
         inference_data = self.add_first_turn_message_prompting(
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_prompting(inference_data)
+        api_response, query_latency = yield inference_data
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_prompting(api_response)
@@ -751,6 +1057,13 @@ class BaseHandler:
         ):
             metadata["reasoning_content"] = model_response_data["reasoning_content"]
 
+        if self.store_decoded_result:
+            decoded_result = self._decode_ast_for_result(
+                test_entry["id"], model_response_data["model_responses"]
+            )
+            if decoded_result is not None:
+                metadata["decoded_result"] = decoded_result
+
         return model_response_data["model_responses"], metadata
 
     def decode_ast(self, result, language: ReturnFormat, has_tool_call_tag: bool):
@@ -766,59 +1079,64 @@ class BaseHandler:
         raise NotImplementedError
 
     @final
-    def write(self, result, result_dir, update_mode=False):
+    @classmethod
+    def get_decoder_version(cls) -> str:
+        """
+        Tag identifying the decoding logic of this handler class: a hash of the source of the modules defining the class and its bases,
+        and of the shared parsing utilities. The evaluator only reuses the decoded output stored in a result file when its tag still matches.
+        """
+        return _get_decoder_version(cls)
+
+    @final
+    def _decode_ast_for_result(self, test_entry_id: str, model_responses) -> Optional[dict]:
+        """
+        Decode a single-turn response the way the evaluator does, for `--store-decoded-result`.
+        Returns None if the decoded AST would not survive the trip through the JSON result file unchanged
+        (e.g. tuples or non-string dict keys); the evaluator then decodes the raw response itself.
+        """
+        return_format, has_tool_call_tag = get_ast_decode_params(test_entry_id)
+        decoded_result = {
+            "decoder_version": self.get_decoder_version(),
+            "return_format": return_format.value,
+            "has_tool_call_tag": has_tool_call_tag,
+        }
+        try:
+            decoded_ast = self.decode_ast(model_responses, return_format, has_tool_call_tag)
+        except Exception as e:
+            decoded_result["error"] = str(e)
+            return decoded_result
+
+        try:
+            if json.loads(json.dumps(decoded_ast)) != decoded_ast:
+                return None
+        except (TypeError, ValueError):
+            return None
+        decoded_result["ast"] = decoded_ast
+        return decoded_result
+
+    @final
+    def open_result_writer(
+        self, result_dir, update_mode=False, durability="flush"
+    ) -> ResultWriter:
+        """
+        Create a group-commit writer for this model's result files.
+        The caller is responsible for closing it (it can be used as a context manager).
+        """
         # Use the internal registry name to decide the result directory to avoid
         # collisions between different variants that share the same API model name.
         model_result_dir = result_dir / self.registry_dir_name
+        return ResultWriter(model_result_dir, update_mode=update_mode, durability=durability)
 
-        if isinstance(result, dict):
-            result = [result]
-
-        # Collect and format each entry for JSON compatibility
-        entries_to_write = [make_json_serializable(entry) for entry in result]
-
-        # Group entries by their `test_category` for efficient file handling
-        file_entries = {}
-        for entry in entries_to_write:
-            test_category = extract_test_category_from_id(entry["id"])
-            # Determine the high-level grouping folder (non_live, live, etc.)
-            group_dir_name = get_directory_structure_by_id(entry["id"])
-            group_dir_path = model_result_dir / group_dir_name
-            group_dir_path.mkdir(parents=True, exist_ok=True)
-
-            file_path = group_dir_path / f"{VERSION_PREFIX}_{test_category}_result.json"
-            file_entries.setdefault(file_path, []).append(entry)
-
-        for file_path, entries in file_entries.items():
-            if update_mode:
-                # Load existing entries from the file
-                existing_entries = {}
-                if file_path.exists():
-                    existing_entries = {
-                        entry["id"]: entry for entry in load_file(file_path)
-                    }
-
-                # Update existing entries with new data
-                for entry in entries:
-                    existing_entries[entry["id"]] = entry
-
-                # Sort entries by `id` and write them back to ensure order consistency
-                sorted_entries = sorted(existing_entries.values(), key=sort_key)
-                with open(file_path, "w") as f:
-                    for entry in sorted_entries:
-                        content = json.dumps(entry) + "\n"
-                        f.write(content)
-                        f.flush()
-
-            else:
-                # Normal mode: Append to the end of the file
-                # Note: We will sort all the entries at the end of the generation pipeline to ensure the order is consistent
-                entries.sort(key=sort_key)
-                with open(file_path, "a") as f:
-                    for entry in entries:
-                        content = json.dumps(entry) + "\n"
-                        f.write(content)
-                        f.flush()
+    @final
+    def write(self, result, result_dir, update_mode=False):
+        """
+        Write one or more entries to the result files right away.
+        Kept for backward compatibility (the generation pipeline no longer calls it): each call builds, commits and closes
+        a full `ResultWriter`. For writing many entries over time, use `open_result_writer`, which keeps the files open
+        and batches the writes.
+        """
+        with self.open_result_writer(result_dir, update_mode=update_mode) as writer:
+            writer.write(result)
 
     #### FC methods ####
 
@@ -829,6 +1147,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_FC_async(self, inference_data: dict):
+        """
+        Async counterpart of `_query_FC`, used by the asyncio inference engine.
+        By default, the blocking `_query_FC` is run in a worker thread. Handlers that have a native async client should override this method.
+        """
+        return await asyncio.to_thread(self._query_FC, inference_data)
+
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -919,6 +1244,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_prompting_async(self, inference_data: dict):
+        """
+        Async counterpart of `_query_prompting`, used by the asyncio inference engine.
+        By default, the blocking `_query_prompting` is run in a worker thread. Handlers that have a native async client should override this method.
+        """
+        return await asyncio.to_thread(self._query_prompting, inference_data)
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -991,3 +1323,27 @@ class BaseHandler:
         By default, execution results are added back as a `user` role message, as most models don't support the `tool` role in prompting mode.
         """
         raise NotImplementedError
+
+
+# Modules whose code takes part in decoding, in addition to the modules of the handler class hierarchy
+_DECODER_MODULES = [
+    "bfcl_eval.model_handler.utils",
+    "bfcl_eval.model_handler.parser.java_parser",
+    "bfcl_eval.model_handler.parser.js_parser",
+    "bfcl_eval.model_handler.parser.json_parser",
+    "bfcl_eval.model_handler.parser.xml_parser",
+]
+
+
+@lru_cache(maxsize=None)
+def _get_decoder_version(handler_class: type) -> str:
+    module_names = set(_DECODER_MODULES)
+    for cls in handler_class.__mro__:
+        if cls.__module__.startswith("bfcl_eval."):
+            module_names.add(cls.__module__)
+
+    hasher = hashlib.sha256()
+    for module_name in sorted(module_names):
+        hasher.update(module_name.encode())
+        hasher.update(inspect.getsource(sys.modules[module_name]).encode())
+    return f"{handler_class.__name__}-{hasher.hexdigest()[:16]}"
@@ -6,19 +6,73 @@ from pathlib import Path
 from typing import Any, Optional
 
 import requests
+from bfcl_eval._concurrency_controller import observe_request
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.constants.eval_config import LOCAL_SERVER_PORT
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.local_inference.incremental_prompt import (
+    IncrementalPromptRenderer,
+)
+from bfcl_eval.model_handler.local_inference.server_pool import ServerPool
 from bfcl_eval.model_handler.utils import (
     default_decode_ast_prompting,
     default_decode_execute_prompting,
     system_prompt_pre_processing_chat_model,
 )
 from bfcl_eval.utils import contain_multi_turn_interaction
-from openai import OpenAI
+from openai import APIConnectionError, AsyncOpenAI, OpenAI
 from overrides import EnforceOverrides, final, override
 
 
+# (hits counter, queries counter) pairs exposed by the inference servers, newest first.
+# vLLM V1 reports tokens hit / tokens queried; older vLLM versions use the `gpu_` prefix.
+PREFIX_CACHE_COUNTER_PAIRS = [
+    ("vllm:prefix_cache_hits_total", "vllm:prefix_cache_queries_total"),
+    ("vllm:gpu_prefix_cache_hits_total", "vllm:gpu_prefix_cache_queries_total"),
+]
+# Servers that only expose the hit rate as a gauge
+PREFIX_CACHE_HIT_RATE_GAUGES = [
+    "vllm:gpu_prefix_cache_hit_rate",
+    "sglang:cache_hit_rate",
+]
+PREFIX_CACHE_METRIC_NAMES = [
+    name for pair in PREFIX_CACHE_COUNTER_PAIRS for name in pair
+] + PREFIX_CACHE_HIT_RATE_GAUGES
+
+
+def parse_prometheus_metrics(text: str, metric_names: list[str]) -> dict[str, float]:
+    """
+    Extract the given metrics from a Prometheus text exposition, summing the samples of each metric over its label sets.
+    Metrics that are not present are left out of the result.
+    """
+    wanted = set(metric_names)
+    metrics = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name_and_labels, _, value = line.rpartition(" ")
+        name = name_and_labels.split("{", 1)[0].strip()
+        if name not in wanted:
+            continue
+        try:
+            metrics[name] = metrics.get(name, 0.0) + float(value)
+        except ValueError:
+            continue
+    return metrics
+
+
+def _log_subprocess_output(pipe, stop_event):
+    # Read lines until stop event is set
+    while not stop_event.is_set():
+        line = pipe.readline()
+        if line:
+            print(line, end="")
+        else:
+            break
+    pipe.close()
+    print("server log tracking thread stopped successfully.")
+
+
 class OSSHandler(BaseHandler, EnforceOverrides):
     def __init__(
         self,
@@ -44,6 +98,12 @@ class OSSHandler(BaseHandler, EnforceOverrides):
 
         self.base_url = f"http://{self.local_server_endpoint}:{self.local_server_port}/v1"
         self.client = OpenAI(base_url=self.base_url, api_key="EMPTY")
+        # Used by the asyncio inference engine (`--async-inference`)
+        self.async_client = AsyncOpenAI(base_url=self.base_url, api_key="EMPTY")
+        # The servers that requests are routed to; set up in spin_up_local_server
+        self.server_pool: Optional[ServerPool] = None
+        # Will be set up once the tokenizer is loaded in spin_up_local_server
+        self.prompt_renderer: Optional[IncrementalPromptRenderer] = None
 
     @override
     def inference(
@@ -60,6 +120,22 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         else:
             return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    @override
+    async def inference_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ):
+        if contain_multi_turn_interaction(test_entry["id"]):
+            return await self.inference_multi_turn_prompting_async(
+                test_entry, include_input_log, exclude_state_log
+            )
+        else:
+            return await self.inference_single_turn_prompting_async(
+                test_entry, include_input_log
+            )
+
     @override
     def decode_ast(self, result, language, has_tool_call_tag):
         return default_decode_ast_prompting(result, language, has_tool_call_tag)
@@ -76,10 +152,13 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         backend: str,
         skip_server_setup: bool,
         local_model_path: Optional[str],
+        num_replicas: int = 1,
     ):
         """
         Spin up a local server for the model.
         If the server is already running, skip the setup.
+        With `num_replicas` > 1, launch that many independent servers (each with `num_gpus` GPUs) on consecutive ports,
+        and spread the requests across them (data parallelism).
         """
         from transformers import AutoConfig, AutoTokenizer
 
@@ -112,6 +191,7 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             }
 
         self.tokenizer = AutoTokenizer.from_pretrained(**load_kwargs)
+        self.prompt_renderer = IncrementalPromptRenderer(self, self.tokenizer)
         config = AutoConfig.from_pretrained(**load_kwargs)
 
         if hasattr(config, "max_position_embeddings"):
@@ -125,146 +205,207 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 )
         print(f"Max context length: {self.max_context_length}")
 
-        self._server_process = process = None
-        self._stdout_thread = stdout_thread = None
-        self._stderr_thread = stderr_thread = None
+        # One server per replica, on consecutive ports starting from LOCAL_SERVER_PORT
+        ports = [int(self.local_server_port) + index for index in range(num_replicas)]
+        self.server_pool = ServerPool(
+            [f"http://{self.local_server_endpoint}:{port}/v1" for port in ports]
+        )
+        self._log_threads = []
         # Event to signal threads to stop; no need to see logs after server is ready
         # declare early so it always exists
         self._stop_event = threading.Event()
         try:
             if not skip_server_setup:
-                if backend == "vllm":
-                    process = subprocess.Popen(
-                        [
-                            "vllm",
-                            "serve",
-                            str(self.model_path_or_id),
-                            "--port",
-                            str(self.local_server_port),
-                            "--dtype",
-                            str(self.dtype),
-                            "--tensor-parallel-size",
-                            str(num_gpus),
-                            "--gpu-memory-utilization",
-                            str(gpu_memory_utilization),
-                            "--trust-remote-code",
-                        ],
-                        stdout=subprocess.PIPE,  # Capture stdout
-                        stderr=subprocess.PIPE,  # Capture stderr
-                        text=True,  # To get the output as text instead of bytes
-                    )
-                elif backend == "sglang":
-
-                    process = subprocess.Popen(
-                        [
-                            "python",
-                            "-m",
-                            "sglang.launch_server",
-                            "--model-path",
-                            str(self.model_path_or_id),
-                            "--port",
-                            str(self.local_server_port),
-                            "--dtype",
-                            str(self.dtype),
-                            "--tp",
-                            str(num_gpus),
-                            "--mem-fraction-static",
-                            str(gpu_memory_utilization),
-                            "--trust-remote-code",
-                        ],
-                        stdout=subprocess.PIPE,  # Capture stdout
-                        stderr=subprocess.PIPE,  # Capture stderr
-                        text=True,  # To get the output as text instead of bytes
-                    )
-                else:
-                    raise ValueError(f"Backend {backend} is not supported.")
-
-                def log_subprocess_output(pipe, stop_event):
-                    # Read lines until stop event is set
-                    while not stop_event.is_set():
-                        line = pipe.readline()
-                        if line:
-                            print(line, end="")
-                        else:
-                            break
-                    pipe.close()
-                    print("server log tracking thread stopped successfully.")
-
-                # Start threads to read and print stdout and stderr
-                stdout_thread = threading.Thread(
-                    target=log_subprocess_output, args=(process.stdout, self._stop_event)
-                )
-                stderr_thread = threading.Thread(
-                    target=log_subprocess_output, args=(process.stderr, self._stop_event)
+                # A single replica inherits the GPUs of the current process, as before replicas existed
+                visible_gpus = (
+                    self._get_visible_gpus(num_gpus * num_replicas) if num_replicas > 1 else None
                 )
-                stdout_thread.setDaemon(True)
-                stderr_thread.setDaemon(True)
-                stdout_thread.start()
-                stderr_thread.start()
-
-            self._server_process = process
-            self._stdout_thread = stdout_thread
-            self._stderr_thread = stderr_thread
-
-            # Wait for the server to be ready
-            server_ready = False
-            while not server_ready:
-                # Check if the process has terminated unexpectedly
-                if not skip_server_setup and process.poll() is not None:
-                    # Output the captured logs
-                    stdout, stderr = process.communicate()
-                    print(stdout)
-                    print(stderr)
-                    raise Exception(
-                        f"Subprocess terminated unexpectedly with code {process.returncode}"
+                for replica, port in zip(self.server_pool.replicas, ports):
+                    env = None
+                    if num_replicas > 1:
+                        # Each replica gets its own set of `num_gpus` GPUs
+                        replica_gpus = visible_gpus[
+                            replica.index * num_gpus : (replica.index + 1) * num_gpus
+                        ]
+                        env = {**os.environ, "CUDA_VISIBLE_DEVICES": ",".join(replica_gpus)}
+                    replica.process = self._launch_server_process(
+                        backend, port, num_gpus, gpu_memory_utilization, env
                     )
-                try:
-                    # Make a simple request to check if the server is up
-                    response = requests.get(f"{self.base_url}/models")
-                    if response.status_code == 200:
-                        server_ready = True
-                        print("server is ready!")
-                except requests.exceptions.ConnectionError:
-                    # If the connection is not ready, wait and try again
-                    time.sleep(1)
+
+                    # Start threads to read and print stdout and stderr
+                    for pipe in [replica.process.stdout, replica.process.stderr]:
+                        log_thread = threading.Thread(
+                            target=_log_subprocess_output, args=(pipe, self._stop_event)
+                        )
+                        log_thread.daemon = True
+                        log_thread.start()
+                        self._log_threads.append(log_thread)
+
+            # Wait for the servers to be ready
+            self.server_pool.wait_until_ready()
 
             # Signal threads to stop reading output
             self._stop_event.set()
 
+            self.server_pool.start_health_checks()
+
         except Exception as e:
             # Clean-up everything we already started, then re-raise
-            if self._server_process and self._server_process.poll() is None:
-                self._server_process.terminate()
+            for replica in self.server_pool.replicas:
+                if replica.process and replica.process.poll() is None:
+                    replica.process.terminate()
             if self._stop_event:
                 self._stop_event.set()
-            if self._stdout_thread:
-                self._stdout_thread.join(timeout=2)
-            if self._stderr_thread:
-                self._stderr_thread.join(timeout=2)
+            for log_thread in self._log_threads:
+                log_thread.join(timeout=2)
             raise e
 
-    def shutdown_local_server(self):
-        """Terminate the locally launched OSS model server if it is still running."""
-        # Ensure the server process is terminated properly
-        process = getattr(self, "_server_process", None)
-        if process and process.poll() is None:
-            process.terminate()
+    def _launch_server_process(
+        self,
+        backend: str,
+        port: int,
+        num_gpus: int,
+        gpu_memory_utilization: float,
+        env: Optional[dict],
+    ) -> subprocess.Popen:
+        if backend == "vllm":
+            command = [
+                "vllm",
+                "serve",
+                str(self.model_path_or_id),
+                "--port",
+                str(port),
+                "--dtype",
+                str(self.dtype),
+                "--tensor-parallel-size",
+                str(num_gpus),
+                "--gpu-memory-utilization",
+                str(gpu_memory_utilization),
+                "--trust-remote-code",
+            ]
+        elif backend == "sglang":
+            command = [
+                "python",
+                "-m",
+                "sglang.launch_server",
+                "--model-path",
+                str(self.model_path_or_id),
+                "--port",
+                str(port),
+                "--dtype",
+                str(self.dtype),
+                "--tp",
+                str(num_gpus),
+                "--mem-fraction-static",
+                str(gpu_memory_utilization),
+                "--trust-remote-code",
+            ]
+        else:
+            raise ValueError(f"Backend {backend} is not supported.")
+
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,  # Capture stdout
+            stderr=subprocess.PIPE,  # Capture stderr
+            text=True,  # To get the output as text instead of bytes
+            env=env,
+        )
+
+    @staticmethod
+    def _get_visible_gpus(num_required: int) -> list[str]:
+        """GPU ids to hand out to the replicas, honouring an existing CUDA_VISIBLE_DEVICES."""
+        visible_devices = os.getenv("CUDA_VISIBLE_DEVICES")
+        if visible_devices:
+            gpus = [gpu.strip() for gpu in visible_devices.split(",") if gpu.strip()]
+        else:
+            gpus = [str(index) for index in range(num_required)]
+        if len(gpus) < num_required:
+            raise ValueError(
+                f"{num_required} GPUs are required (--num-gpus per replica times --num-replicas), but only {len(gpus)} are visible."
+            )
+        return gpus
+
+    def get_prefix_cache_metrics(self) -> Optional[dict[str, float]]:
+        """
+        Scrape the prefix cache counters from the Prometheus `/metrics` endpoint of the local servers.
+        Metric names differ across vLLM versions and SGLang, so every known name is collected (summed over label sets).
+        With several replicas, the counters are summed and the hit rate gauges averaged.
+        Returns None if no endpoint can be reached.
+        """
+        root_urls = (
+            [replica.root_url for replica in self.server_pool.replicas]
+            if self.server_pool is not None
+            else [f"http://{self.local_server_endpoint}:{self.local_server_port}"]
+        )
+        scraped = []
+        for root_url in root_urls:
             try:
-                # Wait for the process to terminate fully
-                process.wait(timeout=15)
-                print("Process terminated successfully.")
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()  # Wait again to ensure it's fully terminated
-                print("Process killed.")
+                response = requests.get(f"{root_url}/metrics", timeout=5)
+                response.raise_for_status()
+            except requests.exceptions.RequestException:
+                continue
+            scraped.append(parse_prometheus_metrics(response.text, PREFIX_CACHE_METRIC_NAMES))
+        if not scraped:
+            return None
+
+        metrics = {}
+        for name in PREFIX_CACHE_METRIC_NAMES:
+            values = [replica_metrics[name] for replica_metrics in scraped if name in replica_metrics]
+            if not values:
+                continue
+            metrics[name] = (
+                sum(values) / len(values)
+                if name in PREFIX_CACHE_HIT_RATE_GAUGES
+                else sum(values)
+            )
+        return metrics
+
+    @staticmethod
+    def compute_prefix_cache_hit_ratio(
+        metrics_before: Optional[dict[str, float]],
+        metrics_after: Optional[dict[str, float]],
+    ) -> Optional[float]:
+        """
+        Prefix cache hit ratio achieved between two scrapes of `get_prefix_cache_metrics`.
+        Counter pairs (hits/queries) give the exact ratio over the run; otherwise fall back to the hit rate gauge at the end of the run.
+        """
+        if metrics_after is None:
+            return None
+        metrics_before = metrics_before or {}
+        for hits_name, queries_name in PREFIX_CACHE_COUNTER_PAIRS:
+            if hits_name in metrics_after and queries_name in metrics_after:
+                hits = metrics_after[hits_name] - metrics_before.get(hits_name, 0.0)
+                queries = metrics_after[queries_name] - metrics_before.get(queries_name, 0.0)
+                return hits / queries if queries > 0 else None
+        for gauge_name in PREFIX_CACHE_HIT_RATE_GAUGES:
+            if gauge_name in metrics_after:
+                return metrics_after[gauge_name]
+        return None
+
+    def shutdown_local_server(self):
+        """Terminate the locally launched OSS model servers if they are still running."""
+        server_pool = getattr(self, "server_pool", None)
+        if server_pool is not None:
+            server_pool.stop_health_checks()
+            # Ensure the server processes are terminated properly
+            for replica in server_pool.replicas:
+                process = replica.process
+                if process and process.poll() is None:
+                    process.terminate()
+                    try:
+                        # Wait for the process to terminate fully
+                        process.wait(timeout=15)
+                        print("Process terminated successfully.")
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.wait()  # Wait again to ensure it's fully terminated
+                        print("Process killed.")
 
         # Tell the log-reader threads to stop and wait for them
         if getattr(self, "_stop_event", None):
             self._stop_event.set()
-        if getattr(self, "_stdout_thread", None):
-            self._stdout_thread.join(timeout=2)
-        if getattr(self, "_stderr_thread", None):
-            self._stderr_thread.join(timeout=2)
+        for log_thread in getattr(self, "_log_threads", []):
+            log_thread.join(timeout=2)
 
     #### Prompting methods ####
 
@@ -277,18 +418,91 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             "OSS Models should implement their own prompt formatting."
         )
 
+    def _format_prompt_messages(self, messages, function, start_index):
+        """
+        Render `messages[start_index:]` exactly as they appear in the prompt built by `_format_prompt`, without the generation prompt at the end.
+        When `start_index` is 0, this includes whatever comes before the first message (e.g. the BOS token).
+        This lets the prompt of a multi-turn conversation be built incrementally, by only rendering the newly appended messages.
+
+        Only implement this if the rendering of a message does not depend on the messages that come after it,
+        or return None for the calls where it does. The default (None) always renders the full prompt with `_format_prompt`.
+        Implement it together with `_format_generation_prompt`.
+        """
+        return None
+
+    def _format_generation_prompt(self, messages, function):
+        """
+        The text that `_format_prompt` appends after the last message to prompt the model's response.
+        Implement it together with `_format_prompt_messages`; the default (None) also means the prompt is never built incrementally.
+        """
+        return None
+
     @override
     def _query_prompting(self, inference_data: dict):
         # We use the OpenAI Completions API
+        completion_kwargs = self._build_completion_kwargs(inference_data)
+
+        if self.server_pool is None:
+            start_time = time.time()
+            with observe_request():
+                api_response = self.client.completions.create(**completion_kwargs)
+            end_time = time.time()
+        else:
+            with self.server_pool.lease() as replica:
+                start_time = time.time()
+                try:
+                    with observe_request():
+                        api_response = replica.client.completions.create(**completion_kwargs)
+                except APIConnectionError:
+                    self.server_pool.mark_unhealthy(replica)
+                    raise
+                end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    @override
+    async def _query_prompting_async(self, inference_data: dict):
+        completion_kwargs = self._build_completion_kwargs(inference_data)
+
+        if self.server_pool is None:
+            start_time = time.time()
+            with observe_request():
+                api_response = await self.async_client.completions.create(**completion_kwargs)
+            end_time = time.time()
+        else:
+            with self.server_pool.lease() as replica:
+                start_time = time.time()
+                try:
+                    with observe_request():
+                        api_response = await replica.async_client.completions.create(
+                            **completion_kwargs
+                        )
+                except APIConnectionError:
+                    self.server_pool.mark_unhealthy(replica)
+                    raise
+                end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    def _build_completion_kwargs(self, inference_data: dict) -> dict:
+        """
+        Build the keyword arguments for the Completions API request.
+        Shared by the sync and async query paths so that both send the exact same request.
+        """
         function: list[dict] = inference_data["function"]
         message: list[dict] = inference_data["message"]
 
-        formatted_prompt: str = self._format_prompt(message, function)
+        if self.prompt_renderer is not None:
+            # Only the messages appended since the last query are rendered and tokenized
+            formatted_prompt, input_token_count = self.prompt_renderer.render(
+                message, function
+            )
+        else:
+            formatted_prompt = self._format_prompt(message, function)
+            # Tokenize the formatted prompt to get token count
+            input_token_count = len(self.tokenizer.tokenize(formatted_prompt))
         inference_data["inference_input_log"] = {"formatted_prompt": formatted_prompt}
 
-        # Tokenize the formatted prompt to get token count
-        input_token_count = len(self.tokenizer.tokenize(formatted_prompt))
-
         # Determine the number of tokens to request. Cap it at 4096 if the model has a larger limit.
         if self.max_context_length < input_token_count + 2:
             # If the prompt is already at the max length, just request 1000 token, we will get an error anyway
@@ -305,27 +519,17 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         if hasattr(self, "skip_special_tokens"):
             extra_body["skip_special_tokens"] = self.skip_special_tokens
 
-        start_time = time.time()
+        completion_kwargs = {
+            "model": self.model_path_or_id,
+            "temperature": self.temperature,
+            "prompt": formatted_prompt,
+            "max_tokens": leftover_tokens_count,
+            "timeout": 72000,  # Avoid timeout errors
+        }
         if len(extra_body) > 0:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                extra_body=extra_body,
-                timeout=72000,  # Avoid timeout errors
-            )
-        else:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                timeout=72000,  # Avoid timeout errors
-            )
-        end_time = time.time()
+            completion_kwargs["extra_body"] = extra_body
 
-        return api_response, end_time - start_time
+        return completion_kwargs
 
     @override
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
@@ -0,0 +1,193 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+# The first renders (and token counts) of the run are all checked against a full render (and a full tokenization)
+VALIDATION_SAMPLES = 8
+# After that, one in this many is checked, along with any prompt holding a kind of message (role and fields) not checked yet,
+# e.g. the tool results that only show up deep into multi-turn conversations
+VALIDATION_INTERVAL = 64
+# Conversations kept in memory; enough to cover every in-flight test case
+MAX_CACHED_CONVERSATIONS = 1024
+
+
+class _ConversationState:
+    """What was rendered and tokenized the last time the prompt of one conversation was built."""
+
+    def __init__(self, messages: list[dict], function: list[dict]) -> None:
+        # The `message` list of the conversation; used to tell conversations apart
+        self.messages = messages
+        self.function = list(function)
+        # Shallow copies of the messages that were rendered into `body`, to detect in-place edits of the history
+        self.rendered_messages: list[dict] = []
+        # Rendered messages, without the generation prompt
+        self.body: Optional[str] = None
+        # Last prompt that was tokenized, and the token count at each of its segment boundaries
+        self.prompt = ""
+        self.boundaries: list[tuple[int, int]] = [(0, 0)]
+
+
+class IncrementalPromptRenderer:
+    """
+    Builds the prompt of a conversation step by step, instead of rendering and tokenizing the entire message history on every query.
+
+    Rendering: if the handler implements `_format_prompt_messages` and `_format_generation_prompt`, only the messages appended since the last query
+    are rendered and added to the cached body; the generation prompt is then appended.
+    Otherwise the full prompt is rendered with `_format_prompt`.
+
+    Token counting: the prompt is split at the special (and added) tokens of the tokenizer, which the tokenizer itself
+    never merges with the surrounding text, so the token count of the prompt is the sum of the counts of its segments.
+    Only the segments after the longest unchanged prefix are tokenized again.
+
+    Both shortcuts are checked against the full computation for the first few prompts, for every prompt with a new kind of message,
+    and periodically over the rest of the run; if they ever disagree (e.g. a tokenizer that strips the whitespace around
+    its special tokens), the renderer falls back to the full computation for good.
+    """
+
+    def __init__(self, handler: Any, tokenizer: Any) -> None:
+        self.handler = handler
+        self.tokenizer = tokenizer
+        self.incremental_render_enabled = True
+        self.incremental_tokenize_enabled = True
+        self._lock = threading.Lock()
+        # Per check ("render" or "tokenize"): number of candidate prompts so far, and the kinds of message already checked
+        self._check_counts = {"render": 0, "tokenize": 0}
+        self._checked_message_kinds: dict[str, set] = {"render": set(), "tokenize": set()}
+        self._conversations: OrderedDict[int, _ConversationState] = OrderedDict()
+        self._split_pattern = _build_split_pattern(tokenizer)
+
+    def render(self, messages: list[dict], function: list[dict]) -> tuple[str, int]:
+        """Returns the formatted prompt for the conversation and its number of tokens."""
+        state = self._get_state(messages, function)
+        formatted_prompt = self._render(state, messages, function)
+        input_token_count = self._count_tokens(state, formatted_prompt)
+        return formatted_prompt, input_token_count
+
+    def _get_state(self, messages: list[dict], function: list[dict]) -> _ConversationState:
+        with self._lock:
+            state = self._conversations.get(id(messages))
+            # A different list may reuse the id of a conversation that was garbage collected;
+            # a change in the function docs (e.g. held-out functions) invalidates the rendered prompt
+            if state is None or state.messages is not messages or state.function != function:
+                state = _ConversationState(messages, function)
+                self._conversations[id(messages)] = state
+            self._conversations.move_to_end(id(messages))
+            while len(self._conversations) > MAX_CACHED_CONVERSATIONS:
+                self._conversations.popitem(last=False)
+        return state
+
+    def _render(
+        self, state: _ConversationState, messages: list[dict], function: list[dict]
+    ) -> str:
+        if not self.incremental_render_enabled:
+            return self.handler._format_prompt(messages, function)
+
+        generation_prompt = self.handler._format_generation_prompt(messages, function)
+        if generation_prompt is None:
+            # The handler does not support incremental rendering
+            self.incremental_render_enabled = False
+            return self.handler._format_prompt(messages, function)
+
+        body = None
+        num_rendered = len(state.rendered_messages)
+        if (
+            state.body is not None
+            and len(messages) >= num_rendered
+            and messages[:num_rendered] == state.rendered_messages
+        ):
+            # The handler may refuse when the new messages change how the earlier ones are rendered
+            appended = self.handler._format_prompt_messages(
+                messages, function, num_rendered
+            )
+            if appended is not None:
+                body = state.body + appended
+        is_incremental = body is not None
+        if body is None:
+            body = self.handler._format_prompt_messages(messages, function, 0)
+        if body is None:
+            # The handler does not support incremental rendering
+            self.incremental_render_enabled = False
+            return self.handler._format_prompt(messages, function)
+
+        state.body = body
+        state.rendered_messages = [dict(message) for message in messages]
+        formatted_prompt = body + generation_prompt
+
+        # Rendering from scratch is what `_format_prompt` does; only check the renders that reused the cached body
+        if is_incremental and self._should_check("render", messages):
+            full_prompt = self.handler._format_prompt(messages, function)
+            if full_prompt != formatted_prompt:
+                print(
+                    f"⚠️ Incremental prompt rendering does not match the full prompt for {self.handler.registry_name}; falling back to full rendering."
+                )
+                self.incremental_render_enabled = False
+                return full_prompt
+
+        return formatted_prompt
+
+    def _count_tokens(self, state: _ConversationState, formatted_prompt: str) -> int:
+        if not self.incremental_tokenize_enabled or self._split_pattern is None:
+            return len(self.tokenizer.tokenize(formatted_prompt))
+
+        # Resume from the last segment boundary that the new prompt shares with the previous one
+        start, token_count = 0, 0
+        for boundary, count in reversed(state.boundaries):
+            if formatted_prompt[:boundary] == state.prompt[:boundary]:
+                start, token_count = boundary, count
+                break
+
+        boundaries = [(b, c) for b, c in state.boundaries if b <= start]
+        position = start
+        # The split alternates between text (even indices) and special tokens (odd indices)
+        for index, segment in enumerate(self._split_pattern.split(formatted_prompt[start:])):
+            if not segment:
+                continue
+            position += len(segment)
+            token_count += len(self.tokenizer.tokenize(segment))
+            # Only the end of a special token is a safe place to resume from: text may go on in the next prompt
+            if index % 2 == 1:
+                boundaries.append((position, token_count))
+
+        if self._should_check("tokenize", state.messages):
+            full_count = len(self.tokenizer.tokenize(formatted_prompt))
+            if full_count != token_count:
+                print(
+                    f"⚠️ Incremental token counting does not match the tokenizer for {self.handler.registry_name}; falling back to full tokenization."
+                )
+                self.incremental_tokenize_enabled = False
+                return full_count
+
+        state.prompt = formatted_prompt
+        state.boundaries = boundaries
+        return token_count
+
+    def _should_check(self, check: str, messages: list[dict]) -> bool:
+        kinds = {_message_kind(message) for message in messages}
+        with self._lock:
+            self._check_counts[check] += 1
+            count = self._check_counts[check]
+            if (
+                count <= VALIDATION_SAMPLES
+                or count % VALIDATION_INTERVAL == 0
+                or not kinds <= self._checked_message_kinds[check]
+            ):
+                self._checked_message_kinds[check] |= kinds
+                return True
+        return False
+
+
+def _message_kind(message: dict) -> tuple:
+    return (message.get("role"), tuple(sorted(message)))
+
+
+def _build_split_pattern(tokenizer: Any) -> Optional[re.Pattern]:
+    """Regex that splits a prompt into segments around the tokenizer's special and added tokens, keeping the tokens."""
+    tokens = set(getattr(tokenizer, "all_special_tokens", None) or [])
+    tokens.update(getattr(tokenizer, "added_tokens_encoder", None) or {})
+    tokens = [token for token in tokens if token]
+    if not tokens:
+        return None
+    # Longest first, so that a token is never matched by one of its prefixes
+    tokens.sort(key=len, reverse=True)
+    return re.compile("(" + "|".join(re.escape(token) for token in tokens) + ")")
@@ -31,25 +31,32 @@ class LlamaHandler(OSSHandler):
 
     @override
     def _format_prompt(self, messages, function):
+        return self._format_prompt_messages(
+            messages, function, 0
+        ) + self._format_generation_prompt(messages, function)
+
+    @override
+    def _format_prompt_messages(self, messages, function, start_index):
+        # Each message is rendered on its own, so the prompt can be built incrementally
+        formatted_prompt = "<|begin_of_text|>" if start_index == 0 else ""
+
         # For Llama 4 series, they use a different set of tokens than Llama 3
         if "Llama-4" in self.model_name:
-            formatted_prompt = "<|begin_of_text|>"
-
-            for message in messages:
+            for message in messages[start_index:]:
                 formatted_prompt += f"<|header_start|>{message['role']}<|header_end|>\n\n{message['content'].strip()}<|eot|>"
-
-            formatted_prompt += f"<|header_start|>assistant<|header_end|>\n\n"
         # For Llama 3 series
         else:
-            formatted_prompt = "<|begin_of_text|>"
-
-            for message in messages:
+            for message in messages[start_index:]:
                 formatted_prompt += f"<|start_header_id|>{message['role']}<|end_header_id|>\n\n{message['content'].strip()}<|eot_id|>"
 
-            formatted_prompt += f"<|start_header_id|>assistant<|end_header_id|>\n\n"
-
         return formatted_prompt
 
+    @override
+    def _format_generation_prompt(self, messages, function):
+        if "Llama-4" in self.model_name:
+            return f"<|header_start|>assistant<|header_end|>\n\n"
+        return f"<|start_header_id|>assistant<|end_header_id|>\n\n"
+
     @override
     def _add_execution_results_prompting(
         self, inference_data: dict, execution_results: list[str], model_response_data: dict
@@ -0,0 +1,142 @@
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import requests
+from openai import AsyncOpenAI, OpenAI
+
+# Seconds between two health checks of the replicas
+HEALTH_CHECK_INTERVAL = 5
+HEALTH_CHECK_TIMEOUT = 5
+
+
+class ServerReplica:
+    """One OpenAI-compatible inference server (a vLLM/SGLang process) and the clients talking to it."""
+
+    def __init__(self, index: int, base_url: str) -> None:
+        self.index = index
+        self.base_url = base_url
+        self.client = OpenAI(base_url=base_url, api_key="EMPTY")
+        self.async_client = AsyncOpenAI(base_url=base_url, api_key="EMPTY")
+        # The server process, if it was launched by us
+        self.process = None
+        self.healthy = True
+        self.outstanding_requests = 0
+        self.total_requests = 0
+
+    @property
+    def root_url(self) -> str:
+        """URL of the server without the `/v1` API prefix, where endpoints like `/metrics` live."""
+        return self.base_url.removesuffix("/v1")
+
+    def is_alive(self) -> bool:
+        return self.process is None or self.process.poll() is None
+
+    def check_health(self) -> bool:
+        if not self.is_alive():
+            return False
+        try:
+            response = requests.get(f"{self.base_url}/models", timeout=HEALTH_CHECK_TIMEOUT)
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code == 200
+
+
+class ServerPool:
+    """
+    A set of replicas serving the same model, with least-outstanding-requests routing.
+
+    Each request leases the healthy replica with the fewest requests in flight (ties go to the one that served the fewest requests so far).
+    A background thread periodically checks the `/models` endpoint of every replica; replicas that fail the check
+    (or whose process died) stop receiving requests until they pass it again.
+    If no replica is healthy, requests are spread across all of them and fail on their own.
+    """
+
+    def __init__(self, base_urls: list[str]) -> None:
+        if not base_urls:
+            raise ValueError("A server pool needs at least one replica.")
+        self.replicas = [
+            ServerReplica(index, base_url) for index, base_url in enumerate(base_urls)
+        ]
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_check_thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    @contextmanager
+    def lease(self):
+        """Pick a replica for one request, and keep it counted as outstanding until the request is done."""
+        with self._lock:
+            candidates = [replica for replica in self.replicas if replica.healthy]
+            if not candidates:
+                candidates = self.replicas
+            replica = min(
+                candidates,
+                key=lambda replica: (replica.outstanding_requests, replica.total_requests),
+            )
+            replica.outstanding_requests += 1
+            replica.total_requests += 1
+        try:
+            yield replica
+        finally:
+            with self._lock:
+                replica.outstanding_requests -= 1
+
+    def mark_unhealthy(self, replica: ServerReplica) -> None:
+        """Take a replica out of the rotation until it passes a health check again."""
+        with self._lock:
+            replica.healthy = False
+
+    def wait_until_ready(self, poll_interval: float = 1) -> None:
+        """Block until every replica answers its health check. Raises if one of the launched processes exits first."""
+        pending = list(self.replicas)
+        while pending:
+            for replica in list(pending):
+                if not replica.is_alive():
+                    # Output the captured logs
+                    stdout, stderr = replica.process.communicate()
+                    print(stdout)
+                    print(stderr)
+                    raise Exception(
+                        f"Subprocess for server replica {replica.index} terminated unexpectedly with code {replica.process.returncode}"
+                    )
+                if replica.check_health():
+                    pending.remove(replica)
+                    print(f"server replica {replica.index} ({replica.base_url}) is ready!")
+            if pending:
+                self._stop_event.wait(poll_interval)
+        print("server is ready!")
+
+    def start_health_checks(self, interval: float = HEALTH_CHECK_INTERVAL) -> None:
+        def _health_check_loop():
+            while not self._stop_event.wait(interval):
+                for replica in self.replicas:
+                    healthy = replica.check_health()
+                    with self._lock:
+                        if replica.healthy and not healthy:
+                            print(f"⚠️ Server replica {replica.index} ({replica.base_url}) failed its health check.")
+                        replica.healthy = healthy
+
+        self._health_check_thread = threading.Thread(
+            target=_health_check_loop, daemon=True
+        )
+        self._health_check_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop_event.set()
+        if self._health_check_thread is not None:
+            self._health_check_thread.join(timeout=HEALTH_CHECK_TIMEOUT + 1)
+            self._health_check_thread = None
+
+    def summary(self) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "base_url": replica.base_url,
+                    "healthy": replica.healthy,
+                    "total_requests": replica.total_requests,
+                }
+                for replica in self.replicas
+            ]
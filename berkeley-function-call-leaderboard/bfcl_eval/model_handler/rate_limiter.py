@@ -0,0 +1,275 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from bfcl_eval._concurrency_controller import RATE_LIMIT_ERROR_PATTERN
+
+# Optional budgets shared by every worker that talks to the same provider and model.
+# Leave them unset to only coordinate the pauses requested by the provider (`Retry-After` and reset headers).
+REQUESTS_PER_MINUTE_ENV = "BFCL_RATE_LIMIT_RPM"
+TOKENS_PER_MINUTE_ENV = "BFCL_RATE_LIMIT_TPM"
+
+# Rough characters-per-token ratio, only used to pre-charge the token budget before the real usage is known
+CHARS_PER_TOKEN = 4
+
+# Headers (lower case) that tell how long to wait before the next request is allowed
+RETRY_AFTER_HEADERS = ["retry-after-ms", "retry-after"]
+RESET_HEADERS = [
+    "x-ratelimit-reset-requests",
+    "x-ratelimit-reset-tokens",
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-reset",
+]
+
+
+class TokenBucket:
+    """
+    Classic token bucket holding at most one minute worth of budget.
+    The balance may go negative when the actual usage of a request is higher than what was pre-charged;
+    following requests then wait until the debt is paid back.
+    Not thread-safe on its own, `RateLimiter` guards it with a lock.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # A single request larger than the whole budget would otherwise wait forever
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= amount
+
+
+class RateLimiter:
+    """
+    Process-wide limiter for one provider and model.
+
+    Every request first calls `acquire`, which blocks until:
+        - the provider-requested pause (from a `Retry-After` or reset header, or a rate-limit error) is over,
+        - the requests-per-minute budget has room for one more request, and
+        - the tokens-per-minute budget has room for the estimated prompt tokens.
+    Once the response is back, `record_usage` charges the difference between the estimate and the real token usage
+    (or refunds the estimate, when the request failed).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._request_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._paused_until = 0.0
+
+    @property
+    def limits_tokens(self) -> bool:
+        """Whether a tokens-per-minute budget is set, i.e. whether requests need a token estimate at all."""
+        return self._token_bucket is not None
+
+    def _try_reserve(self, estimated_tokens: int) -> float:
+        """Reserve budget for one request. Returns 0 on success, otherwise how long to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._paused_until - now
+            if self._request_bucket is not None:
+                wait_time = max(wait_time, self._request_bucket.time_until_available(1, now))
+            if self._token_bucket is not None:
+                wait_time = max(
+                    wait_time,
+                    self._token_bucket.time_until_available(estimated_tokens, now),
+                )
+            if wait_time > 0:
+                return wait_time
+
+            if self._request_bucket is not None:
+                self._request_bucket.consume(1)
+            if self._token_bucket is not None:
+                self._token_bucket.consume(estimated_tokens)
+            return 0.0
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        while (wait_time := self._try_reserve(estimated_tokens)) > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, estimated_tokens: int = 0) -> None:
+        while (wait_time := self._try_reserve(estimated_tokens)) > 0:
+            await asyncio.sleep(wait_time)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        if self._token_bucket is None or actual_tokens is None:
+            return
+        with self._lock:
+            self._token_bucket.consume(actual_tokens - estimated_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request to this provider and model for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_rate_limiters: dict[tuple[str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model_name: str) -> RateLimiter:
+    """Return the shared limiter for the given provider and model, creating it on first use."""
+    key = (provider, model_name)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(
+                requests_per_minute=_read_budget_from_env(REQUESTS_PER_MINUTE_ENV),
+                tokens_per_minute=_read_budget_from_env(TOKENS_PER_MINUTE_ENV),
+            )
+        return _rate_limiters[key]
+
+
+def get_rate_limiter_for_handler(handler: Any) -> Optional[RateLimiter]:
+    """
+    Look up the limiter for a model handler, keyed by its model style (the provider API) and model name.
+    Returns None if the object is not a model handler.
+    """
+    model_name = getattr(handler, "model_name", None)
+    model_style = getattr(handler, "model_style", None)
+    if model_name is None or model_style is None:
+        return None
+    return get_rate_limiter(getattr(model_style, "value", str(model_style)), model_name)
+
+
+def _read_budget_from_env(env_name: str) -> Optional[float]:
+    value = os.getenv(env_name)
+    if not value:
+        return None
+    budget = float(value)
+    if budget <= 0:
+        raise ValueError(f"{env_name} must be a positive number, got {value}.")
+    return budget
+
+
+def estimate_prompt_tokens(*args, **kwargs) -> int:
+    """Estimate the prompt size of a request from its arguments, for pre-charging the token budget."""
+    serialized = json.dumps([args, kwargs], default=str)
+    return len(serialized) // CHARS_PER_TOKEN
+
+
+def extract_token_usage(result: Any) -> Optional[int]:
+    """
+    Read the total (prompt + completion) token usage from the return value of `generate_with_backoff`,
+    which is usually a `(api_response, latency)` tuple. Returns None if the usage is not available.
+    """
+    api_response = result[0] if isinstance(result, tuple) and result else result
+
+    usage = getattr(api_response, "usage", None)
+    if usage is not None:
+        # OpenAI style
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if prompt_tokens is None:
+            # Anthropic and OpenAI Responses API style
+            prompt_tokens = getattr(usage, "input_tokens", None)
+            completion_tokens = getattr(usage, "output_tokens", None)
+        if prompt_tokens is not None:
+            return prompt_tokens + (completion_tokens or 0)
+
+    # Gemini style
+    usage_metadata = getattr(api_response, "usage_metadata", None)
+    if usage_metadata is not None:
+        total_tokens = getattr(usage_metadata, "total_token_count", None)
+        if total_tokens is not None:
+            return total_tokens
+
+    return None
+
+
+def is_rate_limit_error(exception: BaseException) -> bool:
+    if getattr(exception, "status_code", None) == 429:
+        return True
+    return bool(RATE_LIMIT_ERROR_PATTERN.search(f"{type(exception).__name__}: {exception}"))
+
+
+def parse_retry_after(exception: BaseException) -> Optional[float]:
+    """
+    Extract how many seconds the provider asked us to wait, from the `Retry-After` header
+    or the rate-limit reset headers of the HTTP response attached to the exception.
+    Returns None if the exception carries no such information.
+    """
+    response = getattr(exception, "response", None) or getattr(
+        exception, "raw_response", None
+    )
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    for header in RETRY_AFTER_HEADERS:
+        value = headers.get(header)
+        if value is None:
+            continue
+        seconds = _parse_seconds_or_http_date(value)
+        if seconds is not None:
+            return seconds / 1000 if header == "retry-after-ms" else seconds
+
+    # When several budgets are exhausted, we need to wait for the one that resets last
+    reset_times = [
+        _parse_reset_value(headers.get(header))
+        for header in RESET_HEADERS
+        if headers.get(header) is not None
+    ]
+    reset_times = [value for value in reset_times if value is not None]
+    if reset_times:
+        return max(reset_times)
+
+    return None
+
+
+def _parse_seconds_or_http_date(value: str) -> Optional[float]:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _parse_reset_value(value: str) -> Optional[float]:
+    """Parse either a duration like `1m30.5s` / `250ms` (OpenAI) or an RFC 3339 timestamp (Anthropic)."""
+    value = value.strip()
+    matches = _DURATION_PATTERN.findall(value)
+    if matches and "".join(number + unit for number, unit in matches) == value:
+        unit_to_seconds = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(number) * unit_to_seconds[unit] for number, unit in matches)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return _parse_seconds_or_http_date(value)
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
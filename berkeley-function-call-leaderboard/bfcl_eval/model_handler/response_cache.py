@@ -0,0 +1,104 @@
+import dataclasses
+import hashlib
+import json
+import pickle
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any, Optional
+
+from bfcl_eval._sqlite_cache import SQLiteCache
+
+# - "record": always query the model, and store (or overwrite) the response
+# - "replay": only serve responses from the cache; a cache miss is an error, the model is never queried
+# - "replay-or-record": serve from the cache when possible, otherwise query the model and store the response
+RESPONSE_CACHE_MODES = ["record", "replay", "replay-or-record"]
+
+# Keys of `inference_data` that are outputs of the query rather than part of the request
+_QUERY_OUTPUT_KEYS = ["inference_input_log"]
+
+
+class ResponseCacheMissError(Exception):
+    """Raised in `replay` mode when a request has no recorded response."""
+
+
+class ResponseCache(SQLiteCache):
+    """
+    Content-addressed cache of raw model responses, stored in a local SQLite database.
+
+    The key is a hash of the registry name, model name, temperature, query method and the fully formatted request
+    (the `inference_data` passed to `_query_FC` / `_query_prompting`). The value is the pickled `(api_response, latency)`
+    pair returned by the query, plus whatever the query added to `inference_data` (e.g. the inference input log),
+    so that a replayed query behaves exactly like the original one for the rest of the pipeline.
+    """
+
+    def __init__(self, path: Path, mode: str) -> None:
+        if mode not in RESPONSE_CACHE_MODES:
+            raise ValueError(
+                f"Invalid response cache mode '{mode}'. Choose from {RESPONSE_CACHE_MODES}."
+            )
+        super().__init__(path, "responses")
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        registry_name: str,
+        model_name: str,
+        temperature: float,
+        query_name: str,
+        inference_data: dict,
+    ) -> str:
+        request = {
+            key: value for key, value in inference_data.items() if key not in _QUERY_OUTPUT_KEYS
+        }
+        serialized = json.dumps(
+            [registry_name, model_name, temperature, query_name, request],
+            sort_keys=True,
+            default=_to_jsonable,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[Any, dict]]:
+        value = self.get_value(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if value is None else pickle.loads(value)
+
+    def put(self, key: str, query_result: Any, query_outputs: dict) -> None:
+        try:
+            value = pickle.dumps((query_result, query_outputs))
+        except Exception as e:
+            # e.g. streaming responses; these are just not cached
+            print(f"⚠️ Response could not be cached and will not be replayed: {e}")
+            return
+        self.put_values({key: value})
+
+
+def _to_jsonable(value: Any) -> Any:
+    """
+    Serialize SDK objects (chat history messages, tool specs, etc.) by content, so that the key is stable across runs.
+    Objects without a content-based serialization are rejected rather than keyed by their `repr`, which usually holds a memory address
+    and would make every replay miss.
+    """
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(
+        f"Cannot build a response cache key from an object of type {type(value).__module__}.{type(value).__qualname__}: "
+        "it has no `model_dump`, `to_dict` or dataclass serialization. Add support for it in `response_cache._to_jsonable`."
+    )
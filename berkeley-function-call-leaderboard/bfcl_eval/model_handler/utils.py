@@ -1,12 +1,15 @@
 import ast
 import builtins
 import copy
+import inspect
 import json
 import operator
+import random
 import re
 from functools import reduce
 from typing import TYPE_CHECKING, Callable, List, Optional, Type, Union
 
+from bfcl_eval._concurrency_controller import notify_backoff, observe_request
 from bfcl_eval.constants.default_prompts import *
 from bfcl_eval.constants.enums import ModelStyle, ReturnFormat
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
@@ -17,6 +20,13 @@ from bfcl_eval.model_handler.parser.xml_parser import (
     parse_concise_xml_function_call,
     parse_verbose_xml_function_call,
 )
+from bfcl_eval.model_handler.rate_limiter import (
+    estimate_prompt_tokens,
+    extract_token_usage,
+    get_rate_limiter_for_handler,
+    is_rate_limit_error,
+    parse_retry_after,
+)
 from bfcl_eval.utils import *
 from tenacity import (
     retry,
@@ -555,6 +565,8 @@ def retry_with_backoff(
 ) -> Callable:
     """
     Decorator to retry a function with exponential backoff based on specified error types or result conditions.
+    When the decorated function is a model handler method, every attempt also goes through the process-wide rate limiter of that provider and model (see `rate_limiter.py`),
+    and a rate-limit error pauses all workers sharing it, for the duration given by the `Retry-After`/reset headers if present.
 
     Note:
         At least one of `error_type` or `error_message_pattern` must be provided.
@@ -592,18 +604,91 @@ def retry_with_backoff(
         # Combine all conditions using logical OR
         retry_policy = reduce(operator.or_, conditions)
 
-        @retry(
-            wait=wait_random_exponential(min=min_wait, max=max_wait),
-            retry=retry_policy,
-            before_sleep=lambda retry_state: print(
+        exponential_wait = wait_random_exponential(min=min_wait, max=max_wait)
+
+        def wait_strategy(retry_state):
+            # Prefer the wait time requested by the provider over our own exponential guess
+            retry_after = parse_retry_after(retry_state.outcome.exception())
+            if retry_after is not None:
+                return min(retry_after, max_wait) + random.uniform(0, 1)
+            return exponential_wait(retry_state)
+
+        def before_sleep(retry_state):
+            exception = retry_state.outcome.exception()
+            print(
                 f"Attempt {retry_state.attempt_number} failed. "
                 f"Sleeping for {retry_state.next_action.sleep:.2f} seconds before retrying... "
-                f"Error: {retry_state.outcome.exception()}"
-            ),
+                f"Error: {exception}"
+            )
+            # Let the adaptive concurrency controller (if any) know that the provider is pushing back
+            notify_backoff()
+            # Pause every worker that shares this provider and model, not just the one that got rate-limited
+            rate_limiter = get_rate_limiter_for_handler(
+                retry_state.args[0] if retry_state.args else None
+            )
+            if rate_limiter is not None and is_rate_limit_error(exception):
+                rate_limiter.pause(retry_state.next_action.sleep)
+
+        retry_decorator = retry(
+            wait=wait_strategy,
+            retry=retry_policy,
+            before_sleep=before_sleep,
             **kwargs,
         )
-        def wrapped(*args, **inner_kwargs):
-            return func(*args, **inner_kwargs)
+
+        # Coroutine functions need an async wrapper, so that tenacity awaits the call (and sleeps with `asyncio.sleep`) instead of retrying on the coroutine object.
+        # Each attempt goes through the shared rate limiter of the handler (the first argument), if any, and is reported to the adaptive concurrency controller.
+        if inspect.iscoroutinefunction(func):
+
+            @retry_decorator
+            async def wrapped(*args, **inner_kwargs):
+                rate_limiter = get_rate_limiter_for_handler(args[0] if args else None)
+                if rate_limiter is None:
+                    with observe_request():
+                        return await func(*args, **inner_kwargs)
+
+                # Serializing the request is only worth it when there is a token budget to charge
+                estimated_tokens = (
+                    estimate_prompt_tokens(*args[1:], **inner_kwargs)
+                    if rate_limiter.limits_tokens
+                    else 0
+                )
+                await rate_limiter.acquire_async(estimated_tokens)
+                # A failed attempt is settled as using no tokens, which refunds the pre-charged estimate
+                actual_tokens = 0
+                try:
+                    with observe_request():
+                        result = await func(*args, **inner_kwargs)
+                    actual_tokens = extract_token_usage(result)
+                    return result
+                finally:
+                    rate_limiter.record_usage(estimated_tokens, actual_tokens)
+
+        else:
+
+            @retry_decorator
+            def wrapped(*args, **inner_kwargs):
+                rate_limiter = get_rate_limiter_for_handler(args[0] if args else None)
+                if rate_limiter is None:
+                    with observe_request():
+                        return func(*args, **inner_kwargs)
+
+                # Serializing the request is only worth it when there is a token budget to charge
+                estimated_tokens = (
+                    estimate_prompt_tokens(*args[1:], **inner_kwargs)
+                    if rate_limiter.limits_tokens
+                    else 0
+                )
+                rate_limiter.acquire(estimated_tokens)
+                # A failed attempt is settled as using no tokens, which refunds the pre-charged estimate
+                actual_tokens = 0
+                try:
+                    with observe_request():
+                        result = func(*args, **inner_kwargs)
+                    actual_tokens = extract_token_usage(result)
+                    return result
+                finally:
+                    rate_limiter.record_usage(estimated_tokens, actual_tokens)
 
         return wrapped
 
@@ -925,3 +1010,22 @@ def parse_prompt_variation_params(input_str: str) -> tuple[str, bool, str, str,
         prompt_format,
         prompt_style,
     )
+
+
+def get_ast_decode_params(test_entry_id: str) -> tuple[ReturnFormat, bool]:
+    """
+    The `language` (return format) and `has_tool_call_tag` arguments that the evaluator passes to `decode_ast` for a single-turn entry.
+    """
+    test_category = extract_test_category_from_id(test_entry_id)
+    if is_relevance_or_irrelevance(test_category):
+        return ReturnFormat.PYTHON, False
+    if is_format_sensitivity(test_category):
+        return_format, has_tool_call_tag, _, _, _ = parse_prompt_variation_params(
+            test_entry_id.split(":")[1]
+        )
+        return ReturnFormat(return_format), has_tool_call_tag
+    if is_java(test_category):
+        return ReturnFormat.JAVA, False
+    if is_js(test_category):
+        return ReturnFormat.JAVASCRIPT, False
+    return ReturnFormat.PYTHON, False
@@ -0,0 +1,143 @@
+"""
+CPU benchmark of the embedding path of the vector memory backend.
+
+A memory scenario is replayed against fresh vector stores: every user message of the scenario's prerequisite conversation
+is added to the archival memory (and searched for right after, like a model checking what it already knows),
+then every question of the scenario is searched for in both the core and the archival memory.
+
+The replay is timed with the encoder called directly (the previous behaviour), through the embedding cache (cold, then warm),
+and with several threads replaying the scenario at once (e.g. several models being inferred), directly and through the batching front end.
+
+Usage: python benchmark_memory_embedding.py --scenario customer --threads 8
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import MEMORY_PREREQ_CONVERSATION_PATH, PROMPT_PATH
+from bfcl_eval.eval_checker.multi_turn_eval.embedding_cache import (
+    BatchingEncoder,
+    EmbeddingCache,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code import memory_vector
+from bfcl_eval.utils import load_file
+from tabulate import tabulate
+
+
+class _DirectEncoder:
+    """The encoder called once per text, without any cache."""
+
+    def __init__(self) -> None:
+        self.encode_calls = 0
+        self.encoded_texts = 0
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.encode_calls += 1
+        self.encoded_texts += len(texts)
+        vectors = memory_vector.get_encoder().encode(texts, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def build_workload(scenario: str) -> tuple[list[str], list[str]]:
+    """The texts added to the memory and the questions asked, in the order of the scenario."""
+    conversation = load_file(MEMORY_PREREQ_CONVERSATION_PATH / f"memory_{scenario}.json")
+    added_texts = [
+        message["content"][: memory_vector.MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH]
+        for entry in conversation
+        for turn in entry["question"]
+        for message in turn
+        if message["role"] == "user"
+    ]
+    questions = [
+        message["content"]
+        for entry in load_file(PROMPT_PATH / f"{VERSION_PREFIX}_memory.json")
+        if entry["scenario"] == scenario
+        for turn in entry["question"]
+        for message in turn
+        if message["role"] == "user"
+    ]
+    return added_texts, questions
+
+
+def replay(added_texts: list[str], questions: list[str]) -> None:
+    memory = memory_vector.MemoryAPI_vector()
+    for text in added_texts:
+        result = memory.archival_memory_add(text)
+        if "error" in result:
+            # The archival memory is full; make room by dropping the oldest entry
+            memory.archival_memory_remove(min(memory.archival_memory._store))
+            memory.archival_memory_add(text)
+        memory.archival_memory_retrieve(text.split(".")[0], top_k=3)
+    for question in questions:
+        memory.core_memory_retrieve(question)
+        memory.archival_memory_retrieve(question)
+
+
+def run(embedder, added_texts: list[str], questions: list[str], threads: int) -> float:
+    memory_vector._embedder = embedder
+    start = time.perf_counter()
+    if threads == 1:
+        replay(added_texts, questions)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [
+                executor.submit(replay, added_texts, questions) for _ in range(threads)
+            ]:
+                future.result()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--scenario", default="customer")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    added_texts, questions = build_workload(args.scenario)
+    print(
+        f"Scenario {args.scenario}: {len(added_texts)} memory writes, {len(added_texts) + 2 * len(questions)} searches per replay"
+    )
+    # Load the encoder weights before timing anything
+    memory_vector.get_encoder().encode(["warm up"])
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = EmbeddingCache(Path(tmp_dir) / "embeddings.sqlite")
+
+        def batching(cache):
+            return BatchingEncoder(
+                lambda texts: memory_vector.get_encoder().encode(texts, normalize_embeddings=True),
+                memory_vector.ENCODER_FINGERPRINT,
+                cache=cache,
+            )
+
+        runs = [
+            ("direct, 1 thread", _DirectEncoder(), 1),
+            ("cached (cold), 1 thread", batching(cache), 1),
+            ("cached (warm disk), 1 thread", batching(cache), 1),
+            (f"direct, {args.threads} threads", _DirectEncoder(), args.threads),
+            (f"batched, no disk cache, {args.threads} threads", batching(None), args.threads),
+        ]
+        for name, embedder, threads in runs:
+            seconds = run(embedder, added_texts, questions, threads)
+            rows.append(
+                [name, f"{seconds:.2f}", embedder.encode_calls, embedder.encoded_texts]
+            )
+        cache.close()
+
+    print(
+        tabulate(
+            rows,
+            headers=["Run", "Seconds", "Encoder calls", "Texts encoded"],
+            tablefmt="github",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Differential check of the incremental BM25+ index used by the key-value memory backend against `rank_bm25`.
+
+Random sequences of key additions, removals and clears are applied to an incrementally maintained `BM25PlusIndex`
+(round-tripped through its snapshot export along the way), and after every step the scores and rankings of random queries
+are compared, bit for bit, with those of a `rank_bm25.BM25Plus` built from scratch over the same keys, which is how the keys used to be searched.
+
+Usage: python check_bm25_index.py [--sequences 500] [--seed 0]
+Exits with a non-zero status on the first mismatch.
+"""
+
+import argparse
+import json
+import random
+import sys
+
+import numpy as np
+from bfcl_eval.eval_checker.multi_turn_eval.bm25_index import BM25PlusIndex
+from rank_bm25 import BM25Plus
+
+# A small vocabulary, so that keys share terms and scores tie often
+_VOCABULARY = [
+    "user", "name", "preferred", "flight", "hotel", "booking", "date", "city", "order", "status",
+    "payment", "card", "address", "phone", "email", "allergy", "diet", "meeting", "time", "2024",
+]
+
+
+def _random_key(rng: random.Random) -> str:
+    return "_".join(rng.choice(_VOCABULARY) for _ in range(rng.randint(1, 4)))
+
+
+def _random_query(rng: random.Random) -> str:
+    words = [rng.choice(_VOCABULARY + ["unknown", "USER", "Flight_Date"]) for _ in range(rng.randint(0, 5))]
+    return rng.choice([" ", "_"]).join(words)
+
+
+def _reference_search(keys: list[str], query: str, k: int):
+    """The search as it was done before the incremental index: a fresh BM25Plus over the keys."""
+    bm25 = BM25Plus([key.replace("_", " ").lower().split() for key in keys])
+    scores = bm25.get_scores(query.replace("_", " ").lower().split())
+    return scores, sorted(zip(scores, keys), key=lambda x: x[0], reverse=True)[:k]
+
+
+def check_sequence(rng: random.Random, steps: int) -> None:
+    keys: list[str] = []
+    index = BM25PlusIndex()
+    for _ in range(steps):
+        operation = rng.random()
+        if operation < 0.6 or not keys:
+            key = _random_key(rng)
+            if key not in keys:
+                keys.append(key)
+                index.add(key)
+        elif operation < 0.9:
+            key = rng.choice(keys)
+            keys.remove(key)
+            index.remove(key)
+        elif operation < 0.95:
+            keys.clear()
+            index.clear()
+        else:
+            # Restore from a snapshot, like the next entry of a memory scenario does
+            index = BM25PlusIndex.from_export(json.loads(json.dumps(index.export())))
+
+        assert index.documents == keys
+        if not keys:
+            continue
+        for _ in range(3):
+            query = _random_query(rng)
+            k = rng.randint(1, 8)
+            expected_scores, expected_results = _reference_search(keys, query, k)
+            scores = index.get_scores(query)
+            results = index.search(query, k)
+            assert np.array_equal(scores, expected_scores), (keys, query, scores, expected_scores)
+            assert results == expected_results and repr(results) == repr(expected_results), (
+                keys,
+                query,
+                results,
+                expected_results,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sequences", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for i in range(args.sequences):
+        try:
+            check_sequence(rng, args.steps)
+        except AssertionError as e:
+            print(f"❌ Mismatch in sequence {i}: {e}")
+            sys.exit(1)
+
+    # An empty corpus fails the same way in both
+    for search in (lambda: BM25Plus([]), lambda: BM25PlusIndex().get_scores("user")):
+        try:
+            search()
+        except ZeroDivisionError:
+            pass
+        else:
+            print("❌ Searching an empty index did not raise ZeroDivisionError")
+            sys.exit(1)
+
+    print(f"✅ {args.sequences} sequences of {args.steps} steps match rank_bm25.")
+
+
+if __name__ == "__main__":
+    main()
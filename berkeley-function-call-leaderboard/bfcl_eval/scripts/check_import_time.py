@@ -0,0 +1,154 @@
+"""
+Import-time regression check for the `bfcl_eval` entry points.
+
+Each entry point is started in a fresh interpreter, a few times, and the fastest wall-clock time is compared to its budget.
+The entry point must also not import any of the heavy modules (PyTorch, SentenceTransformers, FAISS, ...),
+which are only needed once a backend that uses them is actually run.
+On failure, the slowest imports reported by `python -X importtime` are listed, to point at the culprit.
+
+Usage: python check_import_time.py [--repeat 3] [--budget-scale 1.0]
+Exits with a non-zero status if any entry point is over budget or imports a heavy module.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from tabulate import tabulate
+
+# (name, code run by the interpreter, budget in seconds)
+ENTRY_POINTS = [
+    (
+        "bfcl --help",
+        "import sys; sys.argv = ['bfcl', '--help']; from bfcl_eval.__main__ import cli; cli()",
+        1.0,
+    ),
+    (
+        "bfcl models",
+        "import sys; sys.argv = ['bfcl', 'models']; from bfcl_eval.__main__ import cli; cli()",
+        1.0,
+    ),
+    ("import bfcl_eval.utils", "import bfcl_eval.utils", 0.5),
+    ("import bfcl_eval.constants.model_config", "import bfcl_eval.constants.model_config", 0.5),
+    ("import bfcl_eval._llm_response_generation", "import bfcl_eval._llm_response_generation", 0.75),
+    ("import bfcl_eval.eval_checker.eval_runner", "import bfcl_eval.eval_checker.eval_runner", 0.75),
+    (
+        "import memory_vector",
+        "import bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_vector",
+        0.75,
+    ),
+]
+
+# Modules that must only be loaded on first use
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "faiss",
+    "transformers",
+    "openai",
+    "pandas",
+]
+
+_TOP_OFFENDERS = 15
+
+
+def _run(code: str) -> tuple[float, subprocess.CompletedProcess]:
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return time.perf_counter() - start, process
+
+
+def _heavy_modules_imported(code: str) -> list[str]:
+    _, process = _run(
+        code.replace("; cli()", "")
+        + f"\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr)
+    output = process.stdout.strip().splitlines()
+    return [m for m in output[-1].split(",") if m] if output else []
+
+
+def _top_offenders(code: str) -> list[tuple[int, str]]:
+    """The imports with the highest cumulative time (in microseconds), as reported by `-X importtime`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    offenders = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        offenders.append((int(cumulative), module.rstrip()))
+    offenders.sort(reverse=True)
+    return offenders[:_TOP_OFFENDERS]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget, e.g. on a slow machine",
+    )
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache, so that the first timed run is not penalized
+    _run("import bfcl_eval.__main__, bfcl_eval._llm_response_generation, bfcl_eval.eval_checker.eval_runner")
+
+    rows = []
+    failures = []
+    for name, code, budget in ENTRY_POINTS:
+        budget *= args.budget_scale
+        timings = []
+        for _ in range(args.repeat):
+            seconds, process = _run(code)
+            if process.returncode != 0:
+                print(f"❌ {name} failed:\n{process.stderr}")
+                sys.exit(1)
+            timings.append(seconds)
+        seconds = min(timings)
+        heavy_modules = _heavy_modules_imported(code)
+
+        problems = []
+        if seconds > budget:
+            problems.append(f"over budget ({seconds:.2f}s > {budget:.2f}s)")
+        if heavy_modules:
+            problems.append(f"imports {', '.join(heavy_modules)}")
+        if problems:
+            failures.append((name, code, problems))
+        rows.append(
+            [name, f"{seconds:.2f}", f"{budget:.2f}", ", ".join(heavy_modules) or "-", "❌" if problems else "✅"]
+        )
+
+    print(
+        tabulate(
+            rows,
+            headers=["Entry point", "Seconds", "Budget", "Heavy modules", "OK"],
+            tablefmt="github",
+        )
+    )
+
+    for name, code, problems in failures:
+        print(f"\n❌ {name}: {'; '.join(problems)}. Slowest imports (cumulative):")
+        for cumulative, module in _top_offenders(code):
+            print(f"  {cumulative / 1e6:8.3f}s  {module}")
+
+    if failures:
+        sys.exit(1)
+    print("\n✅ All entry points are within their import-time budget.")
+
+
+if __name__ == "__main__":
+    main()
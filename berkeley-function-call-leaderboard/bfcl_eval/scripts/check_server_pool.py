@@ -0,0 +1,221 @@
+"""
+Check the routing, health checks and failover of the local inference server replicas (`--num-replicas`) against fake servers.
+
+Each replica is a lightweight fake OpenAI-compatible server (`/v1/models` and `/v1/completions`) running in this process,
+with a configurable latency and health status, so no GPU or model is needed. Requests go through `ServerPool.lease`
+and the replica clients exactly like `OSSHandler._query_prompting` sends them, and the script checks that:
+- requests are spread evenly over identical replicas, and a slow replica receives fewer of them (least outstanding requests);
+- a replica failing its health check is taken out of the rotation, and put back once it passes again;
+- a replica whose server went away is marked unhealthy by the first failed request, and the others take over;
+- with no healthy replica left, requests are still spread over all of them.
+
+Usage: python check_server_pool.py [--requests 60] [--threads 12]
+Exits with a non-zero status on the first failed check.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bfcl_eval.model_handler.local_inference.server_pool import ServerPool
+from openai import APIConnectionError
+
+_HEALTH_CHECK_INTERVAL = 0.2
+
+
+class _FakeServer:
+    """A fake OpenAI-compatible completions server on a free local port."""
+
+    def __init__(self, latency: float = 0.02) -> None:
+        self.latency = latency
+        self.healthy = True
+        self.completions = 0
+        self._lock = threading.Lock()
+        fake_server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path != "/v1/models":
+                    self._reply(404, {})
+                elif not fake_server.healthy:
+                    self._reply(503, {"error": "unavailable"})
+                else:
+                    self._reply(200, {"object": "list", "data": [{"id": "fake", "object": "model"}]})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with fake_server._lock:
+                    fake_server.completions += 1
+                time.sleep(fake_server.latency)
+                self._reply(
+                    200,
+                    {
+                        "id": "fake",
+                        "object": "text_completion",
+                        "created": 0,
+                        "model": "fake",
+                        "choices": [
+                            {"index": 0, "text": "[]", "finish_reason": "stop", "logprobs": None}
+                        ],
+                        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                    },
+                )
+
+            def _reply(self, status: int, body: dict):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _send(pool: ServerPool) -> None:
+    """One completion request, routed and failed over like in `OSSHandler._query_prompting`."""
+    with pool.lease() as replica:
+        try:
+            replica.client.completions.create(model="fake", prompt="hello", max_tokens=1)
+        except APIConnectionError:
+            pool.mark_unhealthy(replica)
+            raise
+
+
+def _send_many(pool: ServerPool, count: int, threads: int) -> int:
+    """Send `count` requests from `threads` threads; returns the number of failed ones."""
+
+    def _send_one(_):
+        try:
+            _send(pool)
+            return 0
+        except APIConnectionError:
+            return 1
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return sum(executor.map(_send_one, range(count)))
+
+
+def _make_pool(servers: list[_FakeServer]) -> ServerPool:
+    pool = ServerPool([server.base_url for server in servers])
+    for replica in pool.replicas:
+        # Fail fast on a server that went away, instead of the client's own retries
+        replica.client = replica.client.with_options(max_retries=0)
+    pool.wait_until_ready(poll_interval=0.1)
+    return pool
+
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(_HEALTH_CHECK_INTERVAL / 4)
+    return condition()
+
+
+def _reset(servers: list[_FakeServer]) -> None:
+    for server in servers:
+        server.completions = 0
+
+
+def check_routing(requests: int, threads: int) -> None:
+    servers = [_FakeServer() for _ in range(3)]
+    pool = _make_pool(servers)
+    try:
+        assert _send_many(pool, requests, threads) == 0
+        counts = [server.completions for server in servers]
+        assert sum(counts) == requests, counts
+        assert max(counts) - min(counts) <= max(2, requests // 10), f"Uneven routing: {counts}"
+        assert [entry["total_requests"] for entry in pool.summary()] == counts, pool.summary()
+
+        _reset(servers)
+        servers[0].latency = 0.3
+        assert _send_many(pool, requests, threads) == 0
+        counts = [server.completions for server in servers]
+        assert counts[0] < min(counts[1:]), f"The slow replica was not avoided: {counts}"
+    finally:
+        for server in servers:
+            server.stop()
+
+
+def check_health_checks(requests: int, threads: int) -> None:
+    servers = [_FakeServer() for _ in range(3)]
+    pool = _make_pool(servers)
+    pool.start_health_checks(interval=_HEALTH_CHECK_INTERVAL)
+    try:
+        servers[1].healthy = False
+        assert _wait_for(lambda: not pool.replicas[1].healthy), "The failing replica stayed in rotation"
+        _reset(servers)
+        assert _send_many(pool, requests, threads) == 0
+        counts = [server.completions for server in servers]
+        assert counts[1] == 0 and sum(counts) == requests, f"Requests reached the unhealthy replica: {counts}"
+
+        servers[1].healthy = True
+        assert _wait_for(lambda: pool.replicas[1].healthy), "The recovered replica was not put back"
+        _reset(servers)
+        assert _send_many(pool, requests, threads) == 0
+        assert servers[1].completions > 0, "The recovered replica receives no requests"
+    finally:
+        pool.stop_health_checks()
+        for server in servers:
+            server.stop()
+
+
+def check_failover(requests: int, threads: int) -> None:
+    servers = [_FakeServer() for _ in range(3)]
+    pool = _make_pool(servers)
+    pool.start_health_checks(interval=_HEALTH_CHECK_INTERVAL)
+    try:
+        servers[2].stop()
+        # Until the health check notices, requests routed to the dead replica fail and take it out of the rotation
+        failed = _send_many(pool, requests, threads)
+        assert failed <= threads, f"{failed} requests failed after the first failure"
+        assert not pool.replicas[2].healthy, "The dead replica is still in rotation"
+        _reset(servers)
+        assert _send_many(pool, requests, threads) == 0
+        assert sum(server.completions for server in servers[:2]) == requests
+
+        # Nothing healthy left: requests are spread over every replica and fail on their own
+        for replica in pool.replicas:
+            pool.mark_unhealthy(replica)
+        with pool.lease() as first, pool.lease() as second:
+            assert first is not second
+    finally:
+        pool.stop_health_checks()
+        for server in servers[:2]:
+            server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--threads", type=int, default=12)
+    args = parser.parse_args()
+
+    for check in (check_routing, check_health_checks, check_failover):
+        try:
+            check(args.requests, args.threads)
+        except AssertionError as e:
+            print(f"❌ {check.__name__}: {e}")
+            sys.exit(1)
+        print(f"✅ {check.__name__}")
+
+    print("✅ Server replicas route, health-check and fail over as expected.")
+
+
+if __name__ == "__main__":
+    main()
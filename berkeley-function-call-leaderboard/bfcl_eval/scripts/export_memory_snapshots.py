@@ -0,0 +1,40 @@
+"""
+Export memory snapshots to JSON.
+
+The memory backends save their snapshots in a compact, delta-encoded format (`.snap` files, see `memory_snapshot_store.py`).
+This script writes each of them, fully resolved, in the original JSON format next to it (same name, `.json` extension).
+
+Usage: python export_memory_snapshots.py <result directory, memory snapshot directory or .snap file> ...
+"""
+
+import argparse
+from pathlib import Path
+
+from bfcl_eval.eval_checker.multi_turn_eval.memory_snapshot_store import (
+    SNAPSHOT_FILE_SUFFIX,
+    export_snapshot_to_json,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("paths", nargs="+", type=Path)
+    args = parser.parse_args()
+
+    count = 0
+    for path in args.paths:
+        snapshot_paths = (
+            [path] if path.is_file() else sorted(path.rglob(f"*{SNAPSHOT_FILE_SUFFIX}"))
+        )
+        for snapshot_path in snapshot_paths:
+            if snapshot_path.name.startswith("."):
+                # Temporary file of a snapshot being written
+                continue
+            json_path = export_snapshot_to_json(snapshot_path)
+            print(f"📄 {json_path}")
+            count += 1
+    print(f"✅ Exported {count} memory snapshot(s) to JSON.")
+
+
+if __name__ == "__main__":
+    main()
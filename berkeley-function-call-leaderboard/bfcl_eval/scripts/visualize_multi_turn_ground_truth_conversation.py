@@ -7,6 +7,7 @@ from bfcl_eval.utils import load_file, write_list_of_dicts_to_file
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     STATELESS_CLASSES,
     execute_multi_turn_func_call,
+    release_execution_instances,
 )
 
 test_filename_total, _ = parse_test_category_argument(["multi_turn"])
@@ -127,4 +128,6 @@ for file_path in test_filename_total:
                 )
             all_inference_log.append(state_log)
 
+        release_execution_instances("ground_truth_conversation", test_entry_id)
+
     write_list_of_dicts_to_file(file_path, result, UTILS_PATH / "ground_truth_conversation")
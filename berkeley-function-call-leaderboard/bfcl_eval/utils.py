@@ -1,10 +1,15 @@
 import json
+import math
+import mmap
 import os
 import re
+import tempfile
 from copy import deepcopy
+from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Optional, Union
 
+from bfcl_eval._dataset_cache import get_dataset_cache
 from bfcl_eval.constants.category_mapping import *
 from bfcl_eval.constants.default_prompts import (
     ADDITIONAL_SYSTEM_PROMPT_FOR_AGENTIC_RESPONSE_FORMAT,
@@ -15,6 +20,11 @@ from bfcl_eval.constants.executable_backend_config import (
     MULTI_TURN_FUNC_DOC_FILE_MAPPING,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 #### Helper functions to extract/parse/complete test category from different formats ####
 
 
@@ -327,56 +337,100 @@ def get_directory_structure_by_category(test_category: str) -> str:
 #### Helper functions to load/write the dataset files ####
 
 
-def load_file(file_path, sort_by_id=False, allow_concatenated_json=False):
-    result = []
-    with open(file_path) as f:
-        file = f.readlines()
-        for line in file:
-            try:
-                content = json.loads(line)
-                result.append(content)
-            except Exception as e:
-                if not allow_concatenated_json:
-                    raise e
-
-                # Although this really shouldn't happen, sometimes a result file might have more than one JSON objects concatenated on a single line instead of one per line (e.g. '{"id": 1, xxx}{"id": 2, xxx}').
-                # We can parse them incrementally by using `json.JSONDecoder.raw_decode`, which returns both the parsed object and the index where it stopped parsing.
-                line_jsons = []
-                decoder = json.JSONDecoder()
-                idx = 0
-                while idx < len(line):
-                    # Skip whitespace between objects (if any)
-                    while idx < len(line) and line[idx].isspace():
-                        idx += 1
-
-                    if idx >= len(line):
-                        break
-
-                    try:
-                        json_obj, idx = decoder.raw_decode(line, idx)
-                        line_jsons.append(json_obj)
-                    except json.JSONDecodeError:
-                        # If decoding fails at any point, the entire line is invalid.
-                        raise e
-
-                # After parsing, we must ensure the entire line has been consumed.
-                # If `idx` is not at the end of the line, it means there's trailing
-                # garbage, which is an error.
-                if idx < len(line):
-                    raise e
-
-                if not line_jsons:
-                    # If the line was non-empty but contained no JSON objects (e.g., only whitespace),
-                    # it's an error.
-                    raise e
-
-                result.extend(line_jsons)
-
+def load_file(file_path, sort_by_id=False, allow_concatenated_json=False, fields=None):
+    """
+    Load all the JSON objects of a JSON Lines file. See `iter_file` for `allow_concatenated_json` and `fields`.
+    """
+    result = list(
+        iter_file(
+            file_path, allow_concatenated_json=allow_concatenated_json, fields=fields
+        )
+    )
     if sort_by_id:
         result.sort(key=sort_key)
     return result
 
 
+def iter_file(file_path, allow_concatenated_json=False, fields=None) -> Iterator[dict]:
+    """
+    Yield the JSON objects of a JSON Lines file one at a time, so that memory stays bounded by the largest line instead of the file size.
+
+    The file is memory-mapped and scanned line by line. Lines are parsed with `orjson` when it is installed
+    (falling back to the standard `json` module for what `orjson` rejects, e.g. `NaN`), and with `json` otherwise.
+    If `fields` is given, only those keys are kept in each object (e.g. `("id", "result")` to drop the large `inference_log`).
+    """
+    for line in _iter_lines(file_path):
+        try:
+            contents = [_loads_json_line(line)]
+        except Exception as e:
+            if not allow_concatenated_json:
+                raise e
+            contents = load_concatenated_json_line(line.decode("utf-8"), e)
+
+        for content in contents:
+            if fields is not None:
+                content = {key: content[key] for key in fields if key in content}
+            yield content
+
+
+def _iter_lines(file_path) -> Iterator[bytes]:
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory-mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(b"\n", start)
+                end = size if end == -1 else end + 1
+                yield mm[start:end]
+                start = end
+
+
+def _loads_json_line(line: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # E.g. `NaN`/`Infinity`, which `json.dumps` writes by default; let `json` decide
+            pass
+    return json.loads(line)
+
+
+def load_concatenated_json_line(line: str, error: Optional[Exception] = None) -> list[dict]:
+    """
+    Although this really shouldn't happen, sometimes a result file might have more than one JSON objects concatenated on a single line instead of one per line (e.g. '{"id": 1, xxx}{"id": 2, xxx}').
+    We can parse them incrementally by using `json.JSONDecoder.raw_decode`, which returns both the parsed object and the index where it stopped parsing.
+    If the line is not a valid sequence of objects either, `error` (e.g. the error from parsing the line as a single object) is raised,
+    or a `json.JSONDecodeError` when it is not given.
+    """
+    line_jsons = []
+    decoder = json.JSONDecoder()
+    idx = 0
+    while idx < len(line):
+        # Skip whitespace between objects (if any)
+        while idx < len(line) and line[idx].isspace():
+            idx += 1
+
+        if idx >= len(line):
+            break
+
+        try:
+            json_obj, idx = decoder.raw_decode(line, idx)
+            line_jsons.append(json_obj)
+        except json.JSONDecodeError as e:
+            # If decoding fails at any point, the entire line is invalid.
+            raise error if error is not None else e
+
+    if not line_jsons:
+        # If the line was non-empty but contained no JSON objects (e.g., only whitespace),
+        # it's an error.
+        raise error if error is not None else json.JSONDecodeError("Expecting value", line, 0)
+
+    return line_jsons
+
+
 def sort_file_content_by_id(file_path: Path) -> None:
     """
     Sort the content of a file by the id of the entries. The file is only rewritten
@@ -410,7 +464,25 @@ def load_dataset_entry(
     The input should not be a test category goup, but a specific test category.
     If `contain_prereq` is True, it will include the pre-requisite entries for the memory test categories.
     If `include_language_specific_hint` is True, it will include the language-specific hint for the function description (for Java, JavaScript, and Python).
+    The processed entries are cached on disk (see `_dataset_cache.py`); every call returns fresh copies.
     """
+    return get_dataset_cache().get_entries(
+        test_category,
+        {
+            "include_prereq": include_prereq,
+            "include_language_specific_hint": include_language_specific_hint,
+        },
+        lambda: _process_dataset_entry(
+            test_category, include_prereq, include_language_specific_hint
+        ),
+    )
+
+
+def _process_dataset_entry(
+    test_category: str,
+    include_prereq: bool,
+    include_language_specific_hint: bool,
+) -> list[dict]:
     if is_format_sensitivity(test_category):
         # Format sensitivity categories
         all_entries = load_format_sensitivity_test_cases()
@@ -443,6 +515,28 @@ def load_dataset_entry(
     return all_entries
 
 
+def get_category_entry_ids(test_category: str) -> list[str]:
+    """
+    The ids of the entries of a test category that are scored (i.e. without the memory pre-requisite entries), in dataset order.
+    They are read from the dataset catalog, so the dataset is only loaded the first time a category is looked up.
+    """
+    return _get_category_catalog_entry(test_category)["ids"]
+
+
+def get_category_entry_count(test_category: str) -> int:
+    """The number of scored entries in a test category, read from the dataset catalog."""
+    return _get_category_catalog_entry(test_category)["count"]
+
+
+def _get_category_catalog_entry(test_category: str) -> dict:
+    return get_dataset_cache().get_catalog_entry(
+        test_category,
+        lambda: load_dataset_entry(
+            test_category, include_prereq=False, include_language_specific_hint=False
+        ),
+    )
+
+
 def load_ground_truth_entry(test_category: str) -> list[dict]:
     """
     This function retrieves the ground truth entry for a given test category.
@@ -473,29 +567,82 @@ def write_list_of_dicts_to_file(filename, data, subdir=None) -> None:
         # Construct the full path to the file
         filename = os.path.join(subdir, os.path.basename(filename))
 
-    # Write the list of dictionaries to the file in JSON format
-    with open(filename, "w", encoding="utf-8") as f:
-        for i, entry in enumerate(data):
-            # Go through each key-value pair in the dictionary to make sure the values are JSON serializable
-            entry = make_json_serializable(entry)
-            json_str = json.dumps(entry, ensure_ascii=False) + "\n"
-            f.write(json_str)
+    # Write the list of dictionaries to the file in JSON Lines format
+    with open(filename, "wb") as f:
+        for entry in data:
+            f.write(serialize_to_json(entry) + b"\n")
 
 
-def make_json_serializable(value):
-    if isinstance(value, dict):
-        # If the value is a dictionary, we need to go through each key-value pair recursively
-        return {k: make_json_serializable(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        # If the value is a list, we need to process each element recursively
-        return [make_json_serializable(item) for item in value]
-    else:
-        # Try to serialize the value directly, and if it fails, convert it to a string
+def atomic_write_bytes(file_path: Union[str, Path], content: bytes) -> None:
+    """
+    Replace a file with `content` in one step: the content goes to a temporary file in the same directory, which is then renamed over it.
+    Readers (other threads, processes or runs) see either the old or the new file, never a partial one, even if the writer is interrupted.
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def serialize_to_json(value) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON in a single pass. Values that JSON cannot represent are converted to strings.
+
+    Uses `orjson` when it is installed, and the standard `json` module (with the same compact separators) otherwise,
+    so the output does not depend on whether `orjson` is installed. The one exception is floats in exponent notation,
+    written `1e16` by `orjson` and `1e+16` by `json`; both read back as the same value.
+    Values `orjson` refuses (e.g. integers above 64 bits, lone surrogates) go through the standard `json` module,
+    and so do values holding NaN or infinities, which `orjson` would write as `null` instead of `NaN`/`Infinity`.
+    """
+    if orjson is not None:
         try:
-            json.dumps(value, ensure_ascii=False)
-            return value
-        except (TypeError, ValueError):
-            return str(value)
+            serialized = orjson.dumps(
+                value,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+            # Only values written with a `null` can hold a non-finite float
+            if b"null" not in serialized or not _has_non_finite_float(value):
+                return serialized
+        except orjson.JSONEncodeError:
+            pass
+    try:
+        return _JSON_ENCODER.encode(value).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be encoded in UTF-8, but can be escaped
+        return _ASCII_JSON_ENCODER.encode(value).encode("ascii")
+
+
+def _json_default(value):
+    # `orjson` hands over subclasses of float (e.g. `numpy.float64`), which the standard `json` module writes as numbers
+    if isinstance(value, float):
+        return float(value)
+    # `orjson` writes enums as their value
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _has_non_finite_float(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_json_default)
+_ASCII_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_json_default)
 
 
 def sort_key(entry):